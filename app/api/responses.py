@@ -0,0 +1,18 @@
+# app/api/responses.py
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response encoded with orjson
+
+    For content that is already plain data: it is encoded as is, without
+    going through Pydantic. orjson writes datetimes in ISO 8601 and enums as
+    their value, like the response models do.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -1,14 +1,30 @@
 # app/api/routes.py
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
-from src.database.base import get_db
-from src.database.repository import TenderRepository, KeywordRepository, KeywordType
-from .schemas import TenderResponse, KeywordResponse, KeywordCreate, ExecuteRequest
-from src.api.public_market_api import PublicMarketAPI
-from fastapi import BackgroundTasks
+from src.database.async_base import get_async_db
+from src.database.async_repository import (
+    AsyncJobRepository, AsyncTenderRepository, AsyncKeywordRepository
+)
+from src.database.base import SessionLocal, get_write_db
+from src.database.versions import KEYWORDS, TENDERS, get_data_version
+from src.database.repository import (
+    EXPORT_COLUMNS, SORTABLE_COLUMNS, JobRepository, TenderRepository, KeywordRepository,
+    KeywordType
+)
+from src.pipeline.sync import normalize_status
+from .responses import ORJSONResponse
+from .schemas import (
+    TenderResponse, TenderDetailResponse, TenderPage, TenderTableResponse, TenderStatResponse,
+    KeywordResponse, KeywordCreate, ExecuteRequest, JobResponse, tender_list_item
+)
+from src.utils.cursor import decode_cursor, encode_cursor
+from src.utils.export import EXPORT_FORMATS, iter_export
+from src.utils.http_cache import build_validators, is_not_modified
 
 # Import logger from src.utils 
 from src.utils.logger import setup_logger
@@ -17,55 +33,244 @@ logger = setup_logger(__name__)
 
 router = APIRouter()
 
-@router.get("/tenders", response_model=List[TenderResponse])
+async def get_validators(db: AsyncSession, name: str) -> Dict[str, str]:
+    """Caching headers of the responses built from a data set, from its version"""
+    version, updated_at = await get_data_version(db, name)
+    return build_validators(name, version, updated_at)
+
+@router.get("/tenders", response_model=TenderPage)
 async def get_tenders(
-    skip: int = Query(0, ge=0),
+    request: Request,
     limit: int = Query(100, ge=1, le=100),
+    cursor: Optional[str] = None,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get a page of tenders with optional filtering, newest first
+
+    Pass the next_cursor of a page as cursor to get the following page.
+    Answers 304 without querying tenders when the client copy is current.
+    The page is built from plain rows and encoded by orjson; response_model
+    only documents it.
+    """
+    try:
+        position = decode_cursor(cursor) if cursor else None
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    try:
+        validators = await get_validators(db, TENDERS)
+        if is_not_modified(request.headers, validators):
+            return Response(status_code=304, headers=validators)
+
+        repo = AsyncTenderRepository(db)
+        rows, next_position = await repo.get_listing_rows(
+            limit=limit,
+            cursor=position,
+            search=search,
+            status=status,
+            start_date=start_date,
+            end_date=end_date
+        )
+
+        return ORJSONResponse(
+            {
+                "items": [tender_list_item(row) for row in rows],
+                "next_cursor": encode_cursor(*next_position) if next_position else None,
+            },
+            headers=validators
+        )
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/tenders/export")
+def export_tenders(
+    export_format: str = Query("csv", alias="format"),
     search: Optional[str] = None,
     status: Optional[str] = None,
     start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None
+):
+    """
+    Stream the filtered tenders as csv, ndjson or parquet, newest first
+
+    Rows are read in batches through a server-side cursor and sent as each
+    batch is encoded, so memory stays flat whatever the size of the export.
+    A plain def: the query and the encoding run in the threadpool.
+    """
+    db = SessionLocal()
+    try:
+        batches = TenderRepository(db).iter_export_batches(
+            search=search, status=status, start_date=start_date, end_date=end_date
+        )
+        chunks = iter_export(export_format, EXPORT_COLUMNS, batches)
+    except ValueError as e:
+        db.close()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    def stream():
+        # The session lives as long as the response body
+        try:
+            yield from chunks
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=EXPORT_FORMATS[export_format],
+        headers={"Content-Disposition": f'attachment; filename="tenders.{export_format}"'}
+    )
+
+@router.get("/tenders/datatable", response_model=TenderTableResponse, response_model_exclude_none=True)
+async def get_tenders_table(
+    request: Request,
+    draw: int = 0,
+    start: int = Query(0, ge=0),
+    length: int = 10,
+    search_value: str = Query("", alias="search[value]"),
+    order_column: Optional[int] = Query(None, alias="order[0][column]"),
+    order_dir: str = Query("desc", alias="order[0][dir]"),
+    status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
     end_date: Optional[datetime] = None,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Serve the tenders table through the DataTables server-side protocol
+
+    Filtering, sorting, counting and paging run in the database. The
+    unfiltered total is read from the stats rollup instead of counted, so
+    draws without filters never scan the table. Sorting accepts the indexed
+    columns only: code and closing_date; any other order falls back to the
+    newest tenders first.
+    """
+    # "All" (-1) and oversized pages are capped like the listing
+    length = 100 if length < 0 else min(max(length, 1), 100)
+    order_by = "created_at"
+    if order_column is not None:
+        order_by = request.query_params.get(f"columns[{order_column}][data]", order_by)
+    if order_by not in SORTABLE_COLUMNS:
+        order_by = "created_at"
+
+    filters = {
+        "search": search_value.strip() or None,
+        "status": status,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    try:
+        repo = AsyncTenderRepository(db)
+        # The total comes from the stats rollup; only filtered draws count rows
+        total = await repo.get_total_tenders()
+        filtered = total
+        if any(value is not None for value in filters.values()):
+            filtered = await repo.count_tenders(**filters)
+        tenders = await repo.get_tenders_slice(
+            offset=start,
+            limit=length,
+            order_by=order_by,
+            descending=order_dir.lower() != "asc",
+            **filters
+        )
+        return TenderTableResponse(
+            draw=draw,
+            recordsTotal=total,
+            recordsFiltered=filtered,
+            data=[TenderResponse.model_validate(tender) for tender in tenders]
+        )
+
+    except Exception as e:
+        logger.error(f"Error getting tenders table: {str(e)}")
+        # The protocol reports errors in the body, shown by the table
+        return TenderTableResponse(draw=draw, error=str(e))
+
+# Declared after every other /tenders/... route, so that it does not capture them
+@router.get("/tenders/{code}", response_model=TenderDetailResponse)
+async def get_tender(
+    code: str,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get the full detail of a tender, including the heavy columns left out of lists"""
+    try:
+        validators = await get_validators(db, TENDERS)
+        if is_not_modified(request.headers, validators):
+            return Response(status_code=304, headers=validators)
+        response.headers.update(validators)
+
+        repo = AsyncTenderRepository(db)
+        tender = await repo.get_tender_by_code(code)
+        if not tender:
+            raise HTTPException(status_code=404, detail="Tender not found")
+        return TenderDetailResponse.model_validate(tender)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@router.get("/stats/{dimension}", response_model=List[TenderStatResponse])
+async def get_stats(
+    dimension: str,
+    request: Request,
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
-    Get tenders with optional filtering
+    Get the tender count and estimated amount per organization, region,
+    tender_type, month or status
+
+    Served from rollups refreshed on every write, not from the tenders table.
     """
     try:
-        repo = TenderRepository(db)
-        if any([search, status, start_date, end_date]):
-            tenders = repo.get_tenders_with_filters(
-                skip=skip,
-                limit=limit,
-                search=search,
-                status=status,
-                start_date=start_date,
-                end_date=end_date
-            )
-        else:
-            tenders = repo.get_all_tenders()
-            
-        # Convertir los objetos SQLAlchemy a diccionarios y luego a modelos Pydantic
-        return [TenderResponse.model_validate(tender) for tender in tenders]
-    
+        validators = await get_validators(db, TENDERS)
+        if is_not_modified(request.headers, validators):
+            return Response(status_code=304, headers=validators)
+        response.headers.update(validators)
+
+        repo = AsyncTenderRepository(db)
+        stats = await repo.get_stats(dimension, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+    return [TenderStatResponse.model_validate(stat) for stat in stats]
 
 @router.get("/keywords", response_model=List[KeywordResponse])
-async def get_keywords(db: Session = Depends(get_db)):
+async def get_keywords(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
+):
     """Get all keywords"""
     try:
-        repo = KeywordRepository(db)
-        keywords = repo.get_all_keywords()
+        validators = await get_validators(db, KEYWORDS)
+        if is_not_modified(request.headers, validators):
+            return Response(status_code=304, headers=validators)
+        response.headers.update(validators)
+
+        repo = AsyncKeywordRepository(db)
+        keywords = await repo.get_all_keywords()
         return [KeywordResponse.model_validate(k) for k in keywords]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/keywords", response_model=KeywordResponse)
-async def create_keyword(
+def create_keyword(
     keyword: KeywordCreate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
-    """Create a new keyword"""
+    """Create a new keyword
+
+    Writes use the sync session; as a plain def, FastAPI runs the route in
+    its threadpool instead of on the event loop.
+    """
     try:
         repo = KeywordRepository(db)
         new_keyword = repo.create_keyword(keyword.keyword, KeywordType(keyword.type))
@@ -74,9 +279,9 @@ async def create_keyword(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.delete("/keywords/{keyword_id}")
-async def delete_keyword(
+def delete_keyword(
     keyword_id: int,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """Delete a keyword"""
     try:
@@ -91,10 +296,10 @@ async def delete_keyword(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.put("/keywords/{keyword_id}", response_model=KeywordResponse)
-async def update_keyword(
+def update_keyword(
     keyword_id: int,
     keyword: KeywordCreate,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """Update a keyword"""
     try:
@@ -112,40 +317,36 @@ async def update_keyword(
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-@router.post("/execute")
-async def execute_search(
+@router.post("/execute", response_model=JobResponse, status_code=202)
+def execute_search(
     request: ExecuteRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
-    """Execute tender search with specified parameters"""
+    """
+    Queue a tender search with specified parameters
+
+    The job runner (python -m src.pipeline.jobs) picks it up; follow it at
+    /api/jobs/{job_id}.
+    """
+    try:
+        status = normalize_status(request.status)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     try:
-        # Initialize repositories
-        tender_repo = TenderRepository(db)
         keyword_repo = KeywordRepository(db)
         
-        # Get keywords
+        # Get keywords, as of now: later changes do not affect the job
         include_keywords = [k.keyword for k in keyword_repo.get_keywords_by_type(KeywordType.INCLUDE)]
         exclude_keywords = [k.keyword for k in keyword_repo.get_keywords_by_type(KeywordType.EXCLUDE)]
         
-        # Initialize API
-        api = PublicMarketAPI()
-        
-        # Add search task to background tasks
-        background_tasks.add_task(
-            process_search,
-            api,
-            include_keywords,
-            exclude_keywords,
-            request.days,
-            request.status,  # Add status parameter
-            tender_repo
-        )
-        
-        return {
-            "message": "Search started successfully",
-            "status": "processing"
-        }
+        job = JobRepository(db).create_job({
+            "days": request.days,
+            "status": status,
+            "include_keywords": include_keywords,
+            "exclude_keywords": exclude_keywords,
+        })
+        return JobResponse.model_validate(job)
         
     except Exception as e:
         raise HTTPException(
@@ -153,34 +354,28 @@ async def execute_search(
             detail=f"Error starting search: {str(e)}"
         )
 
-async def process_search(
-    api: PublicMarketAPI,
-    include_keywords: List[str],
-    exclude_keywords: List[str],
-    days: int,
-    status: str,  # Add status parameter
-    tender_repo: TenderRepository
-):
-    """Process search in background"""
+@router.get("/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Get a search job with its progress, as last reported by its worker"""
+    job = await AsyncJobRepository(db).get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JobResponse.model_validate(job)
+
+@router.post("/jobs/{job_id}/cancel", response_model=JobResponse)
+def cancel_job(job_id: int, db: Session = Depends(get_write_db)):
+    """
+    Cancel a search job
+
+    A queued job never starts. A running one stops at its next progress
+    report, keeping the tenders it already saved.
+    """
     try:
-        tenders = api.search_tenders(
-            include_keywords=include_keywords,
-            exclude_keywords=exclude_keywords,
-            days_back=days,
-            status=status  # Add status parameter
-        )
-        
-        new_count = 0
-        updated_count = 0
-        
-        for tender in tenders:
-            existing = tender_repo.get_tender_by_code(tender.code)
-            if existing:
-                tender_repo.update_tender(tender)
-                updated_count += 1
-            else:
-                tender_repo.create_tender(tender)
-                new_count += 1
-                
+        job = JobRepository(db).cancel_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return JobResponse.model_validate(job)
+    except HTTPException:
+        raise
     except Exception as e:
-        logger.error(f"Error in background search: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
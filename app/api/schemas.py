@@ -1,6 +1,6 @@
 # app/api/schemas.py
 from pydantic import BaseModel, ConfigDict, Field
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 class KeywordUpdate(BaseModel):
@@ -85,6 +85,154 @@ class TenderResponse(BaseModel):
         }
     )
 
+def tender_list_item(row) -> Dict[str, Any]:
+    """
+    Build the TenderResponse fields of a listing row as plain data
+
+    The fast path of the listing: the same JSON as TenderResponse, without
+    validating each row through Pydantic.
+
+    Args:
+        row: Row or object with the TenderResponse attributes
+
+    Returns:
+        Dict[str, Any]: Fields of the tender, ready for orjson
+    """
+    return {
+        "code": row.code,
+        "name": row.name,
+        "status": row.status,
+        "organization": row.organization,
+        "closing_date": row.closing_date,
+        "estimated_amount": float(row.estimated_amount) if row.estimated_amount is not None else None,
+        "tender_type": row.tender_type.value if row.tender_type is not None else None,
+    }
+
+class TenderDetailResponse(TenderResponse):
+    """
+    Schema for the full detail of a tender
+    
+    Attributes:
+        description: Detailed description of the tender
+        status_code: Numeric status code
+        currency: Currency of the amounts
+        organization_code: Code of the buying organization
+        buying_unit: Buying unit of the organization
+        buying_unit_region: Region of the buying unit
+        creation_date: Date the tender was created
+        publication_date: Date the tender was published
+        award_date: Date the tender was awarded
+        contract_duration: Duration of the contract
+        number_of_bidders: Number of bidders
+        items: Items of the tender as returned by the public API
+        awarded_suppliers: Awarded suppliers as returned by the public API
+        created_at: Date the tender was first stored
+        updated_at: Date the tender was last updated
+    """
+    description: Optional[str] = Field(None, description="Detailed description of the tender")
+    status_code: Optional[int] = Field(None, description="Numeric status code")
+    currency: Optional[str] = Field(None, description="Currency of the amounts")
+    organization_code: Optional[str] = Field(None, description="Code of the buying organization")
+    buying_unit: Optional[str] = Field(None, description="Buying unit of the organization")
+    buying_unit_region: Optional[str] = Field(None, description="Region of the buying unit")
+    creation_date: Optional[datetime] = Field(None, description="Date the tender was created")
+    publication_date: Optional[datetime] = Field(None, description="Date the tender was published")
+    award_date: Optional[datetime] = Field(None, description="Date the tender was awarded")
+    contract_duration: Optional[int] = Field(None, description="Duration of the contract")
+    number_of_bidders: Optional[int] = Field(None, description="Number of bidders")
+    items: Optional[Any] = Field(None, description="Items of the tender as returned by the public API")
+    awarded_suppliers: Optional[Any] = Field(
+        None, description="Awarded suppliers as returned by the public API"
+    )
+    created_at: datetime = Field(..., description="Date the tender was first stored")
+    updated_at: datetime = Field(..., description="Date the tender was last updated")
+
+class TenderPage(BaseModel):
+    """
+    Schema for a page of tenders
+    
+    Attributes:
+        items: Tenders of the page
+        next_cursor: Cursor of the next page, null on the last page
+    """
+    items: List[TenderResponse] = Field(..., description="Tenders of the page")
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor of the next page, null on the last page"
+    )
+
+
+class TenderTableResponse(BaseModel):
+    """
+    Schema for a page of the tenders table in the DataTables server-side protocol
+    
+    Attributes:
+        draw: Draw counter sent by the table, echoed back
+        recordsTotal: Number of tenders before filtering
+        recordsFiltered: Number of tenders after filtering
+        data: Tenders of the page
+        error: Error message shown by the table, if any
+    """
+    draw: int = Field(..., description="Draw counter sent by the table, echoed back")
+    recordsTotal: int = Field(0, description="Number of tenders before filtering")
+    recordsFiltered: int = Field(0, description="Number of tenders after filtering")
+    data: List[TenderResponse] = Field(default=[], description="Tenders of the page")
+    error: Optional[str] = Field(None, description="Error message shown by the table, if any")
+
+
+class TenderStatResponse(BaseModel):
+    """
+    Schema for the stats of one key of a dimension
+    
+    Attributes:
+        key: Value of the dimension
+        tender_count: Number of tenders with this value
+        estimated_amount: Sum of the estimated amounts of those tenders
+    """
+    key: str = Field(..., description="Value of the dimension")
+    tender_count: int = Field(..., description="Number of tenders with this value")
+    estimated_amount: int = Field(..., description="Sum of the estimated amounts of those tenders")
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
+
+
+class JobResponse(BaseModel):
+    """
+    Schema for a search job and its progress
+    
+    Attributes:
+        id: Unique identifier for the job
+        status: queued, running, completed, failed or cancelled
+        params: Parameters of the search
+        days_total: Days the search has to fetch, once started
+        days_done: Days fetched so far
+        tenders_matched: Tenders matching the keywords found so far
+        eta_seconds: Estimated seconds left while running
+        counts: New, updated, unchanged and failed tenders, once finished
+        error: Error that made the job fail
+        cancel_requested: Whether the job was asked to stop
+    """
+    id: int = Field(..., description="Unique identifier for the job")
+    status: str = Field(..., description="queued, running, completed, failed or cancelled")
+    params: Dict[str, Any] = Field(..., description="Parameters of the search")
+    days_total: Optional[int] = Field(None, description="Days the search has to fetch, once started")
+    days_done: int = Field(..., description="Days fetched so far")
+    tenders_matched: int = Field(..., description="Tenders matching the keywords found so far")
+    eta_seconds: Optional[float] = Field(None, description="Estimated seconds left while running")
+    counts: Optional[Dict[str, int]] = Field(
+        None, description="New, updated, unchanged and failed tenders, once finished"
+    )
+    error: Optional[str] = Field(None, description="Error that made the job fail")
+    cancel_requested: bool = Field(..., description="Whether the job was asked to stop")
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime
+
+    model_config = ConfigDict(
+        from_attributes=True
+    )
 
 class KeywordBase(BaseModel):
     """
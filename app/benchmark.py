@@ -0,0 +1,156 @@
+# app/benchmark.py
+"""
+Measure the throughput of the tender listing on one API worker
+
+Run with:
+
+    python -m app.benchmark [--requests 2000] [--concurrency 16] [--limit 100]
+
+It starts a single uvicorn worker on the configured database, serving the
+listing twice: at /api/tenders, built from plain rows and encoded by orjson,
+and at /legacy/tenders, the previous path where each ORM object is validated
+into a TenderResponse and FastAPI validates the page again against
+response_model. It prints the requests per second of both.
+"""
+import argparse
+import asyncio
+import subprocess
+import sys
+import time
+
+import aiohttp
+from fastapi import APIRouter, Depends, FastAPI, Query
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes import get_validators, router
+from app.api.schemas import TenderPage, TenderResponse
+from src.database.async_base import get_async_db
+from src.database.repository import LISTING_ORDER, listing_options
+from src.database.versions import TENDERS
+from src.models.tender import Tender
+from src.utils.cursor import encode_cursor
+
+legacy_router = APIRouter()
+
+
+@legacy_router.get("/tenders", response_model=TenderPage)
+async def get_tenders_legacy(
+    limit: int = Query(100, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Listing through ORM objects and Pydantic models, for comparison"""
+    # Same version lookup as the route, so only serialization differs
+    await get_validators(db, TENDERS)
+    # Same first page as /api/tenders, loaded as ORM objects
+    statement = select(Tender).options(listing_options()).order_by(*LISTING_ORDER).limit(limit + 1)
+    tenders = list((await db.execute(statement)).scalars())
+    next_cursor = None
+    if len(tenders) > limit:
+        tenders = tenders[:limit]
+        next_cursor = encode_cursor(tenders[-1].created_at, tenders[-1].code)
+    return TenderPage(
+        items=[TenderResponse.model_validate(tender) for tender in tenders],
+        next_cursor=next_cursor
+    )
+
+
+bench_app = FastAPI()
+bench_app.include_router(router, prefix="/api")
+bench_app.include_router(legacy_router, prefix="/legacy")
+
+
+async def measure(url: str, params: dict, requests: int, concurrency: int) -> float:
+    """
+    Send requests with a fixed number in flight
+
+    Args:
+        url (str): Endpoint to call
+        params (dict): Query parameters
+        requests (int): Number of requests
+        concurrency (int): Requests in flight at a time
+
+    Returns:
+        float: Requests per second
+    """
+    remaining = iter(range(requests))
+
+    async def client(session: aiohttp.ClientSession) -> None:
+        for _ in remaining:
+            async with session.get(url, params=params) as response:
+                response.raise_for_status()
+                await response.read()
+
+    async with aiohttp.ClientSession() as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(client(session) for _ in range(concurrency)))
+        return requests / (time.perf_counter() - start)
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30) -> None:
+    """Poll the worker until it answers"""
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while True:
+            try:
+                async with session.get(f"{base_url}/api/keywords") as response:
+                    if response.status == 200:
+                        return
+            except aiohttp.ClientError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("Benchmark worker did not start")
+            await asyncio.sleep(0.2)
+
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the benchmark against a started worker"""
+    base_url = f"http://127.0.0.1:{args.port}"
+    await wait_until_ready(base_url)
+
+    params = {"limit": args.limit}
+    paths = {"orjson rows": "/api/tenders", "pydantic models": "/legacy/tenders"}
+    results = {name: [] for name in paths}
+    # Warm up both paths, then alternate them so drift affects both alike
+    for path in paths.values():
+        await measure(f"{base_url}{path}", params, args.concurrency * 5, args.concurrency)
+    for _ in range(args.rounds):
+        for name, path in paths.items():
+            results[name].append(
+                await measure(f"{base_url}{path}", params, args.requests, args.concurrency)
+            )
+
+    best = {name: max(values) for name, values in results.items()}
+    for name, value in best.items():
+        print(f"{name:>16}: {value:8.1f} requests/s")
+    print(f"{'speedup':>16}: {best['orjson rows'] / best['pydantic models']:8.2f}x")
+
+
+def main() -> int:
+    """Start a worker, benchmark it and stop it"""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per round")
+    parser.add_argument("--concurrency", type=int, default=16, help="Requests in flight")
+    parser.add_argument("--limit", type=int, default=100, help="Tenders per page")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per path")
+    parser.add_argument("--port", type=int, default=8765, help="Port of the worker")
+    args = parser.parse_args()
+
+    from src.database.base import init_db
+    init_db()
+
+    worker = subprocess.Popen([
+        sys.executable, "-m", "uvicorn", "app.benchmark:bench_app",
+        "--host", "127.0.0.1", "--port", str(args.port), "--log-level", "warning",
+    ])
+    try:
+        print(f"Benchmarking pages of {args.limit} tenders on one worker")
+        asyncio.run(run(args))
+    finally:
+        worker.terminate()
+        worker.wait()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
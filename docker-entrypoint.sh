@@ -41,8 +41,13 @@ UVICORN_BACKLOG=${UVICORN_BACKLOG:-2048}
 UVICORN_LIMIT_CONCURRENCY=${UVICORN_LIMIT_CONCURRENCY:-1000}
 UVICORN_KEEP_ALIVE=${UVICORN_KEEP_ALIVE:-5}
 
+# Ejecutar el runner de búsquedas (uno por despliegue; si otro ya tiene el
+# lock de la base de datos, este espera a que se libere)
+python -m src.pipeline.jobs &
+JOBS_PID=$!
+
 # Ejecutar el servidor Uvicorn
-exec uvicorn app.main:app \
+uvicorn app.main:app \
     --host 0.0.0.0 \
     --port $PORT \
     --workers $WORKERS \
@@ -52,4 +57,17 @@ exec uvicorn app.main:app \
     --forwarded-allow-ips '*' \
     --backlog $UVICORN_BACKLOG \
     --limit-concurrency $UVICORN_LIMIT_CONCURRENCY \
-    --timeout-keep-alive $UVICORN_KEEP_ALIVE
\ No newline at end of file
+    --timeout-keep-alive $UVICORN_KEEP_ALIVE &
+SERVER_PID=$!
+
+# Reenviar las señales de parada a ambos procesos
+trap 'kill -TERM "$SERVER_PID" "$JOBS_PID" 2>/dev/null' TERM INT
+
+# Si uno de los dos termina, detener el otro y salir con su código, para que
+# la política de reinicio del contenedor los levante de nuevo
+set +e
+wait -n "$SERVER_PID" "$JOBS_PID"
+STATUS=$?
+kill -TERM "$SERVER_PID" "$JOBS_PID" 2>/dev/null
+wait
+exit $STATUS
\ No newline at end of file
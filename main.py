@@ -2,6 +2,7 @@ from src.api.public_market_api import PublicMarketAPI
 from src.database.base import get_db
 from src.database.repository import TenderRepository, KeywordRepository
 from src.models.keywords import KeywordType
+from src.pipeline.sync import run_sync
 from src.utils.logger import setup_logger
 from typing import List, Tuple
 from init_app import initialize_application
@@ -45,42 +46,20 @@ def main():
         logger.info(f"Using include keywords: {include_keywords}")
         logger.info(f"Using exclude keywords: {exclude_keywords}")
 
-        # Search tenders
-        tenders = api.search_tenders(
+        # Search tenders and save them to the database as they arrive
+        counts = run_sync(
+            api,
+            tender_repo,
             include_keywords=include_keywords,
             exclude_keywords=exclude_keywords,
             days_back=10
         )
 
-        # Save to database
-        new_tenders = 0
-        updated_tenders = 0
-        unchanged_tenders = 0
-        
-        for tender in tenders:
-            try:
-                existing_tender = tender_repo.get_tender_by_code(tender.code)
-                
-                if existing_tender:
-                    # Update existing tender
-                    updated_tender = tender_repo.update_tender(tender)
-                    if updated_tender.updated_at > existing_tender.updated_at:
-                        updated_tenders += 1
-                    else:
-                        unchanged_tenders += 1
-                else:
-                    # Create new tender
-                    tender_repo.create_tender(tender)
-                    new_tenders += 1
-                    
-            except Exception as e:
-                logger.error(f"Error processing tender {tender.code}: {str(e)}")
-                continue
-
-            logger.info(f"Successfully processed {len(tenders)} tenders")
-            logger.info(f"New tenders: {new_tenders}")
-            logger.info(f"Updated tenders: {updated_tenders}")
-            logger.info(f"Unchanged tenders: {unchanged_tenders}")
+        logger.info(f"Successfully processed {sum(counts.values())} tenders")
+        logger.info(f"New tenders: {counts['new']}")
+        logger.info(f"Updated tenders: {counts['updated']}")
+        logger.info(f"Unchanged tenders: {counts['unchanged']}")
+        logger.info(f"Failed tenders: {counts['failed']}")
 
     except Exception as e:
         logger.error(f"Execution error: {str(e)}")
@@ -0,0 +1,303 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from src.config.settings import (
+    API_CACHE_MAX_SIZE_MB,
+    API_CACHE_PATH,
+    API_CACHE_TTL_DETAIL_CLOSED,
+    API_CACHE_TTL_DETAIL_OPEN,
+    API_CACHE_TTL_LISTING_PAST,
+    API_CACHE_TTL_LISTING_TODAY,
+)
+from src.utils.logger import setup_logger
+
+# Status codes after which a tender no longer changes: desierta, adjudicada, revocada
+CLOSED_STATUS_CODES = {7, 8, 18}
+
+# Parameters that identify a response; the ticket is deliberately left out
+CACHE_KEY_PARAMS = ("fecha", "estado", "codigo")
+
+
+class ResponseCache:
+    """
+    Persistent cache of Public Market API responses
+
+    Responses are stored in a local SQLite file keyed by the normalized request
+    parameters, so the cache survives restarts and is shared between the CLI
+    and the web workers. Each entry gets a TTL based on the kind of request,
+    and the least recently used entries are evicted once the file grows past
+    its size budget.
+
+    Hits never write: their access times are kept in memory and saved in
+    batches, with the next stored response or once TOUCH_BATCH_SIZE pile up.
+    """
+
+    EVICTION_INTERVAL = 100
+    TOUCH_BATCH_SIZE = 100
+
+    def __init__(self, path: str = API_CACHE_PATH, max_size_mb: int = API_CACHE_MAX_SIZE_MB):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite file storing the responses
+            max_size_mb: Maximum total size of the cached bodies in megabytes
+        """
+        self.path = path
+        self.max_size = max_size_mb * 1024 * 1024
+        self.logger = setup_logger(__name__)
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._touched: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at)"
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def make_key(params: Dict) -> Optional[str]:
+        """
+        Build the cache key of a request
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Optional[str]: Normalized key, or None if the request is not cacheable
+        """
+        parts = []
+        for name in CACHE_KEY_PARAMS:
+            value = params.get(name)
+            if value is not None:
+                parts.append(f"{name}={str(value).strip().lower()}")
+        return "&".join(parts) or None
+
+    @staticmethod
+    def get_ttl(params: Dict, data: Dict) -> Optional[Tuple[str, int]]:
+        """
+        Choose the kind and TTL of a response
+
+        Args:
+            params: Request parameters
+            data: Response body
+
+        Returns:
+            Optional[Tuple[str, int]]: (kind, ttl in seconds), or None if it should not be cached.
+                Error bodies (Codigo/Mensaje) and details without a tender are never cached,
+                so a transient upstream error is not replayed.
+        """
+        listado = data.get("Listado")
+        if not isinstance(listado, list):
+            return None
+
+        if params.get("codigo"):
+            if not listado:
+                return None
+            first = listado[0] if isinstance(listado[0], dict) else {}
+            status_code = first.get("CodigoEstado")
+            if status_code in CLOSED_STATUS_CODES:
+                return "detail_closed", API_CACHE_TTL_DETAIL_CLOSED
+            return "detail_open", API_CACHE_TTL_DETAIL_OPEN
+
+        if params.get("fecha"):
+            try:
+                listing_date = datetime.strptime(str(params["fecha"]), "%d%m%Y").date()
+            except ValueError:
+                return None
+            if listing_date >= date.today():
+                return "listing_today", API_CACHE_TTL_LISTING_TODAY
+            return "listing_past", API_CACHE_TTL_LISTING_PAST
+
+        return None
+
+    def get(self, params: Dict) -> Optional[Dict]:
+        """
+        Get a cached response
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Optional[Dict]: Cached response or None on a miss
+        """
+        body = self.get_body(params)
+        if body is None:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError as e:
+            self.logger.warning(f"Error decoding cache entry {self.make_key(params)}: {str(e)}")
+            return None
+
+    def get_body(self, params: Dict) -> Optional[str]:
+        """
+        Get the text of a cached response, leaving its decoding to the caller
+
+        Args:
+            params: Request parameters
+
+        Returns:
+            Optional[str]: Cached response text or None on a miss
+        """
+        key = self.make_key(params)
+        if key is None:
+            return None
+
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT body, expires_at FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                if row and row[1] > now:
+                    self._touched[key] = now
+                    if len(self._touched) >= self.TOUCH_BATCH_SIZE:
+                        self._save_touched()
+                        self._conn.commit()
+                    self.hits += 1
+                    return row[0]
+                self.misses += 1
+                return None
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error reading cache entry {key}: {str(e)}")
+            return None
+
+    def set(self, params: Dict, data: Dict) -> None:
+        """
+        Store a response
+
+        Args:
+            params: Request parameters
+            data: Response body
+        """
+        ttl = self.get_ttl(params, data)
+        if ttl is not None:
+            self.set_bodies([(params, json.dumps(data), ttl)])
+
+    def set_bodies(self, entries: List[Tuple[Dict, str, Tuple[str, int]]]) -> None:
+        """
+        Store several response texts in one transaction
+
+        Args:
+            entries: (request parameters, response text, (kind, ttl)) of each
+                response, the TTL as get_ttl chooses it
+        """
+        now = time.time()
+        rows = []
+        for params, body, (kind, seconds) in entries:
+            key = self.make_key(params)
+            if key is not None:
+                rows.append((key, kind, body, len(body), now + seconds, now))
+        if not rows:
+            return
+
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, kind, body, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+                for row in rows:
+                    self._touched.pop(row[0], None)
+                self._save_touched()
+                self._conn.commit()
+                previous_writes = self._writes
+                self._writes += len(rows)
+                if self._writes // self.EVICTION_INTERVAL != previous_writes // self.EVICTION_INTERVAL:
+                    self._evict()
+        except sqlite3.Error as e:
+            self.logger.warning(f"Error writing {len(rows)} cache entries: {str(e)}")
+
+    def _save_touched(self) -> None:
+        """Write the pending access times of cache hits, leaving the commit to the caller"""
+        if not self._touched:
+            return
+        self._conn.executemany(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?",
+            [(accessed_at, key) for key, accessed_at in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then least recently used ones until under budget"""
+        self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_size:
+            excess = total - self.max_size
+            freed = 0
+            keys = []
+            for key, size in self._conn.execute(
+                "SELECT key, size FROM responses ORDER BY accessed_at"
+            ):
+                keys.append((key,))
+                freed += size
+                if freed >= excess:
+                    break
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", keys)
+            self.logger.debug(f"Evicted {len(keys)} cached responses")
+        self._conn.commit()
+
+    def stats(self) -> Dict:
+        """
+        Get cache counters
+
+        Returns:
+            Dict: Hits and misses of this process, plus entries and size on disk
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "entries": entries,
+            "size_bytes": size,
+        }
+
+
+_caches: Dict[str, ResponseCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_response_cache(path: str = API_CACHE_PATH) -> ResponseCache:
+    """
+    Get the process-wide cache for a file
+
+    Args:
+        path: SQLite file storing the responses
+
+    Returns:
+        ResponseCache: Cache shared by every API client of this process
+    """
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = ResponseCache(path=path)
+        return _caches[path]
@@ -0,0 +1,386 @@
+from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Type
+
+from src.models.enum import (
+    AdministrativeActType,
+    BaseEnum,
+    Currency,
+    EstimationType,
+    PaymentModality,
+    TenderType,
+    TimeUnit,
+    PaymentType,
+)
+from src.models.tender import Tender
+from src.utils.logger import setup_logger
+from src.utils.safe_load import parse_date, safe_bool, safe_float, safe_int
+
+# Sections of a tender payload a field can be read from
+ROOT = "root"
+BUYER = "Comprador"
+DATES = "Fechas"
+AWARD = "Adjudicacion"
+
+
+@lru_cache(maxsize=8192)
+def _parse_date_string(value: str) -> Optional[datetime]:
+    """Parse an ISO date string; cached since many tenders share the same dates"""
+    try:
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def fast_date(value: Any) -> Optional[datetime]:
+    """
+    Parse a date like parse_date, with a cached fast path for strings
+
+    Args:
+        value: Raw date value
+
+    Returns:
+        Optional[datetime]: Parsed date or None
+    """
+    if not value:
+        return None
+    if type(value) is str:
+        return _parse_date_string(value)
+    return parse_date(value)
+
+
+def enum_lookup(enum_cls: Type[BaseEnum]) -> Callable[[Any], Optional[BaseEnum]]:
+    """
+    Build a converter equivalent to enum_cls.from_value backed by a dict
+
+    Args:
+        enum_cls: Enum to look values up in
+
+    Returns:
+        Callable[[Any], Optional[BaseEnum]]: Converter returning None on misses
+    """
+    members = {member.value: member for member in enum_cls}
+
+    def lookup(value: Any) -> Optional[BaseEnum]:
+        try:
+            return members.get(value)
+        except TypeError:
+            return None
+
+    return lookup
+
+
+def optional_str(value: Any) -> Optional[str]:
+    """Convert a truthy value to string, anything else to None"""
+    return str(value) if value else None
+
+
+def identity(value: Any) -> Any:
+    """Return the value unchanged"""
+    return value
+
+
+# Declarative mapping of Tender attributes: (attribute, section, key, converter).
+# Converters are only called for non-None values.
+TENDER_FIELDS: List[Tuple[str, str, str, Callable[[Any], Any]]] = [
+    # Identificación y datos básicos
+    ("name", ROOT, "Nombre", identity),
+    ("description", ROOT, "Descripcion", identity),
+    ("status", ROOT, "Estado", identity),
+    ("status_code", ROOT, "CodigoEstado", safe_int),
+    ("api_version", ROOT, "Version", identity),
+    # Clasificación y tipo
+    ("tender_type", ROOT, "Tipo", enum_lookup(TenderType)),
+    ("currency", ROOT, "Moneda", enum_lookup(Currency)),
+    ("bidding_stages", ROOT, "Etapas", safe_int),
+    ("bidding_stages_status", ROOT, "EstadoEtapas", safe_int),
+    # Información financiera
+    ("estimated_amount", ROOT, "MontoEstimado", safe_float),
+    ("estimation_type", ROOT, "Estimacion", enum_lookup(EstimationType)),
+    ("amount_visibility", ROOT, "VisibilidadMonto", safe_bool),
+    ("payment_modality", ROOT, "Modalidad", enum_lookup(PaymentModality)),
+    ("payment_type", ROOT, "TipoPago", enum_lookup(PaymentType)),
+    ("financing_source", ROOT, "FuenteFinanciamiento", optional_str),
+    # Información de la organización
+    ("organization", BUYER, "NombreOrganismo", identity),
+    ("organization_code", BUYER, "CodigoOrganismo", identity),
+    ("organization_tax_id", BUYER, "RutUnidad", identity),
+    ("buying_unit", BUYER, "NombreUnidad", identity),
+    ("buying_unit_code", BUYER, "CodigoUnidad", identity),
+    ("buying_unit_address", BUYER, "DireccionUnidad", identity),
+    ("buying_unit_region", BUYER, "RegionUnidad", identity),
+    ("buying_unit_commune", BUYER, "ComunaUnidad", identity),
+    # Información del usuario
+    ("user_tax_id", BUYER, "RutUsuario", identity),
+    ("user_code", BUYER, "CodigoUsuario", identity),
+    ("user_name", BUYER, "NombreUsuario", identity),
+    ("user_position", BUYER, "CargoUsuario", identity),
+    # Fechas
+    ("creation_date", DATES, "FechaCreacion", fast_date),
+    ("publication_date", DATES, "FechaPublicacion", fast_date),
+    ("closing_date", DATES, "FechaCierre", fast_date),
+    ("questions_deadline", DATES, "FechaFinal", fast_date),
+    ("answers_publication_date", DATES, "FechaPubRespuestas", fast_date),
+    ("technical_opening_date", DATES, "FechaActoAperturaTecnica", fast_date),
+    ("economic_opening_date", DATES, "FechaActoAperturaEconomica", fast_date),
+    ("award_date", DATES, "FechaAdjudicacion", fast_date),
+    ("estimated_award_date", DATES, "FechaEstimadaAdjudicacion", fast_date),
+    ("site_visit_date", DATES, "FechaVisitaTerreno", fast_date),
+    ("background_delivery_date", DATES, "FechaEntregaAntecedentes", fast_date),
+    ("physical_support_date", DATES, "FechaSoporteFisico", fast_date),
+    ("evaluation_date", DATES, "FechaTiempoEvaluacion", fast_date),
+    ("estimated_signing_date", DATES, "FechaEstimadaFirma", fast_date),
+    ("user_defined_date", DATES, "FechasUsuario", fast_date),
+    # Unidades de tiempo
+    ("evaluation_time_unit", ROOT, "UnidadTiempo", enum_lookup(TimeUnit)),
+    ("contract_time_unit", ROOT, "UnidadTiempoContratoLicitacion", enum_lookup(TimeUnit)),
+    # Información de contacto
+    ("payment_responsible_name", ROOT, "NombreResponsablePago", identity),
+    ("payment_responsible_email", ROOT, "EmailResponsablePago", identity),
+    ("contract_responsible_name", ROOT, "NombreResponsableContrato", identity),
+    ("contract_responsible_email", ROOT, "EmailResponsableContrato", identity),
+    ("contract_responsible_phone", ROOT, "FonoResponsableContrato", identity),
+    # Información del contrato
+    ("allows_subcontracting", ROOT, "SubContratacion", safe_bool),
+    ("contract_duration", ROOT, "TiempoDuracionContrato", safe_int),
+    ("contract_duration_type", ROOT, "TipoDuracionContrato", identity),
+    ("is_renewable", ROOT, "EsRenovable", safe_bool),
+    ("renewal_time_value", ROOT, "ValorTiempoRenovacion", safe_int),
+    ("renewal_time_period", ROOT, "PeriodoTiempoRenovacion", identity),
+    # Control y regulación
+    ("requires_comptroller", ROOT, "TomaRazon", safe_bool),
+    ("technical_offer_publicity", ROOT, "EstadoPublicidadOfertas", safe_int),
+    ("publicity_justification", ROOT, "JustificacionPublicidad", identity),
+    ("hiring_prohibition", ROOT, "ProhibicionContratacion", identity),
+    ("amount_justification", ROOT, "JustificacionMontoEstimado", identity),
+    ("deadline_extension", ROOT, "ExtensionPlazo", safe_int),
+    # Flags y estados
+    ("is_public_bid", ROOT, "TipoConvocatoria", safe_bool),
+    ("is_informed", ROOT, "Informada", safe_bool),
+    ("is_base_type", ROOT, "EsBaseTipo", safe_bool),
+    # Información de adjudicación
+    ("award_type", AWARD, "Tipo", enum_lookup(AdministrativeActType)),
+    ("award_document_number", AWARD, "Numero", identity),
+    ("award_document_date", AWARD, "Fecha", fast_date),
+    ("number_of_bidders", AWARD, "NumeroOferentes", safe_int),
+    ("award_act_url", AWARD, "UrlActa", identity),
+    ("complaint_count", ROOT, "CantidadReclamos", safe_int),
+]
+
+
+def decode_items(items_data: Optional[Dict]) -> List[Dict]:
+    """
+    Parse items data into a structured format
+
+    Args:
+        items_data: Raw items data from API
+
+    Returns:
+        List[Dict]: List of parsed items
+    """
+    items = []
+    if not items_data:
+        return items
+
+    for item in items_data.get("Listado", []) or []:
+        if not isinstance(item, dict):
+            continue
+
+        parsed_item = {
+            "correlative": item.get("Correlativo"),
+            "category_code": item.get("CodigoCategoria"),
+            "category_name": item.get("Categoria"),
+            "product_code": item.get("CodigoProducto"),
+            "product_name": item.get("NombreProducto"),
+            "description": item.get("Descripcion"),
+            "quantity": safe_float(item.get("Cantidad")),
+            "unit": item.get("UnidadMedida"),
+            "tender_status_code": safe_int(item.get("CodigoEstadoLicitacion")),
+        }
+
+        # Only add award information if it exists
+        adjudicacion = item.get("Adjudicacion")
+        if isinstance(adjudicacion, dict):
+            parsed_item["award"] = {
+                "supplier_tax_id": adjudicacion.get("RutProveedor"),
+                "supplier_name": adjudicacion.get("NombreProveedor"),
+                "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
+                "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
+            }
+
+        items.append(parsed_item)
+
+    return items
+
+
+def decode_awarded_suppliers(tender_data: Optional[Dict]) -> List[Dict]:
+    """
+    Parse awarded suppliers data, keeping the first of identical entries
+
+    Args:
+        tender_data: Raw tender data from API
+
+    Returns:
+        List[Dict]: List of awarded suppliers
+    """
+    awarded_suppliers = []
+    if not tender_data:
+        return awarded_suppliers
+
+    items_data = tender_data.get("Items", {})
+    if not items_data:
+        return awarded_suppliers
+
+    seen = set()
+    for item in items_data.get("Listado", []) or []:
+        if not isinstance(item, dict):
+            continue
+
+        adjudicacion = item.get("Adjudicacion")
+        if not isinstance(adjudicacion, dict):
+            continue
+
+        supplier = {
+            "tax_id": adjudicacion.get("RutProveedor"),
+            "name": adjudicacion.get("NombreProveedor"),
+            "item_correlative": item.get("Correlativo"),
+            "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
+            "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
+        }
+
+        # Only add if we have at least tax_id or name
+        if not (supplier["tax_id"] or supplier["name"]):
+            continue
+
+        try:
+            key = tuple(supplier.values())
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            # Unhashable values from the API: fall back to a list scan
+            if supplier in awarded_suppliers:
+                continue
+        awarded_suppliers.append(supplier)
+
+    return awarded_suppliers
+
+
+class TenderDecoder:
+    """
+    Decoder of tender payloads into Tender objects
+
+    The field mapping is compiled once into a plan of (attribute, section, key,
+    converter) entries; decoding a payload is a single loop over that plan,
+    with dict-backed enum lookups and cached date parsing.
+    """
+
+    def __init__(self, fields: Iterable[Tuple[str, str, str, Callable[[Any], Any]]] = TENDER_FIELDS):
+        """
+        Compile the decoding plan
+
+        Args:
+            fields: Field mapping to compile
+        """
+        self.logger = setup_logger(__name__)
+        self._plan = tuple(fields)
+
+    def decode_fields(self, tender_data: Dict) -> Optional[Dict]:
+        """
+        Decode a payload into the keyword arguments of a Tender
+
+        Args:
+            tender_data: Raw tender data from API
+
+        Returns:
+            Optional[Dict]: Tender attributes, or None if the payload is invalid
+        """
+        if not tender_data or not isinstance(tender_data, dict):
+            self.logger.warning("Invalid or empty tender data received")
+            return None
+
+        # Verificar código obligatorio
+        code = tender_data.get("CodigoExterno")
+        if not code:
+            self.logger.warning("Tender data missing required code")
+            return None
+
+        sections = {
+            ROOT: tender_data,
+            BUYER: tender_data.get(BUYER) or {},
+            DATES: tender_data.get(DATES) or {},
+            AWARD: tender_data.get(AWARD) or {},
+        }
+
+        fields = {"code": code}
+        for attribute, section, key, convert in self._plan:
+            value = sections[section].get(key)
+            fields[attribute] = convert(value) if value is not None else None
+
+        # Parse items and awarded suppliers
+        try:
+            fields["items"] = decode_items(tender_data.get("Items") or {})
+        except Exception as e:
+            self.logger.warning(f"Error parsing items: {str(e)}")
+            fields["items"] = None
+
+        try:
+            fields["awarded_suppliers"] = decode_awarded_suppliers(tender_data)
+        except Exception as e:
+            self.logger.warning(f"Error parsing awarded suppliers: {str(e)}")
+            fields["awarded_suppliers"] = None
+
+        return fields
+
+    def decode(self, tender_data: Dict) -> Optional[Tender]:
+        """
+        Decode a payload into a Tender
+
+        Args:
+            tender_data: Raw tender data from API
+
+        Returns:
+            Optional[Tender]: Parsed tender object or None if parsing fails
+        """
+        try:
+            fields = self.decode_fields(tender_data)
+            if not fields:
+                return None
+            return self.build(fields)
+        except Exception as e:
+            self.logger.error(f"Error parsing tender details: {str(e)}")
+            return None
+
+    @staticmethod
+    def build(fields: Dict) -> Tender:
+        """
+        Build a Tender from attributes returned by decode_fields
+
+        Args:
+            fields: Tender attributes
+
+        Returns:
+            Tender: Tender object
+        """
+        # Unset attributes already read as None; skipping them avoids
+        # most of the ORM instrumentation cost
+        return Tender(**{name: value for name, value in fields.items() if value is not None})
+
+    def decode_many(self, payloads: Iterable[Dict]) -> List[Tender]:
+        """
+        Decode a batch of payloads, skipping the ones that fail
+
+        Args:
+            payloads: Raw tender data from API
+
+        Returns:
+            List[Tender]: Parsed tenders, in the same order as payloads
+        """
+        tenders = []
+        for tender_data in payloads:
+            tender = self.decode(tender_data)
+            if tender is not None:
+                tenders.append(tender)
+        return tenders
@@ -0,0 +1,173 @@
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.api.cache import ResponseCache
+from src.api.decoder import TenderDecoder
+from src.utils.keyword_matcher import get_keyword_matcher
+from src.utils.logger import setup_logger
+
+# Listing keys sent back to the parent for each match; enough to dedupe the
+# tender and to decide whether its details must be fetched again
+LISTING_KEYS = ("CodigoExterno", "CodigoEstado", "FechaCierre")
+
+# (kind, ttl in seconds) of a response, as ResponseCache.get_ttl chooses it
+CacheTTL = Optional[Tuple[str, int]]
+
+logger = setup_logger(__name__)
+
+# Built lazily so each worker process compiles its own decoding plan once
+_decoder: Optional[TenderDecoder] = None
+
+_pools: Dict[int, ProcessPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the process-wide pool parsing API responses
+
+    Spawning the workers costs seconds, so the pool is created on first use
+    and shared by every search of this process.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor: Pool with that many workers
+    """
+    with _pools_lock:
+        if workers not in _pools:
+            # Spawned workers do not inherit the threads and locks of this process
+            _pools[workers] = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pools[workers]
+
+
+def discard_parse_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Drop a broken pool, so the next get_parse_pool starts a new one
+
+    Args:
+        pool: Pool returned by get_parse_pool
+    """
+    with _pools_lock:
+        for workers, existing in list(_pools.items()):
+            if existing is pool:
+                del _pools[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def match_listing(tenders: Sequence[Dict], include_keywords: Sequence[str],
+                  exclude_keywords: Sequence[str]) -> List[Dict]:
+    """
+    Match a daily listing against the keyword criteria
+
+    The matcher is cached per process.
+
+    Args:
+        tenders: Tenders of the daily listing
+        include_keywords: Keywords that should be included
+        exclude_keywords: Keywords that should be excluded
+
+    Returns:
+        List[Dict]: Compact entries of the matching tenders, in listing order
+    """
+    matcher = get_keyword_matcher(include_keywords, exclude_keywords)
+    matches = []
+    for tender_data in tenders:
+        try:
+            if not tender_data:
+                continue
+
+            search_text = f"{tender_data.get('Nombre', '')} {tender_data.get('Descripcion', '')}"
+            if not matcher.matches(search_text) or not tender_data.get("CodigoExterno"):
+                continue
+
+            matches.append({key: tender_data[key] for key in LISTING_KEYS if key in tender_data})
+        except Exception as e:
+            logger.error(f"Error processing tender: {str(e)}")
+            continue
+    return matches
+
+
+def parse_listing(params: Dict, body: str, include_keywords: Sequence[str],
+                  exclude_keywords: Sequence[str]) -> Optional[Tuple[int, List[Dict], CacheTTL]]:
+    """
+    Decode a daily listing response and match it against the keyword criteria
+
+    Runs either inline or inside a worker process, so it only takes and
+    returns picklable values. The JSON is decoded here: with a pool, the
+    parent only reads the response text and the workers do the parsing.
+
+    Args:
+        params: Request parameters of the listing
+        body: Response text
+        include_keywords: Keywords that should be included
+        exclude_keywords: Keywords that should be excluded
+
+    Returns:
+        Optional[Tuple[int, List[Dict], CacheTTL]]: Number of listed tenders,
+            compact entries of the matches and cache TTL of the response, or
+            None if the response holds no listing
+    """
+    try:
+        data = json.loads(body)
+    except ValueError as e:
+        logger.error(f"Invalid listing response: {str(e)}")
+        return None
+    if not isinstance(data, dict) or not isinstance(data.get("Listado"), list):
+        return None
+
+    tenders = data["Listado"]
+    matches = match_listing(tenders, include_keywords, exclude_keywords)
+    return len(tenders), matches, ResponseCache.get_ttl(params, data)
+
+
+def parse_details(responses: Sequence[Tuple[Dict, str]]) -> List[Tuple[bool, Optional[Dict], CacheTTL]]:
+    """
+    Decode detail responses into Tender attributes
+
+    Runs either inline or inside a worker process, like parse_listing. ORM
+    objects are not built here: the parent turns the returned attributes
+    into Tender objects with TenderDecoder.build.
+
+    Args:
+        responses: (request parameters, response text) of each detail
+
+    Returns:
+        List[Tuple[bool, Optional[Dict], CacheTTL]]: For each response, in
+            order: whether it held a tender, its attributes (None if it
+            could not be decoded) and the cache TTL of the response
+    """
+    global _decoder
+    if _decoder is None:
+        _decoder = TenderDecoder()
+
+    results = []
+    for params, body in responses:
+        code = params.get("codigo")
+        try:
+            data = json.loads(body)
+        except ValueError as e:
+            logger.error(f"Invalid details response for tender {code}: {str(e)}")
+            results.append((False, None, None))
+            continue
+
+        listado = data.get("Listado") if isinstance(data, dict) else None
+        if not listado or not isinstance(listado, list) or not isinstance(listado[0], dict):
+            logger.warning(f"No valid details found for tender {code}")
+            results.append((False, None, None))
+            continue
+
+        try:
+            fields = _decoder.decode_fields(listado[0])
+        except Exception as e:
+            logger.error(f"Error parsing tender details: {str(e)}")
+            fields = None
+        results.append((True, fields or None, ResponseCache.get_ttl(params, data)))
+    return results
@@ -1,32 +1,118 @@
-from datetime import date, timedelta
-from typing import Dict, List, Optional
+import asyncio
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
+import aiohttp
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
-from src.config.settings import API_BASE_URL, API_TICKET
-from src.models.enum import (
-    AdministrativeActType,
-    Currency,
-    EstimationType,
-    PaymentModality,
-    TenderType,
-    TimeUnit,
-    PaymentType,
+from src.config.settings import (
+    API_BASE_URL,
+    API_CACHE_ENABLED,
+    API_LISTING_WORKERS,
+    API_MAX_CONCURRENCY,
+    API_PARSE_WORKERS,
+    API_TICKET,
+    SYNC_QUEUE_SIZE,
+)
+from src.api.cache import ResponseCache, get_response_cache
+from src.api.decoder import TenderDecoder, decode_awarded_suppliers, decode_items
+from src.api.parallel import (
+    CacheTTL,
+    discard_parse_pool,
+    get_parse_pool,
+    parse_details,
+    parse_listing,
 )
+from src.api.rate_limiter import RateLimiter, get_rate_limiter
+from src.database.repository import TenderRepository
 from src.models.tender import Tender
+from src.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
 from src.utils.logger import setup_logger
-from src.utils.safe_load import parse_date, safe_bool, safe_float, safe_int, remove_accents
+from src.utils.safe_load import parse_date, safe_int
+
+# Status filters accepted by searches; "todos" searches every status
+SEARCH_STATUSES = (
+    "publicada", "cerrada", "desierta", "adjudicada", "revocada", "suspendida", "todos"
+)
+
+# Marks the end of the results queue of iter_search_events
+_END_OF_RESULTS = object()
+
+# Default of the cache argument of PublicMarketAPI, so that None can disable it
+_DEFAULT_CACHE: Any = object()
+
+
+@dataclass
+class DayResult:
+    """Summary of one fully processed day of a search"""
+
+    day: date
+    listed: int
+    matched: int
+    fetched: int
+    failed: int
 
 
 class PublicMarketAPI:
     """Class to interact with the Public Market API"""
 
-    def __init__(self):
-        """Initialize API with configuration"""
+    # Retry policy shared by the requests session and the async fetch engine
+    MAX_RETRIES = 3
+    BACKOFF_FACTOR = 1
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+    def __init__(self, max_concurrency: int = API_MAX_CONCURRENCY,
+                 listing_workers: int = API_LISTING_WORKERS,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 cache: Optional[ResponseCache] = _DEFAULT_CACHE,
+                 parse_workers: int = API_PARSE_WORKERS):
+        """
+        Initialize API with configuration
+
+        Args:
+            max_concurrency: Maximum number of simultaneous requests made by
+                the async fetch engine
+            listing_workers: Maximum number of daily listings fetched in parallel
+            rate_limiter: Limiter throttling every request (defaults to the
+                limiter shared by all processes on this host)
+            cache: Response cache, or None to disable it (defaults to the
+                on-disk cache when API_CACHE_ENABLED is set)
+            parse_workers: Number of processes used to match and decode
+                payloads; 0 keeps parsing in the fetch thread
+        """
         self.ticket = API_TICKET
         self.base_url = API_BASE_URL
+        self.max_concurrency = max(1, max_concurrency)
+        self.listing_workers = max(1, listing_workers)
+        self.parse_workers = max(0, parse_workers)
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        if cache is _DEFAULT_CACHE:
+            cache = get_response_cache() if API_CACHE_ENABLED else None
+        self.cache = cache
+        self.skipped_unchanged = 0
+        self.decoder = TenderDecoder()
         self.logger = setup_logger(__name__)
 
         # Configure session with retry strategy
@@ -36,23 +122,56 @@ class PublicMarketAPI:
         """
         Configure requests session with retry strategy
 
+        Only connection errors are retried by urllib3; throttled and failed
+        responses are retried by _make_request so the rate limiter sees them.
+
         Returns:
             requests.Session: Configured session object
         """
         session = requests.Session()
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
+            total=self.MAX_RETRIES,
+            backoff_factor=self.BACKOFF_FACTOR,
+            respect_retry_after_header=False,
         )
         adapter = HTTPAdapter(max_retries=retry_strategy)
         session.mount("https://", adapter)
         return session
 
+    def _get_cached(self, params: Dict) -> Optional[Dict]:
+        """
+        Look up a response in the cache
+
+        Args:
+            params: Dictionary with request parameters
+
+        Returns:
+            Optional[Dict]: Cached response or None if missing or cache disabled
+        """
+        if not self.cache:
+            return None
+        data = self.cache.get(params)
+        if data is not None:
+            self.logger.debug(f"Cache hit for parameters: {ResponseCache.make_key(params)}")
+        return data
+
+    def _set_cached(self, params: Dict, data: Dict) -> None:
+        """
+        Store a successful response in the cache
+
+        Args:
+            params: Dictionary with request parameters
+            data: JSON response from the API
+        """
+        if self.cache and isinstance(data, dict):
+            self.cache.set(params, data)
+
     def _make_request(self, params: Dict) -> Optional[Dict]:
         """
         Makes an API request with error handling and detailed logging
 
+        Responses are served from and stored in the response cache when enabled.
+
         Args:
             params: Dictionary with request parameters
 
@@ -62,19 +181,203 @@ class PublicMarketAPI:
         Raises:
             requests.exceptions.RequestException: If the request fails
         """
-        try:
-            self.logger.debug(f"Making request with parameters: {params}")
-            response = self.session.get(self.base_url, params=params, timeout=(5, 30))
-            response.raise_for_status()
+        cached = self._get_cached(params)
+        if cached is not None:
+            return cached
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                sent_at = self.rate_limiter.acquire()
+                self.logger.debug(f"Making request with parameters: {params}")
+                response = self.session.get(self.base_url, params=params, timeout=(5, 30))
+                self.rate_limiter.record(
+                    response.status_code, response.headers.get("Retry-After"), sent_at
+                )
+
+                if response.status_code in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                    self.logger.debug(f"Retrying request after status {response.status_code}")
+                    time.sleep(self.BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+
+                response.raise_for_status()
+
+                data = response.json()
+                self.logger.debug(f"Number of tenders in response: {data.get('Cantidad', 0)}")
+                self._set_cached(params, data)
+                return data
 
-            data = response.json()
-            self.logger.debug(f"Number of tenders in response: {data.get('Cantidad', 0)}")
-            return data
+            except requests.exceptions.RequestException as e:
+                self.logger.error(f"Request error: {str(e)}")
+                return None
+
+        return None
+
+    def _create_async_session(self) -> aiohttp.ClientSession:
+        """
+        Create the aiohttp session used by the async fetch engine
+
+        Returns:
+            aiohttp.ClientSession: Session limited to max_concurrency connections
+        """
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        timeout = aiohttp.ClientTimeout(sock_connect=5, sock_read=30)
+        return aiohttp.ClientSession(connector=connector, timeout=timeout)
 
-        except requests.exceptions.RequestException as e:
+    async def _make_request_async(self, session: aiohttp.ClientSession,
+                                  params: Dict) -> Optional[Dict]:
+        """
+        Async counterpart of _make_request, with the same retry policy and
+        rate limiting
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            params: Dictionary with request parameters
+
+        Returns:
+            Optional[Dict]: JSON response from the API or None if request fails
+        """
+        # The cache is a SQLite file: keep its I/O off the event loop
+        cached = await asyncio.to_thread(self._get_cached, params) if self.cache else None
+        if cached is not None:
+            return cached
+
+        body = await self._fetch_body_async(session, params)
+        if body is None:
+            return None
+        try:
+            data = json.loads(body)
+        except ValueError as e:
             self.logger.error(f"Request error: {str(e)}")
             return None
 
+        self.logger.debug(f"Number of tenders in response: {data.get('Cantidad', 0)}")
+        if self.cache:
+            await asyncio.to_thread(self._set_cached, params, data)
+        return data
+
+    async def _fetch_body_async(self, session: aiohttp.ClientSession,
+                                params: Dict) -> Optional[str]:
+        """
+        Request the API and return the response text, leaving its decoding
+        to the caller
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            params: Dictionary with request parameters
+
+        Returns:
+            Optional[str]: Response text or None if request fails
+        """
+        # aiohttp does not drop None values like requests does
+        query = {key: value for key, value in params.items() if value is not None}
+
+        for attempt in range(self.MAX_RETRIES + 1):
+            try:
+                sent_at = await self.rate_limiter.acquire_async()
+                self.logger.debug(f"Making async request with parameters: {params}")
+                async with session.get(self.base_url, params=query) as response:
+                    await self.rate_limiter.record_async(
+                        response.status, response.headers.get("Retry-After"), sent_at
+                    )
+                    if response.status in self.RETRY_STATUSES and attempt < self.MAX_RETRIES:
+                        self.logger.debug(
+                            f"Retrying request after status {response.status}"
+                        )
+                        await asyncio.sleep(self.BACKOFF_FACTOR * (2 ** attempt))
+                        continue
+
+                    response.raise_for_status()
+                    return await response.text()
+
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt < self.MAX_RETRIES:
+                    await asyncio.sleep(self.BACKOFF_FACTOR * (2 ** attempt))
+                    continue
+                self.logger.error(f"Request error: {str(e)}")
+                return None
+
+            except (aiohttp.ClientError, ValueError) as e:
+                self.logger.error(f"Request error: {str(e)}")
+                return None
+
+        return None
+
+    async def _load_body_async(self, session: aiohttp.ClientSession,
+                               params: Dict) -> Tuple[Optional[str], bool]:
+        """
+        Get a response text from the cache, or else from the API
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            params: Dictionary with request parameters
+
+        Returns:
+            Tuple[Optional[str], bool]: Response text (None if the request
+                failed) and whether it came from the cache
+        """
+        if self.cache:
+            body = await asyncio.to_thread(self.cache.get_body, params)
+            if body is not None:
+                self.logger.debug(f"Cache hit for parameters: {ResponseCache.make_key(params)}")
+                return body, True
+        return await self._fetch_body_async(session, params), False
+
+    async def _store_bodies_async(self, entries: List[Tuple[Dict, str, CacheTTL]]) -> None:
+        """
+        Store fetched response texts in the cache, with the TTLs their parsing chose
+
+        Args:
+            entries: (request parameters, response text, TTL) of each
+                response; those without a TTL are not cacheable
+        """
+        entries = [entry for entry in entries if entry[2] is not None]
+        if self.cache and entries:
+            await asyncio.to_thread(self.cache.set_bodies, entries)
+
+    @staticmethod
+    def _run_async(coro):
+        """
+        Run a coroutine to completion from synchronous code
+
+        Falls back to a dedicated thread when called from inside a running
+        event loop (e.g. a FastAPI background task), where asyncio.run fails.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Any: Result of the coroutine
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def _extract_tender_details(self, code: str, data: Optional[Dict]) -> Optional[Dict]:
+        """
+        Extract the tender payload from a detail response
+
+        Args:
+            code: Tender code that was requested
+            data: Raw API response
+
+        Returns:
+            Optional[Dict]: Detailed tender information or None if not found
+        """
+        if not data or "Listado" not in data or not data["Listado"]:
+            self.logger.warning(f"No valid details found for tender {code}")
+            return None
+
+        tender_data = data["Listado"][0]
+        if not isinstance(tender_data, dict):
+            self.logger.warning(f"Invalid data format for tender {code}")
+            return None
+
+        return tender_data
+
     def get_tender_details(self, code: str) -> Optional[Dict]:
         """
         Get detailed information for a specific tender
@@ -93,26 +396,226 @@ class PublicMarketAPI:
         try:
             self.logger.debug(f"Getting details for tender {code}")
             data = self._make_request(params)
+            return self._extract_tender_details(code, data)
 
-            if not data or "Listado" not in data or not data["Listado"]:
-                self.logger.warning(f"No valid details found for tender {code}")
-                return None
+        except Exception as e:
+            self.logger.error(f"Error getting tender details for {code}: {str(e)}")
+            return None
 
-            tender_data = data["Listado"][0]
-            if not isinstance(tender_data, dict):
-                self.logger.warning(f"Invalid data format for tender {code}")
-                return None
+    async def _get_tender_details_async(self, session: aiohttp.ClientSession,
+                                        semaphore: asyncio.Semaphore,
+                                        code: str) -> Optional[Dict]:
+        """
+        Async counterpart of get_tender_details
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            semaphore: Semaphore bounding the number of requests in flight
+            code: Tender code to search
+
+        Returns:
+            Optional[Dict]: Detailed tender information or None if not found
+        """
+        if not code:
+            return None
 
-            return tender_data
+        params = {"ticket": self.ticket, "codigo": code}
+
+        try:
+            async with semaphore:
+                self.logger.debug(f"Getting details for tender {code}")
+                data = await self._make_request_async(session, params)
+            return self._extract_tender_details(code, data)
 
         except Exception as e:
             self.logger.error(f"Error getting tender details for {code}: {str(e)}")
             return None
 
+    async def _fetch_details_async(self, session: aiohttp.ClientSession,
+                                   codes: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Fetch the details of several tenders concurrently
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            codes: Tender codes to fetch
+
+        Returns:
+            Dict[str, Optional[Dict]]: Detail payload (or None) by tender code,
+                in the same order as codes
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = await asyncio.gather(
+            *(self._get_tender_details_async(session, semaphore, code) for code in codes)
+        )
+        return dict(zip(codes, results))
+
+    def get_tenders_details(self, codes: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get detailed information for several tenders concurrently
+
+        Args:
+            codes: Tender codes to search
+
+        Returns:
+            Dict[str, Optional[Dict]]: Detail payload (or None if not found) by
+                tender code, in the same order as codes
+        """
+        async def fetch() -> Dict[str, Optional[Dict]]:
+            async with self._create_async_session() as session:
+                return await self._fetch_details_async(session, codes)
+
+        return self._run_async(fetch())
+
+    def _listing_params(self, current_date: date, estado: Optional[str]) -> Dict:
+        """
+        Build the request parameters of the tender listing of a single day
+
+        Args:
+            current_date: Day to fetch
+            estado: Status filter, or None for every status
+
+        Returns:
+            Dict: Request parameters
+        """
+        return {
+            "ticket": self.ticket,
+            "fecha": current_date.strftime("%d%m%Y"),
+            "codigo": None,
+            "estado": estado
+        }
+
+    async def _fetch_detail_bodies_async(self, session: aiohttp.ClientSession,
+                                         codes: List[str]) -> List[Tuple[Dict, Optional[str], bool]]:
+        """
+        Fetch the detail responses of several tenders concurrently, undecoded
+
+        Args:
+            session: aiohttp session created by _create_async_session
+            codes: Tender codes to fetch
+
+        Returns:
+            List[Tuple[Dict, Optional[str], bool]]: Request parameters,
+                response text (None if the request failed) and whether it
+                came from the cache, in the same order as codes
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(code: str) -> Tuple[Dict, Optional[str], bool]:
+            params = {"ticket": self.ticket, "codigo": code}
+            async with semaphore:
+                self.logger.debug(f"Getting details for tender {code}")
+                body, cached = await self._load_body_async(session, params)
+            return params, body, cached
+
+        return list(await asyncio.gather(*(fetch(code) for code in codes)))
+
+    async def _iter_days_async(self, dates: List[date],
+                               load_day: Callable[[date], Awaitable[Any]]
+                               ) -> AsyncIterator[Tuple[date, Any]]:
+        """
+        Load days in parallel, yielding them in date order
+
+        At most listing_workers days are in flight at any time. As soon as the
+        oldest pending day is yielded, the next day is scheduled, so slow days
+        only hold back the days queued behind them.
+
+        Args:
+            dates: Days to load, in the order they should be yielded
+            load_day: Coroutine function loading one day; it must handle its
+                own errors
+
+        Yields:
+            Tuple[date, Any]: Day and the result of load_day
+        """
+        pending = deque()
+        remaining_dates = iter(dates)
+
+        def schedule_next():
+            next_date = next(remaining_dates, None)
+            if next_date is not None:
+                pending.append((next_date, asyncio.ensure_future(load_day(next_date))))
+
+        for _ in range(self.listing_workers):
+            schedule_next()
+
+        try:
+            while pending:
+                current_date, task = pending.popleft()
+                schedule_next()
+                yield current_date, await task
+        finally:
+            for _, task in pending:
+                task.cancel()
+
+    def _get_parse_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the process pool used to match and decode responses
+
+        Returns:
+            Optional[ProcessPoolExecutor]: Process-wide pool with parse_workers
+                processes, or None when parsing runs in the current thread
+        """
+        if self.parse_workers <= 0:
+            return None
+        return get_parse_pool(self.parse_workers)
+
+    async def _run_cpu_bound(self, pool: Optional[ProcessPoolExecutor],
+                             function: Callable, *args) -> Any:
+        """
+        Run a CPU-bound function in the process pool, or inline without one
+
+        Args:
+            pool: Process pool returned by _get_parse_pool
+            function: Picklable module-level function
+            *args: Picklable arguments
+
+        Returns:
+            Any: Result of the function
+        """
+        if pool is None:
+            return function(*args)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool, function, *args)
+        except BrokenProcessPool:
+            # A worker died: later searches get a new pool
+            discard_parse_pool(pool)
+            raise
+
+    async def _parse_details_async(self, pool: Optional[ProcessPoolExecutor],
+                                   responses: List[Tuple[Dict, str]]
+                                   ) -> List[Tuple[bool, Optional[Dict], CacheTTL]]:
+        """
+        Parse detail responses, spreading them over the process pool if any
+
+        Args:
+            pool: Process pool returned by _get_parse_pool
+            responses: (request parameters, response text) of each detail
+
+        Returns:
+            List[Tuple[bool, Optional[Dict], CacheTTL]]: Result of
+                parse_details for each response, in the same order
+        """
+        if pool is None or not responses:
+            return parse_details(responses)
+
+        chunk_size = -(-len(responses) // self.parse_workers)
+        chunks = [responses[start:start + chunk_size]
+                  for start in range(0, len(responses), chunk_size)]
+        results = await asyncio.gather(
+            *(self._run_cpu_bound(pool, parse_details, chunk) for chunk in chunks)
+        )
+        return [result for chunk_results in results for result in chunk_results]
+
     def search_tenders(self, include_keywords: List[str], exclude_keywords: List[str] = None, 
-                    days_back: int = 30, status: str = "publicada") -> List[Tender]:
+                    days_back: int = 30, status: str = "publicada",
+                    tender_repo: Optional[TenderRepository] = None,
+                    skip_dates: Optional[Set[date]] = None) -> List[Tender]:
         """
         Searches for tenders containing specified keywords
+
+        Collects the whole result of iter_tenders; prefer iter_tenders for
+        long date ranges so results can be persisted as they arrive.
         
         Args:
             include_keywords: List of keywords to search for
@@ -122,22 +625,102 @@ class PublicMarketAPI:
                 "publicada", "cerrada", "desierta", "adjudicada", 
                 "revocada", "suspendida", "todos"
                 Default is "publicada"
+            tender_repo: Repository used to look up known tenders (optional)
+            skip_dates: Days that must not be fetched (optional)
             
         Returns:
             List[Tender]: List of found tenders
         """
+        return list(self.iter_tenders(
+            include_keywords,
+            exclude_keywords,
+            days_back=days_back,
+            status=status,
+            tender_repo=tender_repo,
+            skip_dates=skip_dates,
+        ))
+
+    def iter_tenders(self, include_keywords: List[str], exclude_keywords: List[str] = None,
+                     days_back: int = 30, status: str = "publicada",
+                     tender_repo: Optional[TenderRepository] = None,
+                     skip_dates: Optional[Set[date]] = None,
+                     queue_size: int = SYNC_QUEUE_SIZE) -> Iterator[Tender]:
+        """
+        Searches for tenders containing specified keywords, yielding them as
+        they are parsed
+
+        Args:
+            include_keywords: List of keywords to search for
+            exclude_keywords: List of keywords to exclude (optional)
+            days_back: Number of days to look back
+            status: Status of tenders to search (see search_tenders)
+            tender_repo: Repository used to look up known tenders (optional)
+            skip_dates: Days that must not be fetched (optional)
+            queue_size: Maximum number of parsed tenders waiting to be consumed
+
+        Yields:
+            Tender: Found tenders, in date order
+        """
+        for event in self.iter_search_events(
+            include_keywords,
+            exclude_keywords,
+            days_back=days_back,
+            status=status,
+            tender_repo=tender_repo,
+            skip_dates=skip_dates,
+            queue_size=queue_size,
+        ):
+            if isinstance(event, Tender):
+                yield event
+
+    def iter_search_events(self, include_keywords: List[str],
+                           exclude_keywords: List[str] = None,
+                           days_back: int = 30, status: str = "publicada",
+                           tender_repo: Optional[TenderRepository] = None,
+                           skip_dates: Optional[Set[date]] = None,
+                           queue_size: int = SYNC_QUEUE_SIZE
+                           ) -> Iterator[Union[Tender, DayResult]]:
+        """
+        Searches for tenders containing specified keywords, yielding each
+        parsed tender followed by a DayResult once its day is fully processed
+
+        The async fetch engine runs on a background thread and hands parsed
+        tenders over through a bounded queue: when the consumer falls behind,
+        fetching pauses instead of accumulating results in memory.
+
+        Daily listings are fetched in parallel (up to listing_workers days
+        ahead) and processed in date order. Details of the tenders matched on
+        each day are fetched concurrently, with at most max_concurrency
+        requests in flight.
+
+        When a repository is given, the search is incremental: details are
+        only requested for tenders that are not stored yet or whose listing
+        status or closing date differ from the stored ones. The number of
+        tenders skipped this way is left in skipped_unchanged. The repository
+        is queried from the fetch thread, so it must not share its session
+        with the consumer.
+
+        Days whose listing could not be fetched produce no DayResult, so
+        callers tracking sync progress never mark them as done.
+
+        Args:
+            include_keywords: List of keywords to search for
+            exclude_keywords: List of keywords to exclude (optional)
+            days_back: Number of days to look back
+            status: Status of tenders to search (see search_tenders)
+            tender_repo: Repository used to look up known tenders (optional)
+            skip_dates: Days that must not be fetched (optional)
+            queue_size: Maximum number of parsed tenders waiting to be consumed
+
+        Yields:
+            Union[Tender, DayResult]: Found tenders and day summaries, in date order
+        """
         # Validate status
-        valid_statuses = {
-            "publicada", "cerrada", "desierta", "adjudicada", 
-            "revocada", "suspendida", "todos"
-        }
-        
-        if status.lower() not in valid_statuses:
+        if status.lower() not in SEARCH_STATUSES:
             self.logger.warning(f"Invalid status '{status}'. Using default 'publicada'")
             status = "publicada"
         
         exclude_keywords = exclude_keywords or []
-        found_tenders = []
         end_date = date.today()
         start_date = end_date - timedelta(days=days_back)
 
@@ -145,58 +728,233 @@ class PublicMarketAPI:
         self.logger.info(f"Include keywords: {include_keywords}")
         self.logger.info(f"Exclude keywords: {exclude_keywords}")
         self.logger.info(f"Status filter: {status}")
+        self.logger.info(f"Max concurrent requests: {self.max_concurrency}")
+        self.logger.info(f"Parallel listing days: {self.listing_workers}")
+        self.logger.info(f"Parse worker processes: {self.parse_workers}")
+        self.logger.info(f"Incremental sync: {tender_repo is not None}")
+
+        skip_dates = skip_dates or set()
+        dates = [start_date + timedelta(days=offset)
+                 for offset in range((end_date - start_date).days + 1)]
+        dates = [day for day in dates if day not in skip_dates]
+        if skip_dates:
+            self.logger.info(f"Days left to fetch: {len(dates)}")
+
+        self.skipped_unchanged = 0
+        results = queue.Queue(maxsize=max(1, queue_size))
+        stop = threading.Event()
+
+        def emit(item) -> bool:
+            # Block while the queue is full, unless the consumer went away
+            while not stop.is_set():
+                try:
+                    results.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
 
-        current_date = start_date
-        while current_date <= end_date:
+        def produce():
             try:
-                params = {
-                    "ticket": self.ticket,
-                    "fecha": current_date.strftime("%d%m%Y"),
-                    "codigo": None,
-                    "estado": None if status.lower() == "todos" else status.lower()
-                }
-
-                data = self._make_request(params)
-                if not data:
-                    current_date += timedelta(days=1)
-                    continue
+                asyncio.run(self._search_tenders_async(
+                    include_keywords, exclude_keywords, dates, status, emit, tender_repo
+                ))
+                emit(_END_OF_RESULTS)
+            except Exception as e:
+                emit(e)
+
+        producer = threading.Thread(target=produce, name="tender-fetch", daemon=True)
+        producer.start()
+
+        found_count = 0
+        try:
+            while True:
+                item = results.get()
+                if item is _END_OF_RESULTS:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                if isinstance(item, Tender):
+                    found_count += 1
+                yield item
+        finally:
+            stop.set()
+            producer.join()
+
+        self.logger.info(f"Process completed. Total found: {found_count}")
+        self.logger.info(f"Unchanged tenders skipped: {self.skipped_unchanged}")
+        if self.cache:
+            self.logger.info(f"Response cache: {self.cache.stats()}")
+
+    async def _search_tenders_async(self, include_keywords: List[str],
+                                    exclude_keywords: List[str], dates: List[date],
+                                    status: str,
+                                    emit: Callable[[Union[Tender, DayResult]], bool],
+                                    tender_repo: Optional[TenderRepository] = None) -> None:
+        """
+        Async engine behind iter_search_events
+
+        Args:
+            include_keywords: List of keywords to search for
+            exclude_keywords: List of keywords to exclude
+            dates: Days to search, in order
+            status: Validated status filter
+            emit: Blocking callback receiving each parsed tender and day
+                summary; returns False when the consumer stopped and the
+                search must end
+            tender_repo: Repository used to look up known tenders (optional)
+        """
+        seen_codes = set()
+        estado = None if status.lower() == "todos" else status.lower()
+        pool = self._get_parse_pool()
 
-                if "Listado" not in data:
+        async def load_day(current_date: date) -> Optional[Tuple[int, List[Dict]]]:
+            # Fetch and match one day; runs ahead of the day being processed
+            try:
+                params = self._listing_params(current_date, estado)
+                body, cached = await self._load_body_async(session, params)
+                if body is None:
+                    return None
+
+                # The response text is decoded where it is matched
+                parsed = await self._run_cpu_bound(
+                    pool, parse_listing, params, body, include_keywords, exclude_keywords
+                )
+                if parsed is None:
                     self.logger.warning(f"No listing found for date {current_date}")
-                    current_date += timedelta(days=1)
-                    continue
+                    return None
 
-                tenders = data["Listado"]
-                self.logger.info(f"Tenders found for {current_date}: {len(tenders)}")
-
-                for tender_data in tenders:
-                    try:
-                        if self._matches_keyword_criteria(tender_data, include_keywords, exclude_keywords):
-                            tender_code = tender_data.get("CodigoExterno")
-                            if not tender_code:
-                                continue
-
-                            detailed_data = self.get_tender_details(tender_code)
-                            if not detailed_data:
-                                continue
-
-                            tender = self._parse_tender(detailed_data)
-                            if tender:
-                                found_tenders.append(tender)
-                                self.logger.debug(
-                                    f"Tender {tender.code} matched keywords and was added"
-                                )
-                    except Exception as e:
-                        self.logger.error(f"Error processing tender: {str(e)}")
-                        continue
+                listed_count, listing_matches, ttl = parsed
+                if not cached:
+                    await self._store_bodies_async([(params, body, ttl)])
+                self.logger.info(f"Tenders found for {current_date}: {listed_count}")
+                return listed_count, listing_matches
 
             except Exception as e:
                 self.logger.error(f"Error processing date {current_date}: {str(e)}")
+                return None
 
-            current_date += timedelta(days=1)
+        async with self._create_async_session() as session:
+            async for current_date, loaded in self._iter_days_async(dates, load_day):
+                if not await self._process_day_async(
+                    session, pool, current_date, loaded, seen_codes, emit, tender_repo
+                ):
+                    return
+
+    async def _process_day_async(self, session: aiohttp.ClientSession,
+                                 pool: Optional[ProcessPoolExecutor], current_date: date,
+                                 loaded: Optional[Tuple[int, List[Dict]]], seen_codes: Set[str],
+                                 emit: Callable[[Union[Tender, DayResult]], bool],
+                                 tender_repo: Optional[TenderRepository] = None) -> bool:
+        """
+        Fetch the details of the matches of one day and emit its tenders
 
-        self.logger.info(f"Process completed. Total found: {len(found_tenders)}")
-        return found_tenders
+        Args:
+            session: aiohttp session created by _create_async_session
+            pool: Process pool returned by _get_parse_pool
+            current_date: Day being processed
+            loaded: Listing size and compact matches of the day, or None if
+                the listing could not be fetched
+            seen_codes: Codes already handled by this search, updated in place
+            emit: Blocking callback receiving tenders and day summaries
+            tender_repo: Repository used to look up known tenders (optional)
+
+        Returns:
+            bool: False when the consumer stopped and the search must end
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            if loaded is None:
+                return True
+
+            listed_count, listing_matches = loaded
+            matched = {}
+            for tender_data in listing_matches:
+                tender_code = tender_data["CodigoExterno"]
+                if tender_code in seen_codes:
+                    continue
+
+                seen_codes.add(tender_code)
+                matched[tender_code] = tender_data
+
+            matched_codes = list(matched)
+            if tender_repo is not None and matched_codes:
+                # Blocking query: keep it off the loop fetching the other days.
+                # Days are processed one at a time, so the session is never shared
+                known_tenders = await loop.run_in_executor(
+                    None, tender_repo.get_known_tenders, matched_codes
+                )
+                matched_codes = [
+                    code for code in matched_codes
+                    if self._has_listing_changes(matched[code], known_tenders.get(code))
+                ]
+                self.skipped_unchanged += len(matched) - len(matched_codes)
+
+            fetched = [
+                (params, body, cached)
+                for params, body, cached in await self._fetch_detail_bodies_async(
+                    session, matched_codes
+                )
+                if body is not None
+            ]
+            parsed = await self._parse_details_async(
+                pool, [(params, body) for params, body, _ in fetched]
+            )
+            await self._store_bodies_async([
+                (params, body, ttl)
+                for (params, body, cached), (_, _, ttl) in zip(fetched, parsed)
+                if not cached
+            ])
+            failed_count = len(matched_codes) - sum(1 for found, _, _ in parsed if found)
+
+            tenders = [self.decoder.build(fields) for _, fields, _ in parsed if fields]
+            for tender in tenders:
+                self.logger.debug(f"Tender {tender.code} matched keywords and was added")
+                if not await loop.run_in_executor(None, emit, tender):
+                    return False
+
+            day_result = DayResult(
+                day=current_date,
+                listed=listed_count,
+                matched=len(matched),
+                fetched=len(matched_codes),
+                failed=failed_count,
+            )
+            return await loop.run_in_executor(None, emit, day_result)
+
+        except Exception as e:
+            self.logger.error(f"Error processing date {current_date}: {str(e)}")
+            return True
+
+    def _has_listing_changes(self, tender_data: Dict,
+                             known: Optional[Tuple[Optional[int], Optional[datetime]]]) -> bool:
+        """
+        Check if a listed tender needs its details fetched
+
+        Args:
+            tender_data: Tender entry from a daily listing
+            known: Stored (status_code, closing_date), or None if not stored
+
+        Returns:
+            bool: True if the tender is new or its status or closing date changed
+        """
+        if known is None:
+            return True
+
+        known_status, known_closing = known
+        if safe_int(tender_data.get("CodigoEstado")) != known_status:
+            return True
+
+        if "FechaCierre" in tender_data:
+            closing_date = parse_date(tender_data.get("FechaCierre"))
+            if closing_date:
+                closing_date = closing_date.replace(tzinfo=None)
+            if known_closing:
+                known_closing = known_closing.replace(tzinfo=None)
+            if closing_date != known_closing:
+                return True
+
+        return False
 
     def _contains_keywords(self, tender: Dict, keywords: List[str]) -> bool:
         """
@@ -226,130 +984,7 @@ class PublicMarketAPI:
         Returns:
             Optional[Tender]: Parsed tender object or None if parsing fails
         """
-        if not tender_data or not isinstance(tender_data, dict):
-            self.logger.warning("Invalid or empty tender data received")
-            return None
-
-        try:
-            # Get nested dictionaries with safe defaults
-            comprador = tender_data.get("Comprador") or {}
-            fechas = tender_data.get("Fechas") or {}
-            adjudicacion = tender_data.get("Adjudicacion") or {}
-            items_data = tender_data.get("Items") or {}
-
-            # Verificar código obligatorio
-            code = tender_data.get("CodigoExterno")
-            if not code:
-                self.logger.warning("Tender data missing required code")
-                return None
-
-            # Parse items and awarded suppliers
-            try:
-                items = self._parse_items(items_data)
-            except Exception as e:
-                self.logger.warning(f"Error parsing items: {str(e)}")
-                items = None
-
-            try:
-                awarded_suppliers = self._parse_awarded_suppliers(tender_data)
-            except Exception as e:
-                self.logger.warning(f"Error parsing awarded suppliers: {str(e)}")
-                awarded_suppliers = None
-
-            return Tender(
-                # Identificación y datos básicos
-                code=code,
-                name=tender_data.get("Nombre"),
-                description=tender_data.get("Descripcion"),
-                status=tender_data.get("Estado"),
-                status_code=safe_int(tender_data.get("CodigoEstado")),
-                api_version=tender_data.get("Version"),
-                # Clasificación y tipo
-                tender_type=TenderType.from_value(tender_data.get("Tipo")),
-                currency=Currency.from_value(tender_data.get("Moneda")),
-                bidding_stages=safe_int(tender_data.get("Etapas")),
-                bidding_stages_status=safe_int(tender_data.get("EstadoEtapas")),
-                # Información financiera
-                estimated_amount=safe_float(tender_data.get("MontoEstimado")),
-                estimation_type=EstimationType.from_value(tender_data.get("Estimacion")),
-                amount_visibility=safe_bool(tender_data.get("VisibilidadMonto")),
-                payment_modality=PaymentModality.from_value(tender_data.get("Modalidad")),
-                payment_type=PaymentType.from_value(tender_data.get("TipoPago")),
-                financing_source=str(tender_data.get('FuenteFinanciamiento')) if tender_data.get('FuenteFinanciamiento') else None,
-                # Información de la organización
-                organization=comprador.get("NombreOrganismo"),
-                organization_code=comprador.get("CodigoOrganismo"),
-                organization_tax_id=comprador.get("RutUnidad"),
-                buying_unit=comprador.get("NombreUnidad"),
-                buying_unit_code=comprador.get("CodigoUnidad"),
-                buying_unit_address=comprador.get("DireccionUnidad"),
-                buying_unit_region=comprador.get("RegionUnidad"),
-                buying_unit_commune=comprador.get("ComunaUnidad"),
-                # Información del usuario
-                user_tax_id=comprador.get("RutUsuario"),
-                user_code=comprador.get("CodigoUsuario"),
-                user_name=comprador.get("NombreUsuario"),
-                user_position=comprador.get("CargoUsuario"),
-                # Fechas
-                creation_date=parse_date(fechas.get("FechaCreacion")),
-                publication_date=parse_date(fechas.get("FechaPublicacion")),
-                closing_date=parse_date(fechas.get("FechaCierre")),
-                questions_deadline=parse_date(fechas.get("FechaFinal")),
-                answers_publication_date=parse_date(fechas.get("FechaPubRespuestas")),
-                technical_opening_date=parse_date(fechas.get("FechaActoAperturaTecnica")),
-                economic_opening_date=parse_date(fechas.get("FechaActoAperturaEconomica")),
-                award_date=parse_date(fechas.get("FechaAdjudicacion")),
-                estimated_award_date=parse_date(fechas.get("FechaEstimadaAdjudicacion")),
-                site_visit_date=parse_date(fechas.get("FechaVisitaTerreno")),
-                background_delivery_date=parse_date(fechas.get("FechaEntregaAntecedentes")),
-                physical_support_date=parse_date(fechas.get("FechaSoporteFisico")),
-                evaluation_date=parse_date(fechas.get("FechaTiempoEvaluacion")),
-                estimated_signing_date=parse_date(fechas.get("FechaEstimadaFirma")),
-                user_defined_date=parse_date(fechas.get("FechasUsuario")),
-                # Unidades de tiempo
-                evaluation_time_unit=TimeUnit.from_value(tender_data.get("UnidadTiempo")),
-                contract_time_unit=TimeUnit.from_value(
-                    tender_data.get("UnidadTiempoContratoLicitacion")
-                ),
-                # Información de contacto
-                payment_responsible_name=tender_data.get("NombreResponsablePago"),
-                payment_responsible_email=tender_data.get("EmailResponsablePago"),
-                contract_responsible_name=tender_data.get("NombreResponsableContrato"),
-                contract_responsible_email=tender_data.get("EmailResponsableContrato"),
-                contract_responsible_phone=tender_data.get("FonoResponsableContrato"),
-                # Información del contrato
-                allows_subcontracting=safe_bool(tender_data.get("SubContratacion")),
-                contract_duration=safe_int(tender_data.get("TiempoDuracionContrato")),
-                contract_duration_type=tender_data.get("TipoDuracionContrato"),
-                is_renewable=safe_bool(tender_data.get("EsRenovable")),
-                renewal_time_value=safe_int(tender_data.get("ValorTiempoRenovacion")),
-                renewal_time_period=tender_data.get("PeriodoTiempoRenovacion"),
-                # Control y regulación
-                requires_comptroller=safe_bool(tender_data.get("TomaRazon")),
-                technical_offer_publicity=safe_int(tender_data.get("EstadoPublicidadOfertas")),
-                publicity_justification=tender_data.get("JustificacionPublicidad"),
-                hiring_prohibition=tender_data.get("ProhibicionContratacion"),
-                amount_justification=tender_data.get("JustificacionMontoEstimado"),
-                deadline_extension=safe_int(tender_data.get("ExtensionPlazo")),
-                # Flags y estados
-                is_public_bid=safe_bool(tender_data.get("TipoConvocatoria")),
-                is_informed=safe_bool(tender_data.get("Informada")),
-                is_base_type=safe_bool(tender_data.get("EsBaseTipo")),
-                # Información de adjudicación
-                award_type=AdministrativeActType.from_value(adjudicacion.get("Tipo")),
-                award_document_number=adjudicacion.get("Numero"),
-                award_document_date=parse_date(adjudicacion.get("Fecha")),
-                number_of_bidders=safe_int(adjudicacion.get("NumeroOferentes")),
-                award_act_url=adjudicacion.get("UrlActa"),
-                complaint_count=safe_int(tender_data.get("CantidadReclamos")),
-                # Datos adicionales
-                items=items,
-                awarded_suppliers=awarded_suppliers,
-            )
-
-        except Exception as e:
-            self.logger.error(f"Error parsing tender details: {str(e)}")
-            return None
+        return self.decoder.decode(tender_data)
 
     def _parse_items(self, items_data: Dict) -> List[Dict]:
         """
@@ -361,44 +996,7 @@ class PublicMarketAPI:
         Returns:
             List[Dict]: List of parsed items
         """
-        items = []
-
-        # Return empty list if items_data is None
-        if not items_data:
-            return items
-
-        # Get listado with empty list as default
-        listado = items_data.get("Listado", []) or []
-
-        for item in listado:
-            if not isinstance(item, dict):
-                continue
-
-            parsed_item = {
-                "correlative": item.get("Correlativo"),
-                "category_code": item.get("CodigoCategoria"),
-                "category_name": item.get("Categoria"),
-                "product_code": item.get("CodigoProducto"),
-                "product_name": item.get("NombreProducto"),
-                "description": item.get("Descripcion"),
-                "quantity": safe_float(item.get("Cantidad")),
-                "unit": item.get("UnidadMedida"),
-                "tender_status_code": safe_int(item.get("CodigoEstadoLicitacion")),
-            }
-
-            # Only add award information if it exists
-            adjudicacion = item.get("Adjudicacion")
-            if isinstance(adjudicacion, dict):
-                parsed_item["award"] = {
-                    "supplier_tax_id": adjudicacion.get("RutProveedor"),
-                    "supplier_name": adjudicacion.get("NombreProveedor"),
-                    "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
-                    "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
-                }
-
-            items.append(parsed_item)
-
-        return items
+        return decode_items(items_data)
 
     def _parse_awarded_suppliers(self, tender_data: Dict) -> List[Dict]:
         """
@@ -410,42 +1008,7 @@ class PublicMarketAPI:
         Returns:
             List[Dict]: List of awarded suppliers
         """
-        awarded_suppliers = []
-
-        # Return empty list if tender_data is None
-        if not tender_data:
-            return awarded_suppliers
-
-        # Get items data safely
-        items_data = tender_data.get("Items", {})
-        if not items_data:
-            return awarded_suppliers
-
-        # Get listado with empty list as default
-        items = items_data.get("Listado", []) or []
-
-        for item in items:
-            if not isinstance(item, dict):
-                continue
-
-            adjudicacion = item.get("Adjudicacion")
-            if not isinstance(adjudicacion, dict):
-                continue
-
-            supplier = {
-                "tax_id": adjudicacion.get("RutProveedor"),
-                "name": adjudicacion.get("NombreProveedor"),
-                "item_correlative": item.get("Correlativo"),
-                "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
-                "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
-            }
-
-            # Only add if we have at least tax_id or name
-            if supplier["tax_id"] or supplier["name"]:
-                if supplier not in awarded_suppliers:
-                    awarded_suppliers.append(supplier)
-
-        return awarded_suppliers
+        return decode_awarded_suppliers(tender_data)
 
     def _matches_keyword_criteria(self, tender: Dict, include_keywords: List[str], 
                                 exclude_keywords: List[str]) -> bool:
@@ -460,30 +1023,26 @@ class PublicMarketAPI:
         Returns:
             bool: True if tender matches criteria
         """
-        if not tender:
-            return False
-
-        # Create normalized search text without accents
-        search_text = remove_accents(
-            f"{tender.get('Nombre', '')} {tender.get('Descripcion', '')}"
-        ).lower()
-
-        # Normalize keywords
-        normalized_exclude = [remove_accents(keyword).lower() for keyword in exclude_keywords]
-        normalized_include = [remove_accents(keyword).lower() for keyword in include_keywords]
+        matcher = get_keyword_matcher(include_keywords, exclude_keywords)
+        return self._matches_compiled_criteria(tender, matcher)
 
-        # Check if any exclude keyword is present
-        if any(keyword in search_text for keyword in normalized_exclude):
-            self.logger.debug(f"Tender excluded due to matching exclude keyword")
+    def _matches_compiled_criteria(self, tender: Dict, matcher: KeywordMatcher) -> bool:
+        """
+        Check if tender matches keyword criteria compiled into a matcher
+        
+        Args:
+            tender: Tender data dictionary
+            matcher: Matcher compiled from the include and exclude keywords
+            
+        Returns:
+            bool: True if tender matches criteria
+        """
+        if not tender:
             return False
 
-        # If no include keywords, accept all non-excluded
-        if not normalized_include:
-            return True
-
-        # Check if any include keyword is present
-        matches = any(keyword in search_text for keyword in normalized_include)
+        search_text = f"{tender.get('Nombre', '')} {tender.get('Descripcion', '')}"
+        matches = matcher.matches(search_text)
         if matches:
-            self.logger.debug(f"Tender matched include keyword")
-        
+            self.logger.debug(f"Tender matched keyword criteria")
+
         return matches
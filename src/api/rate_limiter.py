@@ -0,0 +1,235 @@
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from src.config.settings import API_RATE_BURST, API_RATE_LIMIT, API_RATE_LIMIT_FILE
+from src.utils.logger import setup_logger
+
+
+class RateLimiter:
+    """
+    Adaptive token bucket shared by every client of the Public Market API
+
+    The bucket state lives in a small JSON file guarded by an exclusive file
+    lock, so threads, coroutines and separate worker processes all draw from
+    the same budget. The refill rate follows an AIMD policy: it is halved on
+    429 and 5xx responses and grows back step by step on successes, never
+    above the configured maximum. It is halved at most once per round of
+    requests: responses to requests sent before the last decrease were
+    answered at the old rate and do not lower it again. Retry-After headers
+    block the whole bucket until the upstream is willing to serve again.
+
+    The state file is locked and read on every request, so coroutines go
+    through it in a worker thread instead of on the event loop.
+    """
+
+    DECREASE_FACTOR = 0.5
+    INCREASE_STEP = 0.1
+    DEFAULT_BLOCK_SECONDS = 1.0
+
+    def __init__(self, rate: float = API_RATE_LIMIT, burst: int = API_RATE_BURST,
+                 state_path: str = API_RATE_LIMIT_FILE):
+        """
+        Initialize the limiter
+
+        Args:
+            rate: Maximum sustained requests per second
+            burst: Maximum number of requests that can be sent back to back
+            state_path: File holding the shared bucket state
+        """
+        self.max_rate = max(0.01, float(rate))
+        self.min_rate = self.max_rate / 10
+        self.burst = max(1, int(burst))
+        self.state_path = state_path
+        self.logger = setup_logger(__name__)
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(state_path))
+        os.makedirs(directory, exist_ok=True)
+
+    def _initial_state(self, now: float) -> Dict:
+        """Bucket state used when the state file is empty or unreadable"""
+        return {
+            "tokens": float(self.burst),
+            "rate": self.max_rate,
+            "updated": now,
+            "blocked_until": 0.0,
+            "decreased_at": 0.0,
+        }
+
+    def _update_state(self, update: Callable[[Dict, float], float]) -> float:
+        """
+        Apply an update to the shared state under the thread and file locks
+
+        Args:
+            update: Function receiving the state and the current time, which
+                mutates the state and returns a value
+
+        Returns:
+            float: Value returned by update
+        """
+        with self._lock:
+            with open(self.state_path, "a+") as state_file:
+                if fcntl:
+                    fcntl.flock(state_file, fcntl.LOCK_EX)
+                try:
+                    now = time.time()
+                    state_file.seek(0)
+                    try:
+                        state = json.loads(state_file.read() or "{}")
+                    except ValueError:
+                        state = {}
+                    if not state:
+                        state = self._initial_state(now)
+
+                    # The configured maximum may have changed between runs
+                    state["rate"] = min(max(state["rate"], self.min_rate), self.max_rate)
+
+                    result = update(state, now)
+
+                    state_file.seek(0)
+                    state_file.truncate()
+                    json.dump(state, state_file)
+                    state_file.flush()
+                    return result
+                finally:
+                    if fcntl:
+                        fcntl.flock(state_file, fcntl.LOCK_UN)
+
+    def _reserve(self, state: Dict, now: float) -> float:
+        """
+        Take one token from the bucket, going into debt if it is empty
+
+        Returns:
+            float: Seconds the caller must wait before sending its request
+        """
+        elapsed = max(0.0, now - state["updated"])
+        state["tokens"] = min(float(self.burst), state["tokens"] + elapsed * state["rate"])
+        state["updated"] = now
+        state["tokens"] -= 1
+
+        debt_wait = -state["tokens"] / state["rate"] if state["tokens"] < 0 else 0.0
+        blocked_wait = max(0.0, state["blocked_until"] - now)
+        return max(debt_wait, blocked_wait)
+
+    def acquire(self) -> float:
+        """
+        Block the current thread until a request may be sent
+
+        Returns:
+            float: Time the request is sent at, to pass to record
+        """
+        wait = self._update_state(self._reserve)
+        if wait > 0:
+            self.logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            time.sleep(wait)
+        return time.time()
+
+    async def acquire_async(self) -> float:
+        """
+        Suspend the current coroutine until a request may be sent
+
+        Returns:
+            float: Time the request is sent at, to pass to record_async
+        """
+        wait = await asyncio.to_thread(self._update_state, self._reserve)
+        if wait > 0:
+            self.logger.debug(f"Rate limit reached, waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return time.time()
+
+    def record(self, status_code: int, retry_after: Optional[str] = None,
+               sent_at: Optional[float] = None) -> None:
+        """
+        Adapt the refill rate to the outcome of a request
+
+        Args:
+            status_code: HTTP status of the response
+            retry_after: Value of the Retry-After header, if any
+            sent_at: Time the request was sent, as returned by acquire;
+                None counts the response as sent now
+        """
+        throttled = status_code == 429 or status_code >= 500
+        block_seconds = parse_retry_after(retry_after)
+        if block_seconds is None and status_code == 429:
+            block_seconds = self.DEFAULT_BLOCK_SECONDS
+
+        def update(state: Dict, now: float) -> Optional[float]:
+            lowered_rate = None
+            if throttled:
+                # Requests in flight at the last decrease do not lower it again
+                if (sent_at if sent_at is not None else now) >= state.get("decreased_at", 0.0):
+                    state["rate"] = max(self.min_rate, state["rate"] * self.DECREASE_FACTOR)
+                    state["decreased_at"] = now
+                    lowered_rate = state["rate"]
+            else:
+                state["rate"] = min(self.max_rate, state["rate"] + self.INCREASE_STEP)
+            if block_seconds:
+                state["blocked_until"] = max(state["blocked_until"], now + block_seconds)
+            return lowered_rate
+
+        rate = self._update_state(update)
+        if rate is not None:
+            self.logger.warning(
+                f"Upstream returned {status_code}, rate lowered to {rate:.2f} req/s"
+            )
+
+    async def record_async(self, status_code: int, retry_after: Optional[str] = None,
+                           sent_at: Optional[float] = None) -> None:
+        """Adapt the refill rate from a coroutine, see record"""
+        await asyncio.to_thread(self.record, status_code, retry_after, sent_at)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either in seconds or as an HTTP date
+
+    Args:
+        value: Raw header value
+
+    Returns:
+        Optional[float]: Seconds to wait, or None if missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(state_path: str = API_RATE_LIMIT_FILE) -> RateLimiter:
+    """
+    Get the process-wide limiter for a state file
+
+    Args:
+        state_path: File holding the shared bucket state
+
+    Returns:
+        RateLimiter: Limiter shared by every API client of this process
+    """
+    with _limiters_lock:
+        if state_path not in _limiters:
+            _limiters[state_path] = RateLimiter(state_path=state_path)
+        return _limiters[state_path]
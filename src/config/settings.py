@@ -1,4 +1,5 @@
 import os
+import tempfile
 from dotenv import load_dotenv
 
 # If .env file exists, load environment variables from it
@@ -8,10 +9,55 @@ if os.path.exists('.env'):
 # API Configuration
 API_BASE_URL = "https://api.mercadopublico.cl/servicios/v1/publico/licitaciones.json"
 API_TICKET = os.getenv('TICKET_KEY')
+API_MAX_CONCURRENCY = int(os.getenv('API_MAX_CONCURRENCY', '10'))
+API_LISTING_WORKERS = int(os.getenv('API_LISTING_WORKERS', '8'))
+# Processes used to match listings and decode details (0 = in the fetch thread)
+API_PARSE_WORKERS = int(os.getenv('API_PARSE_WORKERS', '0'))
+
+# Rate Limiting Configuration (shared by every process using the same file)
+API_RATE_LIMIT = float(os.getenv('API_RATE_LIMIT', '5'))
+API_RATE_BURST = int(os.getenv('API_RATE_BURST', '10'))
+API_RATE_LIMIT_FILE = os.getenv(
+    'API_RATE_LIMIT_FILE',
+    os.path.join(tempfile.gettempdir(), 'mercadopublico_rate_limit.json')
+)
+
+# Response Cache Configuration (TTLs in seconds)
+API_CACHE_ENABLED = os.getenv('API_CACHE_ENABLED', 'true').lower() in ('1', 'true', 'yes')
+API_CACHE_PATH = os.getenv('API_CACHE_PATH', os.path.join('data', 'api_cache.sqlite3'))
+API_CACHE_MAX_SIZE_MB = int(os.getenv('API_CACHE_MAX_SIZE_MB', '256'))
+API_CACHE_TTL_LISTING_TODAY = int(os.getenv('API_CACHE_TTL_LISTING_TODAY', '600'))
+API_CACHE_TTL_LISTING_PAST = int(os.getenv('API_CACHE_TTL_LISTING_PAST', '21600'))
+API_CACHE_TTL_DETAIL_OPEN = int(os.getenv('API_CACHE_TTL_DETAIL_OPEN', '3600'))
+API_CACHE_TTL_DETAIL_CLOSED = int(os.getenv('API_CACHE_TTL_DETAIL_CLOSED', '604800'))
+
+# Sync Pipeline Configuration
+SYNC_CHUNK_SIZE = int(os.getenv('SYNC_CHUNK_SIZE', '100'))
+SYNC_QUEUE_SIZE = int(os.getenv('SYNC_QUEUE_SIZE', '500'))
+SYNC_HOT_DAYS = int(os.getenv('SYNC_HOT_DAYS', '2'))
 
 # Database Configuration
 DATABASE_URL = os.getenv('DATABASE_URL')
 
+# SQLite Profile (applied to every connection)
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv('SQLITE_BUSY_TIMEOUT_MS', '30000'))
+SQLITE_MMAP_SIZE_MB = int(os.getenv('SQLITE_MMAP_SIZE_MB', '256'))
+SQLITE_CACHE_SIZE_MB = int(os.getenv('SQLITE_CACHE_SIZE_MB', '64'))
+
+# Database Writer Configuration (single writer thread per process)
+DB_WRITER_BATCH_SIZE = int(os.getenv('DB_WRITER_BATCH_SIZE', '20'))
+DB_WRITER_QUEUE_SIZE = int(os.getenv('DB_WRITER_QUEUE_SIZE', '100'))
+
+# Job Runner Configuration (python -m src.pipeline.jobs, one per deployment)
+JOB_WORKERS = int(os.getenv('JOB_WORKERS', '1'))
+# Seconds between checks for queued jobs
+JOB_POLL_INTERVAL = float(os.getenv('JOB_POLL_INTERVAL', '1'))
+# Seconds between progress reports of a job, besides one per day fetched
+JOB_PROGRESS_INTERVAL = float(os.getenv('JOB_PROGRESS_INTERVAL', '2'))
+
+# Export Configuration
+EXPORT_BATCH_SIZE = int(os.getenv('EXPORT_BATCH_SIZE', '1000'))
+
 # Logging Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -0,0 +1,67 @@
+# src/database/async_base.py
+from sqlalchemy import event
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.config.settings import DATABASE_URL, SQLITE_BUSY_TIMEOUT_MS
+from src.database.base import configure_sqlite_connection
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Async driver used for each dialect of DATABASE_URL
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+def get_async_engine_config():
+    """
+    Configure the async database engine based on DATABASE_URL
+
+    The same database as the sync engine, reached through asyncpg or
+    aiosqlite, so the API routes can wait for queries without blocking
+    the event loop.
+
+    Returns:
+        AsyncEngine: SQLAlchemy async engine
+    """
+    url = make_url(DATABASE_URL)
+    dialect = url.get_backend_name()
+    if dialect not in ASYNC_DRIVERS:
+        raise ValueError(f"Unsupported database type: {url.drivername}")
+
+    async_url = url.set(drivername=ASYNC_DRIVERS[dialect])
+
+    if dialect == "postgresql":
+        return create_async_engine(
+            async_url,
+            pool_size=5,
+            max_overflow=10,
+            pool_timeout=30,
+            pool_recycle=1800,
+            echo=False
+        )
+
+    sqlite_engine = create_async_engine(
+        async_url,
+        connect_args={"timeout": SQLITE_BUSY_TIMEOUT_MS / 1000},
+        echo=False
+    )
+    event.listen(sqlite_engine.sync_engine, "connect", configure_sqlite_connection)
+    return sqlite_engine
+
+try:
+    async_engine = get_async_engine_config()
+    logger.info(f"Async database engine configured for: {async_engine.url.drivername}")
+
+    # Loaded objects stay usable after commit, as nothing is lazily refreshed
+    AsyncSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+except Exception as e:
+    logger.error(f"Failed to configure async database: {str(e)}")
+    raise
+
+async def get_async_db():
+    """Async database session generator"""
+    async with AsyncSessionLocal() as db:
+        yield db
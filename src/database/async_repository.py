@@ -0,0 +1,246 @@
+# src/database/async_repository.py
+from typing import List, Optional, Tuple
+from datetime import datetime
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.database.repository import (
+    LISTING_COLUMNS,
+    LISTING_ORDER,
+    keyset_condition,
+    listing_options,
+    table_order,
+    tender_filter_conditions,
+)
+from src.database.stats import TOTAL_DIMENSION, TOTAL_KEY, stats_query
+from src.models.job import Job
+from src.models.tender import Tender
+from src.models.keywords import Keyword, KeywordType
+from src.models.tender_stat import TenderStat
+from src.utils.logger import setup_logger
+
+class AsyncTenderRepository:
+    """
+    Read paths of TenderRepository for AsyncSession
+
+    Queries are awaited instead of run on the event loop thread, so a slow
+    query only delays its own request. Relationships are never loaded
+    lazily here; callers only get column attributes.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.logger = setup_logger(__name__)
+
+    @property
+    def dialect(self) -> str:
+        """Name of the database dialect of the session"""
+        return self.db.get_bind().dialect.name
+
+    async def get_tender_by_code(self, code: str) -> Optional[Tender]:
+        """
+        Get a tender by its code, with every column loaded
+
+        Args:
+            code (str): Tender code to search for
+
+        Returns:
+            Optional[Tender]: Found tender or None
+        """
+        result = await self.db.execute(select(Tender).where(Tender.code == code))
+        return result.scalars().first()
+
+    async def get_listing_rows(
+        self,
+        limit: int = 100,
+        cursor: Optional[Tuple[datetime, str]] = None,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Tuple[List[Row], Optional[Tuple[datetime, str]]]:
+        """
+        Get a page of tenders as plain rows of LISTING_COLUMNS
+
+        Same page as TenderRepository.get_tenders_page, without building ORM
+        objects, for callers that only serialize the rows.
+
+        Args:
+            limit (int): Maximum number of records to return
+            cursor (Tuple[datetime, str], optional): (created_at, code) of the
+                last tender of the previous page
+            search (str, optional): Search term for name or description
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+
+        Returns:
+            Tuple[List[Row], Optional[Tuple[datetime, str]]]: Rows of the page
+                and the cursor of the next page, None on the last page
+        """
+        try:
+            conditions = tender_filter_conditions(
+                self.dialect, search, status, start_date, end_date
+            )
+            if cursor is not None:
+                conditions.append(keyset_condition(cursor))
+
+            # One extra row tells whether there is a next page
+            statement = select(*LISTING_COLUMNS).where(*conditions).order_by(
+                *LISTING_ORDER
+            ).limit(limit + 1)
+            rows = (await self.db.execute(statement)).all()
+            if len(rows) <= limit:
+                return rows, None
+
+            rows = rows[:limit]
+            return rows, (rows[-1].created_at, rows[-1].code)
+
+        except Exception as e:
+            self.logger.error(f"Error getting tenders page: {str(e)}")
+            raise
+
+    async def count_tenders(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> int:
+        """
+        Count the tenders matching the listing filters
+
+        Args:
+            search (str, optional): Search term for name or description
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+
+        Returns:
+            int: Number of matching tenders
+        """
+        conditions = tender_filter_conditions(self.dialect, search, status, start_date, end_date)
+        statement = select(func.count()).select_from(Tender).where(*conditions)
+        return (await self.db.execute(statement)).scalar_one()
+
+    async def get_total_tenders(self) -> int:
+        """
+        Get the number of stored tenders from the total stats row
+
+        Reads one row instead of counting the table. Every tender counts
+        towards it, including those without a status.
+
+        Returns:
+            int: Number of tenders
+        """
+        statement = select(TenderStat.tender_count).where(
+            TenderStat.dimension == TOTAL_DIMENSION, TenderStat.key == TOTAL_KEY
+        )
+        return (await self.db.execute(statement)).scalar() or 0
+
+    async def get_tenders_slice(
+        self,
+        offset: int = 0,
+        limit: int = 10,
+        order_by: str = "created_at",
+        descending: bool = True,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tender]:
+        """
+        Get a slice of the sorted tenders table, as tables with numbered pages need
+
+        Args:
+            offset (int): Number of tenders to skip
+            limit (int): Maximum number of records to return
+            order_by (str): Column to sort by, one of SORTABLE_COLUMNS
+            descending (bool): Sort in descending order
+            search (str, optional): Search term for name or description
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+
+        Returns:
+            List[Tender]: Tenders of the slice
+
+        Raises:
+            ValueError: If the column is not sortable
+        """
+        order = table_order(order_by, descending)
+        try:
+            conditions = tender_filter_conditions(
+                self.dialect, search, status, start_date, end_date
+            )
+            statement = select(Tender).options(listing_options()).where(
+                *conditions
+            ).order_by(*order).offset(offset).limit(limit)
+            return list((await self.db.execute(statement)).scalars())
+
+        except Exception as e:
+            self.logger.error(f"Error getting tenders slice: {str(e)}")
+            raise
+
+    async def get_stats(self, dimension: str, limit: int = 100) -> List[TenderStat]:
+        """
+        Get the tender count and estimated amount per key of a dimension
+
+        Args:
+            dimension (str): organization, region, tender_type, month or status
+            limit (int): Maximum number of keys to return
+
+        Returns:
+            List[TenderStat]: Stats of the dimension
+
+        Raises:
+            ValueError: If the dimension is unknown
+        """
+        return list((await self.db.execute(stats_query(dimension, limit))).scalars())
+
+class AsyncKeywordRepository:
+    """Read paths of KeywordRepository for AsyncSession"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.logger = setup_logger(__name__)
+
+    async def get_all_keywords(self) -> List[Keyword]:
+        """
+        Get all keywords
+
+        Returns:
+            List[Keyword]: List of all keywords
+        """
+        return list((await self.db.execute(select(Keyword))).scalars())
+
+    async def get_keywords_by_type(self, type: KeywordType) -> List[Keyword]:
+        """
+        Get keywords by type
+
+        Args:
+            type (KeywordType): Type of keywords to retrieve
+
+        Returns:
+            List[Keyword]: List of keywords of specified type
+        """
+        statement = select(Keyword).where(Keyword.type == type)
+        return list((await self.db.execute(statement)).scalars())
+
+class AsyncJobRepository:
+    """Read paths of JobRepository for AsyncSession"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.logger = setup_logger(__name__)
+
+    async def get_job(self, job_id: int) -> Optional[Job]:
+        """
+        Get a job by its id, as last reported by its worker
+
+        Args:
+            job_id (int): ID of the job
+
+        Returns:
+            Optional[Job]: Found job or None
+        """
+        return await self.db.get(Job, job_id)
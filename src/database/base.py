@@ -1,14 +1,104 @@
 # src/database/base.py
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.engine.url import make_url
-from src.config.settings import DATABASE_URL
+from src.config.settings import (
+    DATABASE_URL,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_MB,
+    SQLITE_MMAP_SIZE_MB,
+)
+from src.database.migrations import run_migrations
 from src.utils.logger import setup_logger
 import os
 
 logger = setup_logger(__name__)
 
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    """
+    Apply the SQLite production profile to a new connection
+
+    WAL lets readers run while a write is in progress, and the busy timeout
+    makes writers of other processes wait for the lock instead of failing
+    with "database is locked".
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE_MB * 1024 * 1024}")
+        # Negative values are in KiB instead of pages
+        cursor.execute(f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_MB * 1024}")
+    finally:
+        cursor.close()
+
+def disable_driver_transactions(dbapi_connection, connection_record):
+    """Leave BEGIN to the engine; pysqlite would otherwise emit a deferred one itself"""
+    dbapi_connection.isolation_level = None
+
+def begin_immediate(connection):
+    """
+    Start a SQLite write transaction
+
+    A deferred transaction reads under a shared lock and upgrades it on its
+    first write, which fails with SQLITE_BUSY if another connection wrote in
+    between. BEGIN IMMEDIATE takes the write lock up front, waiting for it
+    up to the busy timeout, so read-modify-write transactions run one at a
+    time.
+    """
+    connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+def create_sqlite_engine(url):
+    """
+    Create an engine for a SQLite database with the production profile
+
+    Args:
+        url: SQLite database URL
+
+    Returns:
+        Engine: SQLAlchemy engine
+    """
+    db_path = url.database
+    if db_path != ':memory:':
+        # Ensure the directory exists
+        os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
+
+    sqlite_engine = create_engine(
+        url,
+        connect_args={
+            "check_same_thread": False,
+            "timeout": SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
+        echo=False
+    )
+    event.listen(sqlite_engine, "connect", configure_sqlite_connection)
+    return sqlite_engine
+
+def get_write_engine_config(engine):
+    """
+    Configure the engine of write sessions
+
+    On SQLite, a second engine on the same file whose transactions all start
+    with BEGIN IMMEDIATE. Reads stay on the main engine: a long read, such as
+    an export, must not hold the write lock. PostgreSQL serializes writers
+    with row and advisory locks and uses the main engine.
+
+    Args:
+        engine: Main engine
+
+    Returns:
+        Engine: Engine for write sessions
+    """
+    if engine.dialect.name != "sqlite":
+        return engine
+
+    write_engine = create_sqlite_engine(engine.url)
+    event.listen(write_engine, "connect", disable_driver_transactions)
+    event.listen(write_engine, "begin", begin_immediate)
+    return write_engine
+
 def get_engine_config():
     """
     Configure database engine based on DATABASE_URL
@@ -31,16 +121,7 @@ def get_engine_config():
         )
     elif 'sqlite' in url.drivername:
         # SQLite configuration
-        # Ensure the directory exists
-        db_path = url.database
-        if db_path != ':memory:':
-            os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
-        
-        return create_engine(
-            DATABASE_URL,
-            connect_args={"check_same_thread": False},
-            echo=False
-        )
+        return create_sqlite_engine(url)
     else:
         raise ValueError(f"Unsupported database type: {url.drivername}")
 
@@ -51,6 +132,10 @@ try:
     
     # Create session factory
     SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    # Session factory for writes made outside the database writer
+    write_engine = get_write_engine_config(engine)
+    WriteSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=write_engine)
     
     # Create base class for declarative models
     Base = declarative_base()
@@ -64,6 +149,7 @@ def init_db():
     try:
         logger.info("Creating database tables...")
         Base.metadata.create_all(bind=engine)
+        run_migrations(engine)
         logger.info("Database tables created successfully")
     except Exception as e:
         logger.error(f"Error creating database tables: {str(e)}")
@@ -76,3 +162,11 @@ def get_db():
         yield db
     finally:
         db.close()
+
+def get_write_db():
+    """Database session generator for routes that write"""
+    db = WriteSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,342 @@
+# src/database/migrations.py
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Callable, Iterator, List, Set, Tuple
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Kept out of Base.metadata: it belongs to the migration mechanism, not the models
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def _create_index(connection: Connection, name: str, table: str, columns: List[str]) -> None:
+    """Create an index if missing; plain DDL so old migrations never depend on the models"""
+    connection.execute(text(
+        f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"
+    ))
+
+
+def _add_column(connection: Connection, table: str, column: str, column_type: str) -> None:
+    """Add a nullable column if missing; tables created by create_all already have it"""
+    existing = {info["name"] for info in inspect(connection).get_columns(table)}
+    if column not in existing:
+        connection.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}"))
+
+
+def _add_tender_listing_indexes(connection: Connection) -> None:
+    """Indexes behind the filter and ORDER BY patterns of the tender listing"""
+    _create_index(connection, "ix_tenders_created_at_code", "tenders", ["created_at", "code"])
+    _create_index(connection, "ix_tenders_status_created_at", "tenders", ["status", "created_at"])
+    _create_index(connection, "ix_tenders_creation_date", "tenders", ["creation_date"])
+    _create_index(
+        connection, "ix_tenders_status_creation_date", "tenders", ["status", "creation_date"]
+    )
+    _create_index(connection, "ix_tenders_closing_date", "tenders", ["closing_date"])
+    _create_index(
+        connection, "ix_tenders_organization_code_created_at", "tenders",
+        ["organization_code", "created_at"]
+    )
+
+
+def _add_code_to_status_index(connection: Connection) -> None:
+    """Let status filters deliver the full (created_at, code) keyset order"""
+    connection.execute(text("DROP INDEX IF EXISTS ix_tenders_status_created_at"))
+    _create_index(
+        connection, "ix_tenders_status_created_at_code", "tenders",
+        ["status", "created_at", "code"]
+    )
+
+
+def _add_tender_full_text_search(connection: Connection) -> None:
+    """Accent-insensitive full-text index over tender names and descriptions"""
+    if connection.dialect.name == "sqlite":
+        # Standalone FTS5 table keyed by code: tenders has no INTEGER PRIMARY
+        # KEY, so its rowids are not stable enough for an external content table
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS tenders_fts USING fts5("
+            "code, name, description, tokenize = 'unicode61 remove_diacritics 2')"
+        ))
+        delete_row = (
+            "DELETE FROM tenders_fts WHERE tenders_fts MATCH "
+            "'code:\"' || replace(old.code, '\"', '\"\"') || '\"' AND code = old.code;"
+        )
+        insert_row = (
+            "INSERT INTO tenders_fts (code, name, description) "
+            "VALUES (new.code, new.name, new.description);"
+        )
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS tenders_fts_insert AFTER INSERT ON tenders "
+            f"BEGIN {insert_row} END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS tenders_fts_update "
+            f"AFTER UPDATE OF name, description ON tenders BEGIN {delete_row} {insert_row} END"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER IF NOT EXISTS tenders_fts_delete AFTER DELETE ON tenders "
+            f"BEGIN {delete_row} END"
+        ))
+        connection.execute(text("DELETE FROM tenders_fts"))
+        connection.execute(text(
+            "INSERT INTO tenders_fts (code, name, description) "
+            "SELECT code, name, description FROM tenders"
+        ))
+
+    elif connection.dialect.name == "postgresql":
+        # unaccent is not immutable, so the vector is kept by a trigger
+        # instead of a generated column
+        connection.execute(text("CREATE EXTENSION IF NOT EXISTS unaccent"))
+        connection.execute(text(
+            "ALTER TABLE tenders ADD COLUMN IF NOT EXISTS search_vector tsvector"
+        ))
+        connection.execute(text(
+            """
+            CREATE OR REPLACE FUNCTION tenders_search_vector_update() RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector :=
+                    setweight(to_tsvector('simple', unaccent(coalesce(NEW.name, ''))), 'A') ||
+                    setweight(to_tsvector('simple', unaccent(coalesce(NEW.description, ''))), 'B');
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """
+        ))
+        connection.execute(text("DROP TRIGGER IF EXISTS tenders_search_vector ON tenders"))
+        connection.execute(text(
+            "CREATE TRIGGER tenders_search_vector "
+            "BEFORE INSERT OR UPDATE OF name, description ON tenders "
+            "FOR EACH ROW EXECUTE FUNCTION tenders_search_vector_update()"
+        ))
+        # Fire the trigger once for the existing rows
+        connection.execute(text("UPDATE tenders SET name = name"))
+        connection.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_tenders_search_vector "
+            "ON tenders USING GIN (search_vector)"
+        ))
+
+
+def _add_tender_item_indexes(connection: Connection) -> None:
+    """Add the award columns of tender items, index them and fill them from the items JSON"""
+    for column, column_type in (
+        ("supplier_tax_id", "VARCHAR"),
+        ("supplier_name", "VARCHAR"),
+        ("awarded_quantity", "FLOAT"),
+        ("unit_price", "FLOAT"),
+    ):
+        _add_column(connection, "tender_items", column, column_type)
+
+    _create_index(connection, "ix_tender_items_tender_code", "tender_items", ["tender_code"])
+    _create_index(
+        connection, "ix_tender_items_category_code", "tender_items",
+        ["category_code", "tender_code"]
+    )
+    _create_index(
+        connection, "ix_tender_items_product_code", "tender_items",
+        ["product_code", "tender_code"]
+    )
+
+    columns = [
+        "tender_code", "correlative", "category_code", "category_name", "product_code",
+        "product_name", "description", "quantity", "unit", "supplier_tax_id",
+        "supplier_name", "awarded_quantity", "unit_price",
+    ]
+    # Path of each column in an element of tenders.items
+    paths = [
+        ("correlative",), ("category_code",), ("category_name",), ("product_code",),
+        ("product_name",), ("description",), ("quantity",), ("unit",),
+        ("award", "supplier_tax_id"), ("award", "supplier_name"),
+        ("award", "awarded_quantity"), ("award", "unit_price"),
+    ]
+    float_columns = {"quantity", "awarded_quantity", "unit_price"}
+
+    if connection.dialect.name == "sqlite":
+        values = [f"json_extract(item.value, '$.{'.'.join(path)}')" for path in paths]
+        source = (
+            "FROM tenders, json_each(tenders.items) AS item "
+            "WHERE json_type(tenders.items) = 'array' AND json_type(item.value) = 'object'"
+        )
+    elif connection.dialect.name == "postgresql":
+        values = []
+        for column, path in zip(columns[1:], paths):
+            value = "item" + "".join(f" -> '{key}'" for key in path[:-1]) + f" ->> '{path[-1]}'"
+            values.append(f"({value})::float" if column in float_columns else f"({value})")
+        source = (
+            "FROM tenders, json_array_elements(tenders.items::json) AS item "
+            "WHERE json_typeof(tenders.items::json) = 'array' AND json_typeof(item) = 'object'"
+        )
+    else:
+        raise ValueError(f"Unsupported database type: {connection.dialect.name}")
+
+    connection.execute(text("DELETE FROM tender_items"))
+    connection.execute(text(
+        f"INSERT INTO tender_items ({', '.join(columns)}) "
+        f"SELECT tenders.code, {', '.join(values)} {source}"
+    ))
+
+
+def _add_tender_stats(connection: Connection) -> None:
+    """Fill the stats of stored tenders; create_all has created their table"""
+    if connection.dialect.name == "sqlite":
+        month = "strftime('%Y-%m', creation_date)"
+    elif connection.dialect.name == "postgresql":
+        month = "to_char(creation_date, 'YYYY-MM')"
+    else:
+        raise ValueError(f"Unsupported database type: {connection.dialect.name}")
+
+    # Key expression of each dimension, as tender_stats stores them
+    keys = {
+        "organization": "organization",
+        "region": "buying_unit_region",
+        "tender_type": "tender_type",
+        "month": month,
+        "status": "status",
+    }
+    connection.execute(text("DELETE FROM tender_stats"))
+    for dimension, key in keys.items():
+        connection.execute(text(
+            f"INSERT INTO tender_stats (dimension, key, tender_count, estimated_amount, updated_at) "
+            f"SELECT :dimension, {key}, COUNT(*), COALESCE(SUM(estimated_amount), 0), :now "
+            f"FROM tenders WHERE {key} IS NOT NULL GROUP BY {key}"
+        ), {"dimension": dimension, "now": datetime.utcnow()})
+
+
+def _add_tender_content_hash(connection: Connection) -> None:
+    """Hash used to skip unchanged tenders; rows saved before count as updated once"""
+    _add_column(connection, "tenders", "content_hash", "VARCHAR(64)")
+
+
+def _add_tender_stats_total(connection: Connection) -> None:
+    """Count every tender in one stats row, including those the dimensions leave out"""
+    connection.execute(text("DELETE FROM tender_stats WHERE dimension = 'total'"))
+    connection.execute(text(
+        "INSERT INTO tender_stats (dimension, key, tender_count, estimated_amount, updated_at) "
+        "SELECT 'total', 'all', COUNT(*), COALESCE(SUM(estimated_amount), 0), :now "
+        "FROM tenders HAVING COUNT(*) > 0"
+    ), {"now": datetime.utcnow()})
+
+
+def _seed_data_versions(connection: Connection) -> None:
+    """Create the version row of each data set, so writers only ever update it"""
+    for name in ("tenders", "keywords"):
+        connection.execute(text(
+            "INSERT INTO data_versions (name, version) SELECT :name, 0 "
+            "WHERE NOT EXISTS (SELECT 1 FROM data_versions WHERE name = :name)"
+        ), {"name": name})
+
+
+def _add_code_to_closing_date_index(connection: Connection) -> None:
+    """Let the tenders table sort by closing date with ties broken by code"""
+    connection.execute(text("DROP INDEX IF EXISTS ix_tenders_closing_date"))
+    _create_index(
+        connection, "ix_tenders_closing_date_code", "tenders", ["closing_date", "code"]
+    )
+
+
+# Ordered list of (version, name, upgrade). Versions are never reused or
+# reordered; a schema change is always a new entry at the end.
+MIGRATIONS: List[Tuple[int, str, Callable[[Connection], None]]] = [
+    (1, "tender_listing_indexes", _add_tender_listing_indexes),
+    (2, "tender_status_keyset_index", _add_code_to_status_index),
+    (3, "tender_full_text_search", _add_tender_full_text_search),
+    (4, "tender_item_rows", _add_tender_item_indexes),
+    (5, "tender_stats", _add_tender_stats),
+    (6, "tender_closing_date_sort_index", _add_code_to_closing_date_index),
+    (7, "tender_content_hash", _add_tender_content_hash),
+    (8, "tender_stats_total", _add_tender_stats_total),
+    (9, "data_version_rows", _seed_data_versions),
+]
+
+
+def get_applied_versions(connection: Connection) -> Set[int]:
+    """
+    Get the migrations already applied to a database
+
+    Args:
+        connection (Connection): Database connection
+
+    Returns:
+        Set[int]: Applied versions
+    """
+    schema_migrations.create(bind=connection, checkfirst=True)
+    return {row.version for row in connection.execute(schema_migrations.select())}
+
+
+@contextmanager
+def _migration_transaction(engine: Engine) -> Iterator[Connection]:
+    """
+    Open a connection whose statements, DDL included, run in one transaction
+
+    pysqlite only begins transactions before DML, so on SQLite the DDL of a
+    migration would commit statement by statement. There the driver is put
+    in autocommit mode and the transaction is managed explicitly; BEGIN
+    IMMEDIATE also makes concurrent starts migrate one at a time.
+
+    Args:
+        engine (Engine): Database engine
+
+    Yields:
+        Connection: Connection inside the transaction
+    """
+    if engine.dialect.name != "sqlite":
+        with engine.begin() as connection:
+            yield connection
+        return
+
+    with engine.connect() as connection:
+        connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+        try:
+            yield connection
+        except BaseException:
+            connection.exec_driver_sql("ROLLBACK")
+            raise
+        connection.exec_driver_sql("COMMIT")
+
+
+def run_migrations(engine: Engine) -> List[int]:
+    """
+    Apply pending migrations in order
+
+    Each migration runs in its own transaction together with the insert of
+    its schema_migrations row, so a failed migration is retried as a whole
+    on the next start.
+
+    Args:
+        engine (Engine): Database engine
+
+    Returns:
+        List[int]: Versions applied by this call
+    """
+    with engine.begin() as connection:
+        applied = get_applied_versions(connection)
+
+    newly_applied = []
+    for version, name, upgrade in MIGRATIONS:
+        if version in applied:
+            continue
+
+        with _migration_transaction(engine) as connection:
+            # Another process may have applied it while this one waited
+            if version in get_applied_versions(connection):
+                continue
+            logger.info(f"Applying migration {version}: {name}")
+            upgrade(connection)
+            connection.execute(schema_migrations.insert().values(
+                version=version, name=name, applied_at=datetime.utcnow()
+            ))
+        newly_applied.append(version)
+
+    if newly_applied:
+        logger.info(f"Applied {len(newly_applied)} migrations")
+    return newly_applied
@@ -0,0 +1,176 @@
+# src/database/query_plans.py
+"""
+Check that the tender listing queries are served by indexes
+
+Run with:
+
+    python -m src.database.query_plans
+
+It prints the plan of each listing query built by TenderRepository and exits
+with status 1 if any of them scans the whole table, or sorts rows where an
+index should provide the order.
+"""
+import sys
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy.orm import Query, Session
+
+from src.database.repository import TenderRepository, keyset_condition, table_order
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Markers of index access and of explicit sorts in EXPLAIN output
+INDEX_MARKERS = {
+    "sqlite": ("USING INDEX", "USING COVERING INDEX", "USING INTEGER PRIMARY KEY"),
+    "postgresql": ("Index Scan", "Index Only Scan", "Bitmap Index Scan"),
+}
+SORT_MARKERS = {
+    "sqlite": ("USE TEMP B-TREE FOR",),
+    "postgresql": ("Sort  (", "Sort Key:"),
+}
+
+
+@dataclass
+class PlanCheck:
+    """Outcome of the plan check of one query"""
+
+    name: str
+    plan: List[str]
+    uses_index: bool
+    sorts: bool
+    sort_allowed: bool
+
+    @property
+    def ok(self) -> bool:
+        return self.uses_index and (self.sort_allowed or not self.sorts)
+
+
+def explain(db: Session, query: Query) -> List[str]:
+    """
+    Get the plan of a query
+
+    Args:
+        db (Session): Database session
+        query (Query): Query to explain
+
+    Returns:
+        List[str]: Plan lines
+    """
+    dialect = db.get_bind().dialect
+    sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+
+    if dialect.name == "sqlite":
+        rows = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+        return [row[-1] for row in rows]
+
+    if dialect.name == "postgresql":
+        connection = db.connection()
+        # Judge whether the indexes are usable, not whether the planner picks
+        # them for a table that is still small
+        connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+        rows = connection.exec_driver_sql(f"EXPLAIN {sql}").fetchall()
+        return [row[0] for row in rows]
+
+    raise ValueError(f"Unsupported database type: {dialect.name}")
+
+
+def get_listing_queries(repo: TenderRepository) -> Dict[str, tuple]:
+    """
+    Build the listing queries to check
+
+    Args:
+        repo (TenderRepository): Repository building the queries
+
+    Returns:
+        Dict[str, tuple]: (query, sort_allowed) by name. Full-text and
+            creation_date range filters cannot also deliver the created_at
+            order, so they only need to use an index.
+    """
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=30)
+    cursor = keyset_condition((end_date, ""))
+    return {
+        "latest": (repo.build_filtered_query(), False),
+        "latest_after_cursor": (repo.build_filtered_query().filter(cursor), False),
+        "status": (repo.build_filtered_query(status="Publicada"), False),
+        "status_after_cursor": (
+            repo.build_filtered_query(status="Publicada").filter(cursor), False
+        ),
+        "search": (repo.build_filtered_query(search="desarrollo"), True),
+        "table_by_closing_date": (
+            repo.build_filtered_query().order_by(None).order_by(*table_order("closing_date")),
+            False,
+        ),
+        "table_by_code": (
+            repo.build_filtered_query().order_by(None).order_by(*table_order("code", False)),
+            False,
+        ),
+        "date_range": (
+            repo.build_filtered_query(start_date=start_date, end_date=end_date), True
+        ),
+        "status_date_range": (
+            repo.build_filtered_query(
+                status="Publicada", start_date=start_date, end_date=end_date
+            ),
+            True,
+        ),
+    }
+
+
+def check_listing_plans(db: Session, limit: int = 100) -> List[PlanCheck]:
+    """
+    Check the plans of the listing queries
+
+    Args:
+        db (Session): Database session
+        limit (int): Page size used in the queries
+
+    Returns:
+        List[PlanCheck]: Result of each query
+    """
+    dialect = db.get_bind().dialect.name
+    repo = TenderRepository(db)
+    checks = []
+    try:
+        for name, (query, sort_allowed) in get_listing_queries(repo).items():
+            plan = explain(db, query.limit(limit))
+            checks.append(PlanCheck(
+                name=name,
+                plan=plan,
+                uses_index=any(marker in line for line in plan for marker in INDEX_MARKERS[dialect]),
+                sorts=any(marker in line for line in plan for marker in SORT_MARKERS[dialect]),
+                sort_allowed=sort_allowed,
+            ))
+    finally:
+        db.rollback()
+    return checks
+
+
+def main() -> int:
+    """Print the plan checks and return the exit status"""
+    from src.database.base import SessionLocal, init_db
+
+    init_db()
+    db = SessionLocal()
+    try:
+        checks = check_listing_plans(db)
+    finally:
+        db.close()
+
+    for check in checks:
+        print(f"[{'OK' if check.ok else 'FAIL'}] {check.name}")
+        for line in check.plan:
+            print(f"    {line}")
+
+    failed = [check.name for check in checks if not check.ok]
+    if failed:
+        logger.error(f"Listing queries not served by indexes: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
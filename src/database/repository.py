@@ -1,12 +1,172 @@
-from typing import List, Dict, Optional
-from sqlalchemy.orm import Session
-from sqlalchemy import func, or_
-from datetime import datetime
-from src.models.tender import Tender
+from typing import Iterator, List, Dict, Optional, Tuple
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import delete, func, insert, or_, select, text, tuple_, update
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.dialects import postgresql, sqlite
+from datetime import date, datetime
+from src.config.settings import EXPORT_BATCH_SIZE
+from src.database.search import build_match_query, match_codes, ranked_matches, to_search_terms
+from src.database.stats import (
+    add_stat_deltas,
+    apply_stat_deltas,
+    stats_query,
+    subtract_stored_tenders,
+)
+from src.database.versions import KEYWORDS, TENDERS, bump_data_version
+from src.models.tender import Tender, TenderItem
+from src.models.job import FINISHED_STATUSES, Job, JobStatus
 from src.models.keywords import Keyword, KeywordType
+from src.models.sync_state import SyncState
+from src.models.tender_stat import TenderStat
+from src.utils.content_hash import EXCLUDED_FIELDS, compute_content_hash
 from src.utils.logger import setup_logger
 
+# Order of the tender listing, matching the keyset of the cursor
+LISTING_ORDER = (Tender.created_at.desc(), Tender.code.desc())
+
+# Columns the tenders table can be sorted by, each backed by an index ending
+# in code, which breaks ties so that offsets are stable
+SORTABLE_COLUMNS = {
+    "created_at": Tender.created_at,
+    "closing_date": Tender.closing_date,
+    "code": Tender.code,
+}
+
+# Columns loaded by list queries: the fields of a list entry and the cursor.
+# The rest, including the items and awarded_suppliers JSON and the long
+# description, is deferred; get_tender_by_code loads the full tender.
+LISTING_COLUMNS = (
+    Tender.code,
+    Tender.name,
+    Tender.status,
+    Tender.organization,
+    Tender.closing_date,
+    Tender.estimated_amount,
+    Tender.tender_type,
+    Tender.created_at,
+)
+
+
+# Columns written by exports: every stored field of a tender
+EXPORT_COLUMNS = tuple(
+    column for column in Tender.__table__.columns if column.key != "content_hash"
+)
+
+
+def listing_options():
+    """
+    Build the loader option restricting list queries to LISTING_COLUMNS
+
+    Deferred columns raise instead of being loaded one row at a time if a
+    list entry ever touches them. status_code is loaded as well, for the
+    status description that the repr of a tender shows.
+
+    Returns:
+        Loader option for Query.options or Select.options
+    """
+    return load_only(*LISTING_COLUMNS, Tender.status_code, raiseload=True)
+
+
+def tender_filter_conditions(
+    dialect: str,
+    search: Optional[str] = None,
+    status: Optional[str] = None,
+    start_date: Optional[datetime] = None,
+    end_date: Optional[datetime] = None,
+) -> List:
+    """
+    Build the WHERE conditions of the tender listing
+
+    Shared by the sync and async repositories so both filter the same way.
+
+    Args:
+        dialect (str): Database dialect name
+        search (str, optional): Words to find in name or description,
+            accent-insensitive and as prefixes, using the full-text index
+        status (str, optional): Filter by status
+        start_date (datetime, optional): Filter by start date
+        end_date (datetime, optional): Filter by end date
+
+    Returns:
+        List: Conditions to combine with AND
+    """
+    conditions = []
+
+    if search:
+        words = to_search_terms(search)
+        if words:
+            match_query = build_match_query(words, dialect)
+            conditions.append(Tender.code.in_(match_codes(match_query, dialect)))
+        else:
+            # Nothing indexable in the term (only punctuation)
+            search_term = f"%{search}%"
+            conditions.append(or_(
+                Tender.name.ilike(search_term),
+                Tender.description.ilike(search_term)
+            ))
+
+    if status:
+        conditions.append(Tender.status == status)
+
+    if start_date:
+        conditions.append(Tender.creation_date >= start_date)
+
+    if end_date:
+        conditions.append(Tender.creation_date <= end_date)
+
+    return conditions
+
+
+def table_order(order_by: str = "created_at", descending: bool = True) -> Tuple:
+    """
+    Build the ORDER BY of a sorted tenders table
+
+    Args:
+        order_by (str): One of SORTABLE_COLUMNS
+        descending (bool): Sort in descending order
+
+    Returns:
+        Tuple: Order clauses, ties broken by code in the same direction
+
+    Raises:
+        ValueError: If the column is not sortable
+    """
+    if order_by not in SORTABLE_COLUMNS:
+        raise ValueError(f"Cannot sort tenders by: {order_by}")
+
+    columns = [SORTABLE_COLUMNS[order_by]]
+    if order_by != "code":
+        columns.append(Tender.code)
+    return tuple(column.desc() if descending else column.asc() for column in columns)
+
+
+def keyset_condition(cursor: Tuple[datetime, str]):
+    """
+    Build the condition selecting the tenders listed after a cursor
+
+    Args:
+        cursor (Tuple[datetime, str]): (created_at, code) of the last tender
+            of the previous page
+
+    Returns:
+        Condition on (created_at, code)
+    """
+    return tuple_(Tender.created_at, Tender.code) < tuple_(*cursor)
+
+
 class TenderRepository:
+    # Maximum number of codes per IN (...) lookup, below SQLite's variable limit
+    LOOKUP_BATCH_SIZE = 500
+
+    # First key of the PostgreSQL advisory locks taken on tender codes
+    CODE_LOCK_NAMESPACE = 7301
+
+    # Columns holding tender content, covered by the content hash
+    CONTENT_COLUMNS = tuple(
+        column.key for column in Tender.__table__.columns
+        if column.key not in EXCLUDED_FIELDS
+    )
+
     def __init__(self, db: Session):
         self.db = db
         self.logger = setup_logger(__name__)
@@ -15,6 +175,9 @@ class TenderRepository:
         """
         Create a new tender in the database
         
+        Its content hash is stored along, as upsert_many does, so the next
+        sync of an unchanged tender skips it.
+        
         Args:
             tender (Tender): Tender object to create
             
@@ -24,9 +187,18 @@ class TenderRepository:
         try:
             tender.created_at = datetime.utcnow()
             tender.updated_at = datetime.utcnow()
+            values = self.get_content_values(tender)
+            tender.content_hash = compute_content_hash(values)
             
             self.logger.debug(f"Creating new tender with code: {tender.code}")
+            self.lock_codes([tender.code])
             self.db.add(tender)
+            self.db.flush()
+            self.replace_items([tender])
+            stat_deltas = {}
+            add_stat_deltas(stat_deltas, values)
+            apply_stat_deltas(self.db, stat_deltas)
+            bump_data_version(self.db, TENDERS)
             self.db.commit()
             self.db.refresh(tender)
             return tender
@@ -39,41 +211,46 @@ class TenderRepository:
         """
         Update an existing tender if there are changes
         
+        Changes are detected by comparing content hashes, so an unchanged
+        tender is neither loaded nor compared field by field.
+        
         Args:
             new_tender (Tender): Tender object with updated data
             
         Returns:
-            Tender: Updated tender object
+            Tender: Updated tender object, or new_tender itself if the stored
+                one has the same content
         """
         try:
-            existing_tender = self.get_tender_by_code(new_tender.code)
-            if not existing_tender:
+            self.lock_codes([new_tender.code])
+            stored = self.db.query(Tender.content_hash).filter(
+                Tender.code == new_tender.code
+            ).first()
+            if stored is None:
                 return self.create_tender(new_tender)
 
-            # Compare relevant fields to check if update is needed
-            fields_to_compare = [
-                'name', 'description', 'status', 'status_code', 'estimated_amount',
-                'closing_date', 'award_date', 'number_of_bidders', 'items',
-                'awarded_suppliers'
-            ]
-
-            needs_update = False
-            for field in fields_to_compare:
-                old_value = getattr(existing_tender, field)
-                new_value = getattr(new_tender, field)
-                if old_value != new_value:
-                    needs_update = True
-                    self.logger.debug(f"Field {field} changed from {old_value} to {new_value}")
-                    setattr(existing_tender, field, new_value)
-
-            if needs_update:
-                existing_tender.updated_at = datetime.utcnow()
-                self.logger.info(f"Updating tender {existing_tender.code}")
+            new_values = self.get_content_values(new_tender)
+            new_hash = compute_content_hash(new_values)
+            if stored.content_hash == new_hash:
+                self.logger.debug(f"No updates needed for tender {new_tender.code}")
                 self.db.commit()
-                self.db.refresh(existing_tender)
-            else:
-                self.logger.debug(f"No updates needed for tender {existing_tender.code}")
+                return new_tender
 
+            existing_tender = self.get_tender_by_code(new_tender.code)
+            stat_deltas = {}
+            subtract_stored_tenders(self.db, [existing_tender.code], stat_deltas)
+            add_stat_deltas(stat_deltas, new_values)
+            for column, value in new_values.items():
+                setattr(existing_tender, column, value)
+            existing_tender.content_hash = new_hash
+            existing_tender.updated_at = datetime.utcnow()
+            self.logger.info(f"Updating tender {existing_tender.code}")
+            self.db.flush()
+            self.replace_items([existing_tender])
+            apply_stat_deltas(self.db, stat_deltas)
+            bump_data_version(self.db, TENDERS)
+            self.db.commit()
+            self.db.refresh(existing_tender)
             return existing_tender
 
         except Exception as e:
@@ -81,6 +258,199 @@ class TenderRepository:
             self.db.rollback()
             raise
 
+    def upsert_many(self, tenders: List[Tender], commit: bool = True) -> Dict[str, int]:
+        """
+        Insert or update a batch of tenders in a single transaction
+        
+        The codes of the batch are locked (see lock_codes) and their stored
+        content hashes fetched in bulk; new and changed tenders are then
+        written with one INSERT ... ON CONFLICT (code) DO UPDATE statement,
+        and unchanged ones are neither loaded nor written. The stats move
+        from the stored version of the written tenders to the new one in the
+        same transaction.
+        
+        Args:
+            tenders (List[Tender]): Tenders to save; for repeated codes the
+                last one wins
+            commit (bool): Commit the transaction; False leaves it to the
+                caller, as the database writer does
+            
+        Returns:
+            Dict[str, int]: Number of new, updated and unchanged tenders
+        """
+        counts = {"new": 0, "updated": 0, "unchanged": 0}
+        batch = {tender.code: tender for tender in tenders}
+        if not batch:
+            return counts
+
+        try:
+            self.lock_codes(list(batch))
+            stored_hashes = self.get_content_hashes(list(batch))
+
+            now = datetime.utcnow()
+            values = []
+            for code, tender in batch.items():
+                row = self.get_content_values(tender)
+                row["content_hash"] = compute_content_hash(row)
+                if code in stored_hashes:
+                    if stored_hashes[code] == row["content_hash"]:
+                        counts["unchanged"] += 1
+                        continue
+                    counts["updated"] += 1
+                else:
+                    counts["new"] += 1
+
+                row["created_at"] = now
+                row["updated_at"] = now
+                values.append(row)
+
+            if values:
+                updated_codes = [row["code"] for row in values if row["code"] in stored_hashes]
+                stat_deltas = {}
+                subtract_stored_tenders(self.db, updated_codes, stat_deltas)
+                for row in values:
+                    add_stat_deltas(stat_deltas, row)
+
+                dialect_insert = self._dialect_insert()
+                statement = dialect_insert(Tender.__table__)
+                statement = statement.on_conflict_do_update(
+                    index_elements=[Tender.code],
+                    set_={
+                        column.key: statement.excluded[column.key]
+                        for column in Tender.__table__.columns
+                        if column.key not in ("code", "created_at")
+                    },
+                )
+                self.db.execute(statement, values)
+                self.replace_items([batch[row["code"]] for row in values])
+                apply_stat_deltas(self.db, stat_deltas)
+                bump_data_version(self.db, TENDERS)
+            if commit:
+                self.db.commit()
+
+            self.logger.debug(
+                f"Upserted {len(batch)} tenders (new: {counts['new']}, "
+                f"updated: {counts['updated']}, unchanged: {counts['unchanged']})"
+            )
+            return counts
+
+        except Exception as e:
+            self.logger.error(f"Error upserting {len(batch)} tenders: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def replace_items(self, tenders: List[Tender]) -> None:
+        """
+        Rewrite the tender_items rows of tenders from their items JSON
+        
+        Runs inside the caller's transaction; the caller commits.
+        
+        Args:
+            tenders (List[Tender]): Tenders whose items were written
+        """
+        codes = [tender.code for tender in tenders]
+        for start in range(0, len(codes), self.LOOKUP_BATCH_SIZE):
+            self.db.execute(
+                delete(TenderItem.__table__).where(
+                    TenderItem.tender_code.in_(codes[start:start + self.LOOKUP_BATCH_SIZE])
+                )
+            )
+
+        rows = []
+        for tender in tenders:
+            rows.extend(TenderItem.rows_from_items(tender.code, tender.items))
+        if rows:
+            self.db.execute(insert(TenderItem.__table__), rows)
+
+    def get_content_hashes(self, codes: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Get the stored content hashes of several tenders in bulk
+        
+        Args:
+            codes (List[str]): Tender codes to look up
+            
+        Returns:
+            Dict[str, Optional[str]]: Content hash by code, for the codes that
+                are stored; None for rows saved before hashes existed
+        """
+        hashes = {}
+        for start in range(0, len(codes), self.LOOKUP_BATCH_SIZE):
+            batch = codes[start:start + self.LOOKUP_BATCH_SIZE]
+            rows = self.db.query(Tender.code, Tender.content_hash).filter(
+                Tender.code.in_(batch)
+            ).all()
+            hashes.update({code: content_hash for code, content_hash in rows})
+        return hashes
+
+    @classmethod
+    def get_content_values(cls, tender: Tender) -> Dict:
+        """
+        Get the content attributes of a tender
+        
+        Attributes of new tenders are read from the instance state, since
+        going through the ORM descriptors for every unset column dominates
+        the cost of a batch.
+        
+        Args:
+            tender (Tender): Tender to read
+            
+        Returns:
+            Dict: Value of every content column by name
+        """
+        state = sa_inspect(tender)
+        if state.has_identity and state.unloaded:
+            # Stored tender with expired attributes, let the ORM load them
+            return {column: getattr(tender, column) for column in cls.CONTENT_COLUMNS}
+        return {column: state.dict.get(column) for column in cls.CONTENT_COLUMNS}
+
+    @classmethod
+    def get_content_hash(cls, tender: Tender) -> str:
+        """
+        Compute the content hash of a tender from its current attributes
+        
+        Args:
+            tender (Tender): Tender to hash
+            
+        Returns:
+            str: Content hash
+        """
+        return compute_content_hash(cls.get_content_values(tender))
+
+    def lock_codes(self, codes: List[str]) -> None:
+        """
+        Lock tender codes until the end of the transaction
+        
+        Writes read the stored version of a tender to count it as new or
+        updated and to move the stats from it. Under READ COMMITTED two
+        writers of the same code would both read the old version, so on
+        PostgreSQL each code takes a transaction advisory lock before those
+        reads. It also covers codes not stored yet, which row locks cannot.
+        Locks are taken in key order, so overlapping batches do not deadlock.
+        SQLite needs nothing, provided the session writes through the
+        database writer or comes from WriteSessionLocal: their transactions
+        start with BEGIN IMMEDIATE and hold the database write lock.
+        
+        Args:
+            codes (List[str]): Tender codes about to be written
+        """
+        if not codes or self.db.get_bind().dialect.name != "postgresql":
+            return
+        self.db.execute(text(
+            "SELECT pg_advisory_xact_lock(:namespace, key) FROM ("
+            "SELECT DISTINCT hashtext(code) AS key "
+            "FROM unnest(CAST(:codes AS text[])) AS code ORDER BY key"
+            ") AS keys"
+        ), {"namespace": self.CODE_LOCK_NAMESPACE, "codes": list(codes)})
+
+    def _dialect_insert(self):
+        """Get the insert construct supporting ON CONFLICT for the bound database"""
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "postgresql":
+            return postgresql.insert
+        if dialect == "sqlite":
+            return sqlite.insert
+        raise ValueError(f"Unsupported database type for upserts: {dialect}")
+
     def get_tender_by_code(self, code: str) -> Optional[Tender]:
         """
         Get a tender by its code
@@ -93,6 +463,105 @@ class TenderRepository:
         """
         return self.db.query(Tender).filter(Tender.code == code).first()
 
+    def get_known_tenders(
+        self,
+        codes: List[str]
+    ) -> Dict[str, Tuple[Optional[int], Optional[datetime]]]:
+        """
+        Get the listing-level state of stored tenders in bulk
+        
+        Args:
+            codes (List[str]): Tender codes to look up
+            
+        Returns:
+            Dict[str, Tuple[Optional[int], Optional[datetime]]]: (status_code,
+                closing_date) by code, for the codes that are stored
+        """
+        known = {}
+        for start in range(0, len(codes), self.LOOKUP_BATCH_SIZE):
+            batch = codes[start:start + self.LOOKUP_BATCH_SIZE]
+            rows = self.db.query(
+                Tender.code, Tender.status_code, Tender.closing_date
+            ).filter(Tender.code.in_(batch)).all()
+            known.update({code: (status_code, closing_date)
+                          for code, status_code, closing_date in rows})
+        return known
+
+    def get_tenders_by_category(self, category_code: str, limit: int = 100) -> List[Tender]:
+        """
+        Get tenders with at least one item of a category, newest first
+        
+        Args:
+            category_code (str): ONU category code of the items
+            limit (int): Maximum number of records to return
+            
+        Returns:
+            List[Tender]: Matching tenders
+        """
+        return self._get_tenders_with_items(TenderItem.category_code == category_code, limit)
+
+    def get_tenders_by_product(self, product_code: str, limit: int = 100) -> List[Tender]:
+        """
+        Get tenders with at least one item of a product, newest first
+        
+        Args:
+            product_code (str): ONU product code of the items
+            limit (int): Maximum number of records to return
+            
+        Returns:
+            List[Tender]: Matching tenders
+        """
+        return self._get_tenders_with_items(TenderItem.product_code == product_code, limit)
+
+    def _get_tenders_with_items(self, condition, limit: int) -> List[Tender]:
+        """Get the newest tenders having an item that meets a condition"""
+        try:
+            codes = select(TenderItem.tender_code).where(condition)
+            return self.db.query(Tender).options(listing_options()).filter(
+                Tender.code.in_(codes)
+            ).order_by(*LISTING_ORDER).limit(limit).all()
+        except Exception as e:
+            self.logger.error(f"Error getting tenders by item: {str(e)}")
+            raise
+
+    def get_category_summary(self, limit: int = 50) -> List[Tuple[str, Optional[str], int]]:
+        """
+        Count tenders per item category
+        
+        Args:
+            limit (int): Maximum number of categories to return
+            
+        Returns:
+            List[Tuple[str, Optional[str], int]]: (category_code, category_name,
+                tender count), most frequent first
+        """
+        tender_count = func.count(func.distinct(TenderItem.tender_code))
+        rows = self.db.query(
+            TenderItem.category_code, func.max(TenderItem.category_name), tender_count
+        ).filter(
+            TenderItem.category_code.isnot(None)
+        ).group_by(TenderItem.category_code).order_by(tender_count.desc()).limit(limit).all()
+        return [tuple(row) for row in rows]
+
+    def get_stats(self, dimension: str, limit: int = 100) -> List[TenderStat]:
+        """
+        Get the tender count and estimated amount per key of a dimension
+        
+        Reads the rollup updated on every write, so the cost does not grow
+        with the number of tenders.
+        
+        Args:
+            dimension (str): organization, region, tender_type, month or status
+            limit (int): Maximum number of keys to return
+            
+        Returns:
+            List[TenderStat]: Stats of the dimension
+            
+        Raises:
+            ValueError: If the dimension is unknown
+        """
+        return list(self.db.execute(stats_query(dimension, limit)).scalars())
+
     def get_tenders_by_date_range(
         self, 
         start_date: datetime, 
@@ -119,7 +588,12 @@ class TenderRepository:
         Args:
             tender (Tender): Tender object to delete
         """
+        self.lock_codes([tender.code])
+        stat_deltas = {}
+        subtract_stored_tenders(self.db, [tender.code], stat_deltas)
         self.db.delete(tender)
+        apply_stat_deltas(self.db, stat_deltas)
+        bump_data_version(self.db, TENDERS)
         self.db.commit()
 
     def get_all_tenders(self) -> List[Tender]:
@@ -135,51 +609,183 @@ class TenderRepository:
             self.logger.error(f"Error getting all tenders: {str(e)}")
             raise
 
-    def get_tenders_with_filters(
+    def build_filtered_query(
+        self,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        """
+        Build the tender listing query, newest first
+        
+        Args:
+            search (str, optional): Words to find in name or description,
+                accent-insensitive and as prefixes, using the full-text index
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+            
+        Returns:
+            Query: Filtered and ordered query
+        """
+        dialect = self.db.get_bind().dialect.name
+        conditions = tender_filter_conditions(dialect, search, status, start_date, end_date)
+        return self.db.query(Tender).filter(*conditions).order_by(*LISTING_ORDER)
+
+    def get_tenders_page(
         self,
-        skip: int = 0,
         limit: int = 100,
+        cursor: Optional[Tuple[datetime, str]] = None,
         search: Optional[str] = None,
         status: Optional[str] = None,
         start_date: Optional[datetime] = None,
         end_date: Optional[datetime] = None,
-    ) -> List[Tender]:
+    ) -> Tuple[List[Tender], Optional[Tuple[datetime, str]]]:
         """
-        Get tenders with filters
+        Get a page of tenders using keyset pagination on (created_at, code)
+        
+        Pages start right after the cursor instead of skipping rows, so
+        every page costs the same no matter how deep it is.
         
         Args:
-            skip (int): Number of records to skip
             limit (int): Maximum number of records to return
+            cursor (Tuple[datetime, str], optional): (created_at, code) of the
+                last tender of the previous page
             search (str, optional): Search term for name or description
             status (str, optional): Filter by status
             start_date (datetime, optional): Filter by start date
             end_date (datetime, optional): Filter by end date
             
         Returns:
-            List[Tender]: List of filtered tenders
+            Tuple[List[Tender], Optional[Tuple[datetime, str]]]: Tenders of the
+                page and the cursor of the next page, None on the last page
         """
         try:
-            query = self.db.query(Tender)
-
-            if search:
-                search_term = f"%{search}%"
-                query = query.filter(
-                    or_(
-                        Tender.name.ilike(search_term),
-                        Tender.description.ilike(search_term)
-                    )
-                )
+            query = self.build_filtered_query(
+                search=search, status=status, start_date=start_date, end_date=end_date
+            )
+            if cursor is not None:
+                query = query.filter(keyset_condition(cursor))
+
+            # One extra row tells whether there is a next page
+            tenders = query.options(listing_options()).limit(limit + 1).all()
+            if len(tenders) <= limit:
+                return tenders, None
+
+            tenders = tenders[:limit]
+            return tenders, (tenders[-1].created_at, tenders[-1].code)
+
+        except Exception as e:
+            self.logger.error(f"Error getting tenders page: {str(e)}")
+            raise
 
+    def full_text_search(
+        self,
+        search: str,
+        limit: int = 100,
+        status: Optional[str] = None,
+    ) -> List[Tender]:
+        """
+        Search tenders by relevance using the full-text index
+        
+        Every word of the search must occur in the name or description,
+        accent-insensitive and as a prefix. Matches in the name rank above
+        matches in the description.
+        
+        Args:
+            search (str): Words to find
+            limit (int): Maximum number of records to return
+            status (str, optional): Filter by status
+            
+        Returns:
+            List[Tender]: Matching tenders, most relevant first
+        """
+        try:
+            words = to_search_terms(search)
+            if not words:
+                return []
+
+            dialect = self.db.get_bind().dialect.name
+            ranked = ranked_matches(build_match_query(words, dialect), dialect).subquery("ranked")
+            query = self.db.query(Tender).options(listing_options()).join(
+                ranked, ranked.c.code == Tender.code
+            )
             if status:
                 query = query.filter(Tender.status == status)
 
-            if start_date:
-                query = query.filter(Tender.creation_date >= start_date)
+            return query.order_by(ranked.c.score, Tender.created_at.desc()).limit(limit).all()
 
-            if end_date:
-                query = query.filter(Tender.creation_date <= end_date)
+        except Exception as e:
+            self.logger.error(f"Error searching tenders: {str(e)}")
+            raise
 
-            return query.order_by(Tender.created_at.desc()).offset(skip).limit(limit).all()
+    def iter_export_batches(
+        self,
+        batch_size: int = EXPORT_BATCH_SIZE,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> Iterator[List[Tuple]]:
+        """
+        Stream the rows of the filtered tenders, newest first
+        
+        Rows are plain tuples of EXPORT_COLUMNS read with yield_per, which
+        uses a server-side cursor on PostgreSQL: only one batch is held in
+        memory at a time, whatever the number of tenders.
+        
+        Args:
+            batch_size (int): Rows fetched per batch
+            search (str, optional): Search term for name or description
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+            
+        Yields:
+            List[Tuple]: Batch of rows in EXPORT_COLUMNS order
+        """
+        dialect = self.db.get_bind().dialect.name
+        conditions = tender_filter_conditions(dialect, search, status, start_date, end_date)
+        statement = select(*EXPORT_COLUMNS).where(*conditions).order_by(
+            *LISTING_ORDER
+        ).execution_options(yield_per=batch_size)
+
+        try:
+            for partition in self.db.execute(statement).partitions():
+                yield partition
+        except Exception as e:
+            self.logger.error(f"Error exporting tenders: {str(e)}")
+            raise
+
+    def get_tenders_with_filters(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        search: Optional[str] = None,
+        status: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> List[Tender]:
+        """
+        Get tenders with filters
+        
+        Args:
+            skip (int): Number of records to skip
+            limit (int): Maximum number of records to return
+            search (str, optional): Search term for name or description
+            status (str, optional): Filter by status
+            start_date (datetime, optional): Filter by start date
+            end_date (datetime, optional): Filter by end date
+            
+        Returns:
+            List[Tender]: List of filtered tenders
+        """
+        try:
+            query = self.build_filtered_query(
+                search=search, status=status, start_date=start_date, end_date=end_date
+            )
+            return query.offset(skip).limit(limit).all()
 
         except Exception as e:
             self.logger.error(f"Error getting filtered tenders: {str(e)}")
@@ -204,6 +810,7 @@ class KeywordRepository:
         try:
             new_keyword = Keyword(keyword=keyword, type=type)
             self.db.add(new_keyword)
+            bump_data_version(self.db, KEYWORDS)
             self.db.commit()
             self.db.refresh(new_keyword)
             return new_keyword
@@ -247,6 +854,7 @@ class KeywordRepository:
             keyword = self.db.query(Keyword).filter(Keyword.id == keyword_id).first()
             if keyword:
                 self.db.delete(keyword)
+                bump_data_version(self.db, KEYWORDS)
                 self.db.commit()
                 return True
             return False
@@ -275,6 +883,7 @@ class KeywordRepository:
                     keyword.keyword = new_keyword
                 if new_type is not None:
                     keyword.type = new_type
+                bump_data_version(self.db, KEYWORDS)
                 self.db.commit()
                 self.db.refresh(keyword)
                 return keyword
@@ -314,3 +923,293 @@ class KeywordRepository:
             except Exception as e:
                 self.logger.error(f"Error initializing default keywords: {str(e)}")
                 raise
+
+class SyncStateRepository:
+    def __init__(self, db: Session):
+        self.db = db
+        self.logger = setup_logger(__name__)
+
+    def get_completed_dates(
+        self,
+        start_date: date,
+        end_date: date,
+        status: str,
+        keyword_version: str
+    ) -> List[date]:
+        """
+        Get the days of a range that were fully synchronized
+        
+        Args:
+            start_date (date): First day of the range
+            end_date (date): Last day of the range
+            status (str): Status filter of the sync
+            keyword_version (str): Version of the keyword set of the sync
+            
+        Returns:
+            List[date]: Completed days
+        """
+        rows = self.db.query(SyncState.sync_date).filter(
+            SyncState.sync_date.between(start_date, end_date),
+            SyncState.status == status,
+            SyncState.keyword_version == keyword_version,
+            SyncState.completed_at.isnot(None)
+        ).all()
+        return [row.sync_date for row in rows]
+
+    def _get_or_create(self, sync_date: date, status: str, keyword_version: str) -> SyncState:
+        """Get the state of a day, adding a new one to the session if missing"""
+        state = self.db.get(SyncState, (sync_date, status, keyword_version))
+        if state is None:
+            state = SyncState(sync_date=sync_date, status=status, keyword_version=keyword_version)
+            self.db.add(state)
+        return state
+
+    def mark_started(self, dates: List[date], status: str, keyword_version: str,
+                     commit: bool = True) -> None:
+        """
+        Record the start of the sync of several days
+        
+        Args:
+            dates (List[date]): Days about to be synchronized
+            status (str): Status filter of the sync
+            keyword_version (str): Version of the keyword set of the sync
+            commit (bool): Commit the transaction; False leaves it to the caller
+        """
+        try:
+            now = datetime.utcnow()
+            for sync_date in dates:
+                state = self._get_or_create(sync_date, status, keyword_version)
+                state.started_at = now
+                state.completed_at = None
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+        except Exception as e:
+            self.logger.error(f"Error marking sync start: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def mark_completed(
+        self,
+        sync_date: date,
+        status: str,
+        keyword_version: str,
+        listed_count: int,
+        matched_count: int,
+        fetched_count: int,
+        commit: bool = True
+    ) -> None:
+        """
+        Record that a day was fully synchronized
+        
+        Args:
+            sync_date (date): Synchronized day
+            status (str): Status filter of the sync
+            keyword_version (str): Version of the keyword set of the sync
+            listed_count (int): Tenders in the day listing
+            matched_count (int): Tenders matching the keywords
+            fetched_count (int): Tenders whose details were fetched
+            commit (bool): Commit the transaction; False leaves it to the caller
+        """
+        try:
+            state = self._get_or_create(sync_date, status, keyword_version)
+            state.completed_at = datetime.utcnow()
+            state.listed_count = listed_count
+            state.matched_count = matched_count
+            state.fetched_count = fetched_count
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+        except Exception as e:
+            self.logger.error(f"Error marking day {sync_date} as synchronized: {str(e)}")
+            self.db.rollback()
+            raise
+
+
+class JobRepository:
+    """
+    Persisted search jobs and their progress
+
+    State changes are conditional updates, so the API process and the
+    worker running a job can change it concurrently without losing one.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.logger = setup_logger(__name__)
+
+    def create_job(self, params: Dict) -> Job:
+        """
+        Queue a new job
+        
+        Args:
+            params (Dict): Parameters of the search
+            
+        Returns:
+            Job: Created job
+        """
+        try:
+            job = Job(params=params, status=JobStatus.QUEUED)
+            self.db.add(job)
+            self.db.commit()
+            self.db.refresh(job)
+            return job
+        except Exception as e:
+            self.logger.error(f"Error creating job: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def get_job(self, job_id: int) -> Optional[Job]:
+        """
+        Get a job by its id
+        
+        Args:
+            job_id (int): ID of the job
+            
+        Returns:
+            Optional[Job]: Found job or None
+        """
+        return self.db.get(Job, job_id)
+
+    def _set(self, job_id: int, conditions: List, values: Dict, commit: bool) -> bool:
+        """Update a job if it meets the conditions, returning whether it did"""
+        try:
+            values["updated_at"] = datetime.utcnow()
+            result = self.db.execute(
+                update(Job).where(Job.id == job_id, *conditions).values(**values)
+            )
+            if commit:
+                self.db.commit()
+            else:
+                self.db.flush()
+            return result.rowcount > 0
+        except Exception as e:
+            self.logger.error(f"Error updating job {job_id}: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def claim_next_job(self) -> Optional[int]:
+        """
+        Mark the oldest queued job as running
+        
+        A single UPDATE ... RETURNING, so the job cannot be cancelled or
+        claimed by anyone else between finding it and starting it.
+        
+        Returns:
+            Optional[int]: ID of the claimed job, None if none is queued
+        """
+        try:
+            now = datetime.utcnow()
+            oldest = select(func.min(Job.id)).where(
+                Job.status == JobStatus.QUEUED
+            ).scalar_subquery()
+            job_id = self.db.execute(
+                update(Job).where(Job.id == oldest, Job.status == JobStatus.QUEUED).values(
+                    status=JobStatus.RUNNING, started_at=now, updated_at=now
+                ).returning(Job.id)
+            ).scalar()
+            self.db.commit()
+            return job_id
+        except Exception as e:
+            self.logger.error(f"Error claiming job: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def requeue_running_jobs(self) -> int:
+        """
+        Recover the jobs left running by a job runner that stopped
+        
+        Only the job runner calls this, at startup, while it holds the
+        runner lock: no job can still be running then. Jobs whose
+        cancellation was requested are cancelled; the others are queued
+        again, and their days already synchronized are skipped when they run.
+        
+        Returns:
+            int: Number of jobs queued again
+        """
+        try:
+            now = datetime.utcnow()
+            self.db.execute(update(Job).where(
+                Job.status == JobStatus.RUNNING, Job.cancel_requested.is_(True)
+            ).values(status=JobStatus.CANCELLED, finished_at=now, updated_at=now))
+            result = self.db.execute(update(Job).where(Job.status == JobStatus.RUNNING).values(
+                status=JobStatus.QUEUED, started_at=None, days_total=None, days_done=0,
+                tenders_matched=0, updated_at=now,
+            ))
+            self.db.commit()
+            return result.rowcount
+        except Exception as e:
+            self.logger.error(f"Error requeuing running jobs: {str(e)}")
+            self.db.rollback()
+            raise
+
+    def report_progress(self, job_id: int, days_done: int, days_total: int,
+                        tenders_matched: int, commit: bool = True) -> bool:
+        """
+        Record the progress of a running job
+        
+        Args:
+            job_id (int): ID of the job
+            days_done (int): Days fetched so far
+            days_total (int): Days the search has to fetch
+            tenders_matched (int): Tenders matching the keywords so far
+            commit (bool): Commit the transaction; False leaves it to the caller
+            
+        Returns:
+            bool: False if the job should stop, because its cancellation
+                was requested
+        """
+        return self._set(
+            job_id,
+            [Job.status == JobStatus.RUNNING, Job.cancel_requested.is_(False)],
+            {"days_done": days_done, "days_total": days_total,
+             "tenders_matched": tenders_matched},
+            commit,
+        )
+
+    def finish_job(self, job_id: int, status: JobStatus, counts: Optional[Dict] = None,
+                   error: Optional[str] = None, commit: bool = True) -> bool:
+        """
+        Record the end of a job
+        
+        Args:
+            job_id (int): ID of the job
+            status (JobStatus): completed, failed or cancelled
+            counts (Dict, optional): New, updated, unchanged and failed tenders
+            error (str, optional): Error that made the job fail
+            commit (bool): Commit the transaction; False leaves it to the caller
+            
+        Returns:
+            bool: False if the job had already finished
+        """
+        return self._set(
+            job_id, [Job.status.notin_(FINISHED_STATUSES)],
+            {"status": status, "counts": counts, "error": error,
+             "finished_at": datetime.utcnow()},
+            commit,
+        )
+
+    def cancel_job(self, job_id: int) -> Optional[Job]:
+        """
+        Cancel a job
+        
+        A queued job is cancelled at once; a running one is asked to stop,
+        and its worker marks it as cancelled once the days it already
+        fetched are saved.
+        
+        Args:
+            job_id (int): ID of the job
+            
+        Returns:
+            Optional[Job]: Job after the change, None if not found
+        """
+        if not self._set(
+            job_id, [Job.status == JobStatus.QUEUED],
+            {"status": JobStatus.CANCELLED, "finished_at": datetime.utcnow()}, commit=False,
+        ):
+            self._set(job_id, [Job.status == JobStatus.RUNNING],
+                      {"cancel_requested": True}, commit=False)
+        self.db.commit()
+        return self.get_job(job_id)
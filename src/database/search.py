@@ -0,0 +1,86 @@
+# src/database/search.py
+import re
+from typing import List, Optional
+
+from sqlalchemy import Float, String, select, text
+
+from src.utils.keyword_matcher import normalize_text
+
+# Relative weight of the code, name and description columns in SQLite ranking
+FTS_COLUMN_WEIGHTS = (0.0, 10.0, 1.0)
+
+
+def to_search_terms(term: Optional[str]) -> List[str]:
+    """
+    Split a search term into normalized words
+
+    Args:
+        term (str): Raw search term
+
+    Returns:
+        List[str]: Lower-cased words without accents; punctuation is dropped
+    """
+    return re.findall(r"\w+", normalize_text(term or ""))
+
+
+def build_match_query(words: List[str], dialect: str) -> str:
+    """
+    Build the full-text query matching every word as a prefix
+
+    Words come from to_search_terms, so they contain no query syntax.
+
+    Args:
+        words (List[str]): Normalized words
+        dialect (str): Database dialect name
+
+    Returns:
+        str: FTS5 MATCH expression or PostgreSQL tsquery
+    """
+    if dialect == "sqlite":
+        phrases = " AND ".join(f'"{word}"*' for word in words)
+        return f"{{name description}} : ({phrases})"
+    if dialect == "postgresql":
+        return " & ".join(f"{word}:*" for word in words)
+    raise ValueError(f"Unsupported database type: {dialect}")
+
+
+def match_codes(match_query: str, dialect: str):
+    """
+    Build a selectable of the codes of the matching tenders
+
+    Args:
+        match_query (str): Query built by build_match_query
+        dialect (str): Database dialect name
+
+    Returns:
+        Select of a single code column, usable in an IN condition
+    """
+    return select(ranked_matches(match_query, dialect).subquery("matches").c.code)
+
+
+def ranked_matches(match_query: str, dialect: str):
+    """
+    Build a select of the matching tenders with their relevance
+
+    Args:
+        match_query (str): Query built by build_match_query
+        dialect (str): Database dialect name
+
+    Returns:
+        Select with code and score columns; a lower score is more relevant
+    """
+    if dialect == "sqlite":
+        weights = ", ".join(str(weight) for weight in FTS_COLUMN_WEIGHTS)
+        statement = text(
+            f"SELECT code, bm25(tenders_fts, {weights}) AS score "
+            f"FROM tenders_fts WHERE tenders_fts MATCH :match_query"
+        )
+    elif dialect == "postgresql":
+        statement = text(
+            "SELECT code, -ts_rank(search_vector, to_tsquery('simple', :match_query)) AS score "
+            "FROM tenders WHERE search_vector @@ to_tsquery('simple', :match_query)"
+        )
+    else:
+        raise ValueError(f"Unsupported database type: {dialect}")
+
+    return statement.bindparams(match_query=match_query).columns(code=String, score=Float)
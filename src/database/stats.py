@@ -0,0 +1,237 @@
+# src/database/stats.py
+from collections import defaultdict
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Mapping, Optional, Set, Tuple
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.models.tender import Tender
+from src.models.tender_stat import TenderStat
+
+# Tender column aggregated by each dimension; month groups by creation_date
+STAT_COLUMNS = {
+    "organization": Tender.organization,
+    "region": Tender.buying_unit_region,
+    "tender_type": Tender.tender_type,
+    "status": Tender.status,
+}
+STAT_DIMENSIONS = ("organization", "region", "tender_type", "month", "status")
+
+# Single key counting every tender, which the dimensions cannot give: their
+# keys leave out the tenders with a null value
+TOTAL_DIMENSION = "total"
+TOTAL_KEY = "all"
+
+# Maximum number of keys per IN (...) condition
+KEY_BATCH_SIZE = 500
+
+StatKey = Tuple[str, str]
+
+
+def _to_key(value) -> Optional[str]:
+    """Convert a column value into a stat key"""
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return str(value.value)
+    return str(value)
+
+
+def _month_expression(dialect: str):
+    """YYYY-MM of the creation date, in SQL"""
+    if dialect == "sqlite":
+        return func.strftime("%Y-%m", Tender.creation_date)
+    if dialect == "postgresql":
+        return func.to_char(Tender.creation_date, "YYYY-MM")
+    raise ValueError(f"Unsupported database type: {dialect}")
+
+
+def stat_keys(values: Mapping) -> Set[StatKey]:
+    """
+    Get the stat keys a tender counts towards
+
+    Args:
+        values (Mapping): Column values of the tender by column name
+
+    Returns:
+        Set[StatKey]: (dimension, key) pairs; null values only count
+            towards the total
+    """
+    keys = {(TOTAL_DIMENSION, TOTAL_KEY)}
+    for dimension, column in STAT_COLUMNS.items():
+        key = _to_key(values.get(column.key))
+        if key is not None:
+            keys.add((dimension, key))
+
+    creation_date = values.get("creation_date")
+    if creation_date is not None:
+        keys.add(("month", creation_date.strftime("%Y-%m")))
+    return keys
+
+
+def add_stat_deltas(deltas: Dict[StatKey, Tuple[int, int]], values: Mapping,
+                    sign: int = 1) -> None:
+    """
+    Add the contribution of a tender to pending stat changes
+
+    Args:
+        deltas (Dict[StatKey, Tuple[int, int]]): (count, amount) change by
+            key, updated in place
+        values (Mapping): Column values of the tender by column name
+        sign (int): 1 to add the tender, -1 to remove it
+    """
+    amount = int(values.get("estimated_amount") or 0)
+    for key in stat_keys(values):
+        count_delta, amount_delta = deltas.get(key, (0, 0))
+        deltas[key] = (count_delta + sign, amount_delta + sign * amount)
+
+
+def subtract_stored_tenders(db: Session, codes: List[str],
+                            deltas: Dict[StatKey, Tuple[int, int]]) -> None:
+    """
+    Remove the contribution of stored tenders, before they are changed
+
+    Args:
+        db (Session): Database session
+        codes (List[str]): Tender codes
+        deltas (Dict[StatKey, Tuple[int, int]]): Pending changes, updated in place
+    """
+    columns = [Tender.creation_date, Tender.estimated_amount, *STAT_COLUMNS.values()]
+    for start in range(0, len(codes), KEY_BATCH_SIZE):
+        statement = select(*columns).where(Tender.code.in_(codes[start:start + KEY_BATCH_SIZE]))
+        for row in db.execute(statement):
+            add_stat_deltas(deltas, row._mapping, sign=-1)
+
+
+def apply_stat_deltas(db: Session, deltas: Dict[StatKey, Tuple[int, int]]) -> None:
+    """
+    Apply pending changes to the stats
+
+    The changes are added to the stored counts and amounts with one upsert,
+    so the cost depends on the tenders written and not on the size of the
+    tenders table. Runs inside the caller's transaction; the caller commits.
+
+    Args:
+        db (Session): Database session
+        deltas (Dict[StatKey, Tuple[int, int]]): (count, amount) change by key
+    """
+    now = datetime.utcnow()
+    rows = [
+        {
+            "dimension": dimension,
+            "key": key,
+            "tender_count": count,
+            "estimated_amount": amount,
+            "updated_at": now,
+        }
+        for (dimension, key), (count, amount) in deltas.items()
+        if count or amount
+    ]
+    if not rows:
+        return
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(TenderStat.__table__)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(TenderStat.__table__)
+    else:
+        raise ValueError(f"Unsupported database type for upserts: {dialect}")
+
+    statement = statement.on_conflict_do_update(
+        index_elements=[TenderStat.dimension, TenderStat.key],
+        set_={
+            "tender_count": TenderStat.tender_count + statement.excluded.tender_count,
+            "estimated_amount": TenderStat.estimated_amount + statement.excluded.estimated_amount,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+    db.execute(statement, rows)
+
+    # Keys left without tenders
+    by_dimension = defaultdict(list)
+    for row in rows:
+        by_dimension[row["dimension"]].append(row["key"])
+    for dimension, keys in by_dimension.items():
+        for start in range(0, len(keys), KEY_BATCH_SIZE):
+            db.execute(delete(TenderStat.__table__).where(
+                TenderStat.dimension == dimension,
+                TenderStat.key.in_(keys[start:start + KEY_BATCH_SIZE]),
+                TenderStat.tender_count <= 0,
+            ))
+
+
+def _aggregate(db: Session, dimension: str) -> List[Dict]:
+    """Count and sum the tenders of a dimension, grouped by key"""
+    if dimension == TOTAL_DIMENSION:
+        count, amount = db.execute(
+            select(func.count(), func.sum(Tender.estimated_amount)).select_from(Tender)
+        ).one()
+        results = [(TOTAL_KEY, count, amount)] if count else []
+    else:
+        if dimension == "month":
+            key_expression = _month_expression(db.get_bind().dialect.name)
+        else:
+            key_expression = STAT_COLUMNS[dimension]
+        results = db.execute(select(
+            key_expression, func.count(), func.sum(Tender.estimated_amount)
+        ).where(key_expression.isnot(None)).group_by(key_expression))
+
+    now = datetime.utcnow()
+    return [
+        {
+            "dimension": dimension,
+            "key": _to_key(key),
+            "tender_count": count,
+            "estimated_amount": int(amount or 0),
+            "updated_at": now,
+        }
+        for key, count, amount in results
+    ]
+
+
+def rebuild_tender_stats(db: Session) -> None:
+    """
+    Recompute every stat from the tenders table
+
+    Used to fill the stats of existing databases, and to repair them after
+    tenders were written without going through TenderRepository.
+
+    Args:
+        db (Session): Database session
+    """
+    db.execute(delete(TenderStat.__table__))
+    for dimension in (*STAT_DIMENSIONS, TOTAL_DIMENSION):
+        rows = _aggregate(db, dimension)
+        if rows:
+            db.execute(insert(TenderStat.__table__), rows)
+
+
+def stats_query(dimension: str, limit: int):
+    """
+    Build the select of the stats of a dimension
+
+    Months are listed in calendar order, other keys by tender count.
+
+    Args:
+        dimension (str): One of STAT_DIMENSIONS
+        limit (int): Maximum number of keys
+
+    Returns:
+        Select of TenderStat rows
+
+    Raises:
+        ValueError: If the dimension is unknown
+    """
+    if dimension not in STAT_DIMENSIONS:
+        raise ValueError(f"Unknown stats dimension: {dimension}")
+
+    order = (TenderStat.key,) if dimension == "month" else (
+        TenderStat.tender_count.desc(), TenderStat.key
+    )
+    return select(TenderStat).where(TenderStat.dimension == dimension).order_by(
+        *order
+    ).limit(limit)
@@ -0,0 +1,67 @@
+# src/database/versions.py
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.models.data_version import DataVersion
+
+# Data sets with a version, one per group of read endpoints
+TENDERS = "tenders"
+KEYWORDS = "keywords"
+
+
+def bump_data_version(db: Session, name: str) -> None:
+    """
+    Record a change of a data set
+
+    Runs inside the transaction making the change, so readers see the new
+    version together with the new data. The caller commits. A single
+    INSERT ... ON CONFLICT (name) DO UPDATE, so the first writers of a data
+    set never race on inserting its row; the migrations seed the rows anyway.
+
+    Args:
+        db (Session): Database session
+        name (str): Data set changed
+    """
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        statement = postgresql.insert(DataVersion.__table__)
+    elif dialect == "sqlite":
+        statement = sqlite.insert(DataVersion.__table__)
+    else:
+        raise ValueError(f"Unsupported database type for upserts: {dialect}")
+
+    statement = statement.values(name=name, version=1, updated_at=datetime.utcnow())
+    db.execute(statement.on_conflict_do_update(
+        index_elements=[DataVersion.name],
+        set_={
+            "version": DataVersion.version + 1,
+            "updated_at": statement.excluded.updated_at,
+        },
+    ))
+
+
+async def get_data_version(db: AsyncSession, name: str) -> Tuple[int, Optional[datetime]]:
+    """
+    Get the current version of a data set
+
+    A primary key lookup, cheap enough to run before deciding whether a
+    read endpoint has anything new to send.
+
+    Args:
+        db (AsyncSession): Database session
+        name (str): Data set
+
+    Returns:
+        Tuple[int, Optional[datetime]]: Version and date of the last change;
+            (0, None) if the data set never changed
+    """
+    result = await db.execute(
+        select(DataVersion.version, DataVersion.updated_at).where(DataVersion.name == name)
+    )
+    row = result.first()
+    return (row.version, row.updated_at) if row else (0, None)
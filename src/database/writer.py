@@ -0,0 +1,159 @@
+# src/database/writer.py
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session, sessionmaker
+
+from src.config.settings import DB_WRITER_BATCH_SIZE, DB_WRITER_QUEUE_SIZE
+from src.database.base import WriteSessionLocal
+from src.utils.logger import setup_logger
+
+WriteJob = Callable[[Session], Any]
+
+
+class DatabaseWriter:
+    """
+    Single writer thread applying queued write jobs in batches
+
+    A write job is a function receiving the writer's session; it must not
+    commit. The writer drains up to batch_size queued jobs and applies them
+    in one transaction, so concurrent producers cost one lock acquisition
+    and one commit per batch instead of per job. Its session comes from
+    WriteSessionLocal, so on SQLite the transaction starts with BEGIN
+    IMMEDIATE: the write lock is taken up front, and a busy database makes
+    the writer wait instead of failing halfway through.
+
+    If a batch fails, its jobs are retried one per transaction, so a bad job
+    only fails its own future.
+    """
+
+    def __init__(self, session_factory: sessionmaker = WriteSessionLocal,
+                 batch_size: int = DB_WRITER_BATCH_SIZE,
+                 queue_size: int = DB_WRITER_QUEUE_SIZE):
+        """
+        Initialize the writer and start its thread
+
+        Args:
+            session_factory: Factory of the session owned by the writer thread
+            batch_size: Maximum number of jobs committed together
+            queue_size: Maximum number of queued jobs before submit blocks
+        """
+        self.session_factory = session_factory
+        self.batch_size = max(1, batch_size)
+        self.logger = setup_logger(__name__)
+        self._queue: "queue.Queue[Optional[Tuple[WriteJob, Future]]]" = queue.Queue(
+            maxsize=max(1, queue_size)
+        )
+        self._thread = threading.Thread(target=self._run, name="database-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, job: WriteJob) -> Future:
+        """
+        Queue a write job
+
+        Args:
+            job: Function applying the write with the given session, without
+                committing
+
+        Returns:
+            Future: Resolves to the value returned by the job once committed
+        """
+        future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def write(self, job: WriteJob) -> Any:
+        """
+        Queue a write job and wait until it is committed
+
+        Args:
+            job: Function applying the write with the given session
+
+        Returns:
+            Any: Value returned by the job
+
+        Raises:
+            Exception: Error raised by the job or by the commit
+        """
+        return self.submit(job).result()
+
+    def close(self) -> None:
+        """Apply the queued jobs and stop the writer thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _next_batch(self) -> Tuple[List[Tuple[WriteJob, Future]], bool]:
+        """Wait for a job, then take whatever else is queued up to batch_size"""
+        batch = []
+        item = self._queue.get()
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _run(self) -> None:
+        """Writer thread loop"""
+        session = self.session_factory()
+        try:
+            stopping = False
+            while not stopping:
+                batch, stopping = self._next_batch()
+                if batch:
+                    self._apply_batch(session, batch)
+        finally:
+            session.close()
+
+    def _apply_batch(self, session: Session, batch: List[Tuple[WriteJob, Future]]) -> None:
+        """Apply a batch in one transaction, falling back to one job per transaction"""
+        pending = [(job, future) for job, future in batch if future.set_running_or_notify_cancel()]
+        if not pending:
+            return
+
+        try:
+            results = [job(session) for job, _ in pending]
+            session.commit()
+        except Exception as e:
+            session.rollback()
+            if len(pending) == 1:
+                pending[0][1].set_exception(e)
+                return
+            self.logger.warning(
+                f"Error writing batch of {len(pending)} jobs, retrying one by one: {str(e)}"
+            )
+            for job, future in pending:
+                try:
+                    result = job(session)
+                    session.commit()
+                    future.set_result(result)
+                except Exception as job_error:
+                    session.rollback()
+                    future.set_exception(job_error)
+            return
+
+        for (_, future), result in zip(pending, results):
+            future.set_result(result)
+
+
+_writer: Optional[DatabaseWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_database_writer() -> DatabaseWriter:
+    """
+    Get the process-wide database writer
+
+    Returns:
+        DatabaseWriter: Writer shared by every component of this process
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = DatabaseWriter()
+        return _writer
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime, Integer, String
+from src.database.base import Base
+
+
+class DataVersion(Base):
+    """Model for storing a counter bumped on every change of a data set"""
+    __tablename__ = "data_versions"
+
+    name = Column(String, primary_key=True, doc="Data set: tenders or keywords")
+    version = Column(Integer, nullable=False, default=0,
+                     doc="Incremented by every transaction changing the data set")
+    updated_at = Column(DateTime, nullable=True,
+                        doc="Date when the data set last changed")
+
+    def __repr__(self):
+        """String representation of the data version"""
+        return f"<DataVersion(name='{self.name}', version={self.version})>"
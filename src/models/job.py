@@ -0,0 +1,57 @@
+from sqlalchemy import Boolean, Column, DateTime, Integer, JSON, Text, Enum as SQLAlchemyEnum
+from datetime import datetime
+from typing import Optional
+from src.database.base import Base
+import enum
+
+class JobStatus(enum.Enum):
+    """Lifecycle state of a job"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+# States a job never leaves
+FINISHED_STATUSES = (JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class Job(Base):
+    """Model for storing a search run and its progress"""
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True, autoincrement=True,
+                doc="Unique identifier for the job")
+    status = Column(SQLAlchemyEnum(JobStatus), nullable=False, default=JobStatus.QUEUED,
+                    doc="State of the job")
+    params = Column(JSON, nullable=False, default=dict,
+                    doc="Parameters of the search: days and status")
+    days_total = Column(Integer, nullable=True, doc="Days the search has to fetch")
+    days_done = Column(Integer, nullable=False, default=0, doc="Days fetched so far")
+    tenders_matched = Column(Integer, nullable=False, default=0,
+                             doc="Tenders matching the keywords found so far")
+    counts = Column(JSON, nullable=True,
+                    doc="New, updated, unchanged and failed tenders, once finished")
+    error = Column(Text, nullable=True, doc="Error that made the job fail")
+    cancel_requested = Column(Boolean, nullable=False, default=False,
+                              doc="Whether the job should stop at the next check")
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow,
+                        doc="Date when the job was queued")
+    started_at = Column(DateTime, nullable=True, doc="Date when a worker picked the job")
+    finished_at = Column(DateTime, nullable=True, doc="Date when the job finished")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow,
+                        doc="Date of the last progress report")
+
+    @property
+    def eta_seconds(self) -> Optional[float]:
+        """Estimated seconds left, from the average time per day done so far"""
+        if (self.status != JobStatus.RUNNING or not self.days_done
+                or not self.days_total or self.started_at is None):
+            return None
+        elapsed = (self.updated_at - self.started_at).total_seconds()
+        remaining = max(0, self.days_total - self.days_done)
+        return round(elapsed / self.days_done * remaining, 1)
+
+    def __repr__(self):
+        """String representation of the job"""
+        return f"<Job(id={self.id}, status={self.status.value}, days_done={self.days_done})>"
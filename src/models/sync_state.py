@@ -0,0 +1,28 @@
+from sqlalchemy import Column, Date, DateTime, Integer, String
+from src.database.base import Base
+
+
+class SyncState(Base):
+    """Model for storing the sync progress of each day of tenders"""
+    __tablename__ = "sync_states"
+
+    sync_date = Column(Date, primary_key=True,
+                       doc="Day whose listing was synchronized")
+    status = Column(String, primary_key=True,
+                    doc="Status filter used for the listing")
+    keyword_version = Column(String, primary_key=True,
+                             doc="Version of the keyword set used for matching")
+    started_at = Column(DateTime, nullable=True,
+                        doc="Date when the last sync of the day started")
+    completed_at = Column(DateTime, nullable=True,
+                          doc="Date when the day was fully synchronized")
+    listed_count = Column(Integer, nullable=True, doc="Tenders in the day listing")
+    matched_count = Column(Integer, nullable=True, doc="Tenders matching the keywords")
+    fetched_count = Column(Integer, nullable=True, doc="Tenders whose details were fetched")
+
+    def __repr__(self):
+        """String representation of the sync state"""
+        return (
+            f"<SyncState(sync_date={self.sync_date}, status='{self.status}', "
+            f"completed_at={self.completed_at})>"
+        )
@@ -1,9 +1,12 @@
 # src/models/tender.py
-from sqlalchemy import BigInteger, Boolean, Column, DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import (
+    BigInteger, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String
+)
 from sqlalchemy import Enum as SQLAlchemyEnum
 from sqlalchemy.dialects.sqlite import JSON
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from typing import Dict, List, Optional
 
 from src.database.base import Base
 
@@ -19,6 +22,16 @@ from .enum import (
 
 class Tender(Base):
     __tablename__ = "tenders"
+    __table_args__ = (
+        # Listing queries: filters of get_tenders_with_filters, newest first.
+        # Existing databases get them from src/database/migrations.py
+        Index("ix_tenders_created_at_code", "created_at", "code"),
+        Index("ix_tenders_status_created_at_code", "status", "created_at", "code"),
+        Index("ix_tenders_creation_date", "creation_date"),
+        Index("ix_tenders_status_creation_date", "status", "creation_date"),
+        Index("ix_tenders_closing_date_code", "closing_date", "code"),
+        Index("ix_tenders_organization_code_created_at", "organization_code", "created_at"),
+    )
 
     # Identificación y datos básicos
     code = Column(String, primary_key=True, doc="Código único de la licitación")
@@ -146,6 +159,9 @@ class Tender(Base):
     # Datos adicionales
     items = Column("items", JSON, nullable=True, doc="Información de ítems en formato JSON")
     awarded_suppliers = Column(JSON, nullable=True, doc="Información de proveedores adjudicados")
+    content_hash = Column(
+        String(64), nullable=True, doc="Hash del contenido, usado para detectar cambios"
+    )
 
     # Relaciones
     tender_items = relationship("TenderItem", back_populates="tender", cascade="all, delete-orphan")
@@ -211,6 +227,11 @@ class Tender(Base):
 
 class TenderItem(Base):
     __tablename__ = "tender_items"
+    __table_args__ = (
+        Index("ix_tender_items_tender_code", "tender_code"),
+        Index("ix_tender_items_category_code", "category_code", "tender_code"),
+        Index("ix_tender_items_product_code", "product_code", "tender_code"),
+    )
 
     id = Column(Integer, primary_key=True)
     tender_code = Column(String, ForeignKey("tenders.code"))
@@ -223,5 +244,48 @@ class TenderItem(Base):
     quantity = Column(Float, nullable=True)
     unit = Column(String, nullable=True)
 
+    # Adjudicación del ítem
+    supplier_tax_id = Column(String, nullable=True, doc="RUT del proveedor adjudicado")
+    supplier_name = Column(String, nullable=True, doc="Nombre del proveedor adjudicado")
+    awarded_quantity = Column(Float, nullable=True, doc="Cantidad adjudicada")
+    unit_price = Column(Float, nullable=True, doc="Monto unitario adjudicado")
+
     # Relationship
     tender = relationship("Tender", back_populates="tender_items")
+
+    @staticmethod
+    def rows_from_items(tender_code: str, items: Optional[List[Dict]]) -> List[Dict]:
+        """
+        Convert the parsed items of a tender into tender_items rows
+
+        Args:
+            tender_code: Code of the tender
+            items: Items as stored in Tender.items
+
+        Returns:
+            List[Dict]: Column values of each item row
+        """
+        def optional_str(value):
+            return str(value) if value is not None else None
+
+        rows = []
+        for item in items or []:
+            if not isinstance(item, dict):
+                continue
+            award = item.get("award") or {}
+            rows.append({
+                "tender_code": tender_code,
+                "correlative": optional_str(item.get("correlative")),
+                "category_code": optional_str(item.get("category_code")),
+                "category_name": item.get("category_name"),
+                "product_code": optional_str(item.get("product_code")),
+                "product_name": item.get("product_name"),
+                "description": item.get("description"),
+                "quantity": item.get("quantity"),
+                "unit": item.get("unit"),
+                "supplier_tax_id": award.get("supplier_tax_id"),
+                "supplier_name": award.get("supplier_name"),
+                "awarded_quantity": award.get("awarded_quantity"),
+                "unit_price": award.get("unit_price"),
+            })
+        return rows
@@ -0,0 +1,26 @@
+from sqlalchemy import BigInteger, Column, DateTime, Integer, String
+from datetime import datetime
+from src.database.base import Base
+
+
+class TenderStat(Base):
+    """Model for storing the tender count and amount of one key of a dimension"""
+    __tablename__ = "tender_stats"
+
+    dimension = Column(String, primary_key=True,
+                       doc="Dimension aggregated: organization, region, tender_type, month, "
+                           "status, or total for the count of every tender")
+    key = Column(String, primary_key=True, doc="Value of the dimension")
+    tender_count = Column(Integer, nullable=False, default=0,
+                          doc="Number of tenders with this value")
+    estimated_amount = Column(BigInteger, nullable=False, default=0,
+                              doc="Sum of the estimated amounts of those tenders")
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow,
+                        doc="Date when the key was last refreshed")
+
+    def __repr__(self):
+        """String representation of the tender stat"""
+        return (
+            f"<TenderStat(dimension='{self.dimension}', key='{self.key}', "
+            f"tender_count={self.tender_count})>"
+        )
@@ -0,0 +1,310 @@
+# src/pipeline/jobs.py
+"""
+Job runner executing the searches queued by POST /api/execute
+
+Run exactly one per deployment, next to the API:
+
+    python -m src.pipeline.jobs
+
+It claims queued jobs from the jobs table and runs each one in a pool of
+JOB_WORKERS spawned processes, so the API processes never run searches and
+JOB_WORKERS bounds the searches sharing the rate limit. A runner lock keeps
+a second runner against the same database on standby, waiting for the lock
+until the first one stops. At startup, jobs left running by a previous
+runner are queued again.
+"""
+import multiprocessing
+import os
+import signal
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+from sqlalchemy import text
+
+from src.api.public_market_api import PublicMarketAPI
+from src.config.settings import JOB_POLL_INTERVAL, JOB_PROGRESS_INTERVAL, JOB_WORKERS
+from src.database.base import SessionLocal, WriteSessionLocal, engine
+from src.database.repository import JobRepository, TenderRepository
+from src.database.writer import DatabaseWriter, get_database_writer
+from src.models.job import JobStatus
+from src.pipeline.sync import run_sync
+from src.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Key of the PostgreSQL advisory lock held by the job runner
+RUNNER_LOCK_KEY = (7301, 0)
+
+
+class _ProgressReporter:
+    """
+    Progress callback of run_sync recording the progress of a job
+
+    Reports once per day done, and otherwise at most every interval
+    seconds. Each report also tells whether the job was cancelled.
+    """
+
+    def __init__(self, job_id: int, writer: DatabaseWriter,
+                 interval: float = JOB_PROGRESS_INTERVAL):
+        self.job_id = job_id
+        self.writer = writer
+        self.interval = interval
+        self.cancelled = False
+        self._last_days_done = None
+        self._last_report = 0.0
+
+    def __call__(self, days_done: int, days_total: int, tenders_matched: int) -> bool:
+        now = time.monotonic()
+        if days_done == self._last_days_done and now - self._last_report < self.interval:
+            return True
+        self._last_days_done = days_done
+        self._last_report = now
+
+        keep_going = self.writer.write(lambda session: JobRepository(session).report_progress(
+            self.job_id, days_done, days_total, tenders_matched, commit=False
+        ))
+        if not keep_going:
+            self.cancelled = True
+        return keep_going
+
+
+def run_search_job(job_id: int) -> None:
+    """
+    Run a claimed search job to its end
+
+    Executed in a worker process of JobRunner, with sessions of its own.
+
+    Args:
+        job_id (int): ID of a job claimed by the runner
+    """
+    writer = get_database_writer()
+    db = SessionLocal()
+    try:
+        job = JobRepository(db).get_job(job_id)
+        if job is None or job.status != JobStatus.RUNNING:
+            logger.info(f"Job {job_id} is no longer running, skipping it")
+            return
+        params = dict(job.params)
+
+        reporter = _ProgressReporter(job_id, writer)
+        try:
+            counts = run_sync(
+                PublicMarketAPI(),
+                TenderRepository(db),
+                include_keywords=params["include_keywords"],
+                exclude_keywords=params["exclude_keywords"],
+                days_back=params["days"],
+                status=params["status"],
+                on_progress=reporter,
+            )
+        except Exception as e:
+            logger.error(f"Error in job {job_id}: {str(e)}")
+            error = str(e)
+            writer.write(lambda session: JobRepository(session).finish_job(
+                job_id, JobStatus.FAILED, error=error, commit=False
+            ))
+            return
+
+        status = JobStatus.CANCELLED if reporter.cancelled else JobStatus.COMPLETED
+        writer.write(lambda session: JobRepository(session).finish_job(
+            job_id, status, counts=counts, commit=False
+        ))
+        logger.info(f"Job {job_id} {status.value}: {counts}")
+    finally:
+        db.close()
+
+
+def _ignore_interrupts() -> None:
+    """Leave Ctrl+C to the runner, which lets running jobs finish"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def acquire_runner_lock():
+    """
+    Take the lock allowing a single job runner per database
+
+    PostgreSQL gets a session advisory lock; SQLite a file lock next to the
+    database file. Both are released when the process ends, however it ends.
+
+    Returns:
+        Handle to keep open while running, or None if another runner holds it
+    """
+    if engine.dialect.name == "postgresql":
+        connection = engine.connect()
+        locked = connection.execute(
+            text("SELECT pg_try_advisory_lock(:namespace, :key)"),
+            {"namespace": RUNNER_LOCK_KEY[0], "key": RUNNER_LOCK_KEY[1]},
+        ).scalar()
+        connection.commit()
+        if not locked:
+            connection.close()
+            return None
+        return connection
+
+    lock_file = open(f"{os.path.abspath(engine.url.database)}.jobs.lock", "a")
+    if fcntl:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            return None
+    return lock_file
+
+
+class JobRunner:
+    """
+    Dispatcher running queued search jobs in a pool of worker processes
+
+    Searches block on the network and parse payloads for minutes, so they
+    run outside the API processes and never hold their event loops or
+    threadpools. The jobs table is the only channel between both: the API
+    queues jobs and reads their progress, workers report it.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, poll_interval: float = JOB_POLL_INTERVAL):
+        self.workers = max(1, workers)
+        self.poll_interval = poll_interval
+        self._pool = self._create_pool()
+        self._running: Dict[int, Future] = {}
+        self._stop = threading.Event()
+
+    def _create_pool(self) -> ProcessPoolExecutor:
+        """Create the pool of worker processes"""
+        # Spawned workers do not inherit the threads and locks of this process
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_ignore_interrupts,
+        )
+
+    def recover(self) -> None:
+        """Queue again the jobs left running by a previous runner"""
+        with WriteSessionLocal() as db:
+            requeued = JobRepository(db).requeue_running_jobs()
+        if requeued:
+            logger.warning(f"Queued again {requeued} jobs interrupted by a runner restart")
+
+    def submit(self, job_id: int) -> Future:
+        """
+        Run a claimed job on the next free worker
+
+        Args:
+            job_id (int): ID of a claimed job
+
+        Returns:
+            Future: Completes when the worker is done with the job
+        """
+        try:
+            future = self._pool.submit(run_search_job, job_id)
+        except BrokenProcessPool:
+            # A worker died; the futures of the old pool failed with it
+            logger.warning("Job worker pool broken, starting a new one")
+            self._pool = self._create_pool()
+            future = self._pool.submit(run_search_job, job_id)
+        future.add_done_callback(lambda done: self._record_crash(job_id, done))
+        return future
+
+    def _record_crash(self, job_id: int, future: Future) -> None:
+        """Finish a job whose worker could not record its end"""
+        if future.cancelled():
+            return
+        error = future.exception()
+        if error is None:
+            return
+
+        logger.error(f"Job {job_id} failed: worker failed: {error}")
+        db = WriteSessionLocal()
+        try:
+            JobRepository(db).finish_job(job_id, JobStatus.FAILED, error=f"Worker failed: {error}")
+        except Exception as e:
+            logger.error(f"Error recording the end of job {job_id}: {str(e)}")
+        finally:
+            db.close()
+
+    def dispatch(self) -> int:
+        """
+        Claim queued jobs while there are free workers
+
+        Returns:
+            int: Number of jobs claimed
+        """
+        self._running = {
+            job_id: future for job_id, future in self._running.items() if not future.done()
+        }
+        claimed = 0
+        while len(self._running) < self.workers:
+            with WriteSessionLocal() as db:
+                job_id = JobRepository(db).claim_next_job()
+            if job_id is None:
+                break
+            logger.info(f"Starting job {job_id}")
+            self._running[job_id] = self.submit(job_id)
+            claimed += 1
+        return claimed
+
+    def run(self) -> None:
+        """Recover interrupted jobs, then dispatch queued ones until stopped"""
+        self.recover()
+        logger.info(f"Job runner started with {self.workers} workers")
+        try:
+            while not self._stop.is_set():
+                try:
+                    self.dispatch()
+                except Exception as e:
+                    logger.error(f"Error dispatching jobs: {str(e)}")
+                self._stop.wait(self.poll_interval)
+        finally:
+            # Running jobs finish; if the process is killed first, the next
+            # runner queues them again
+            self._pool.shutdown(wait=True)
+            logger.info("Job runner stopped")
+
+    def stop(self) -> None:
+        """Stop claiming jobs"""
+        self._stop.set()
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait until the runner is stopped
+
+        Args:
+            timeout (float): Maximum seconds to wait
+
+        Returns:
+            bool: True if it was stopped
+        """
+        return self._stop.wait(timeout)
+
+
+def main() -> int:
+    """Run the job runner until SIGTERM or SIGINT"""
+    runner = JobRunner()
+    signal.signal(signal.SIGTERM, lambda signum, frame: runner.stop())
+    signal.signal(signal.SIGINT, lambda signum, frame: runner.stop())
+
+    lock = acquire_runner_lock()
+    if lock is None:
+        logger.info("Another job runner holds the runner lock, waiting for it")
+    while lock is None:
+        if runner.wait(runner.poll_interval):
+            return 0
+        lock = acquire_runner_lock()
+
+    try:
+        runner.run()
+    finally:
+        lock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
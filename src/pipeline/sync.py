@@ -0,0 +1,330 @@
+import hashlib
+import json
+from datetime import date, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+from src.api.public_market_api import SEARCH_STATUSES, DayResult, PublicMarketAPI
+from src.config.settings import SYNC_CHUNK_SIZE, SYNC_HOT_DAYS
+from src.database.base import SessionLocal
+from src.database.repository import SyncStateRepository, TenderRepository
+from src.database.writer import DatabaseWriter, get_database_writer
+from src.models.tender import Tender
+from src.utils.logger import setup_logger
+from src.utils.safe_load import remove_accents
+
+logger = setup_logger(__name__)
+
+
+def chunked(items: Iterable, size: int) -> Iterator[List]:
+    """
+    Split an iterable into lists of at most size elements
+
+    Args:
+        items: Iterable to split
+        size: Maximum chunk size
+
+    Yields:
+        List: Consecutive chunks of items
+    """
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, max(1, size)))
+        if not chunk:
+            return
+        yield chunk
+
+
+def keyword_set_version(include_keywords: List[str], exclude_keywords: List[str]) -> str:
+    """
+    Get a short version identifier of a keyword set
+
+    The version only depends on the normalized keywords, so reordering them or
+    changing accents or case does not invalidate previous syncs.
+
+    Args:
+        include_keywords: List of keywords to search for
+        exclude_keywords: List of keywords to exclude
+
+    Returns:
+        str: Version identifier
+    """
+    def normalize(keywords: List[str]) -> List[str]:
+        return sorted({remove_accents(keyword).lower().strip() for keyword in keywords})
+
+    payload = json.dumps({
+        "include": normalize(include_keywords),
+        "exclude": normalize(exclude_keywords),
+    })
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+def normalize_status(status: str) -> str:
+    """
+    Validate the status filter of a sync
+
+    Checkpoints are keyed by the status, so a typo must fail instead of
+    running an empty sync and recording it as completed.
+
+    Args:
+        status: Status filter, in any case
+
+    Returns:
+        str: Status in lower case
+
+    Raises:
+        ValueError: If the status is not one of SEARCH_STATUSES
+    """
+    normalized = (status or "").strip().lower()
+    if normalized not in SEARCH_STATUSES:
+        raise ValueError(
+            f"Invalid status '{status}', expected one of: {', '.join(SEARCH_STATUSES)}"
+        )
+    return normalized
+
+
+def _save_tenders(tenders: List[Tender], writer: DatabaseWriter,
+                  counts: Dict[str, int]) -> bool:
+    """
+    Save a chunk of tenders through the database writer, updating counts in place
+
+    The chunk is written in a single upsert. If that fails, its tenders are
+    retried one by one so a single bad tender only loses itself.
+
+    Returns:
+        bool: True if every tender of the chunk was saved
+    """
+    if not tenders:
+        return True
+
+    saved_all = True
+    try:
+        chunk_counts = writer.write(
+            lambda session: TenderRepository(session).upsert_many(tenders, commit=False)
+        )
+    except Exception as e:
+        logger.warning(f"Error saving chunk of {len(tenders)} tenders, retrying one by one: {str(e)}")
+        chunk_counts = {"new": 0, "updated": 0, "unchanged": 0}
+        for tender in tenders:
+            try:
+                tender_counts = writer.write(
+                    lambda session: TenderRepository(session).upsert_many([tender], commit=False)
+                )
+                for key, value in tender_counts.items():
+                    chunk_counts[key] += value
+            except Exception as e:
+                logger.error(f"Error processing tender {tender.code}: {str(e)}")
+                counts["failed"] += 1
+                saved_all = False
+
+    for key, value in chunk_counts.items():
+        counts[key] += value
+
+    logger.info(
+        f"Saved chunk of {len(tenders)} tenders "
+        f"(new: {counts['new']}, updated: {counts['updated']}, "
+        f"unchanged: {counts['unchanged']})"
+    )
+    return saved_all
+
+
+def persist_tenders(events: Iterable[Union[Tender, DayResult]],
+                    writer: Optional[DatabaseWriter] = None,
+                    chunk_size: int = SYNC_CHUNK_SIZE, status: str = None,
+                    keyword_version: str = None) -> Dict[str, int]:
+    """
+    Persistence stage of the sync pipeline
+
+    Consumes tenders as they are produced and writes them chunk by chunk
+    through the database writer, so memory stays bounded by the chunk size
+    and saved tenders become visible while the search is still running.
+
+    When a keyword version is given, each DayResult in the stream marks its
+    day as completed, but only once every tender emitted before it has been
+    written, so an interrupted run never loses a day.
+
+    Args:
+        events: Tenders to save, optionally interleaved with DayResult
+            summaries (PublicMarketAPI.iter_search_events)
+        writer: Database writer applying the writes (defaults to the
+            process-wide writer)
+        chunk_size: Number of tenders written per chunk
+        status: Status filter of the sync, required to record days
+        keyword_version: Version of the keyword set; days are recorded only
+            when it is given
+
+    Returns:
+        Dict[str, int]: Number of new, updated, unchanged and failed tenders
+    """
+    writer = writer or get_database_writer()
+    counts = {"new": 0, "updated": 0, "unchanged": 0, "failed": 0}
+    buffer = []
+    pending_days = []
+
+    def complete_days(days: List[DayResult]) -> None:
+        for day_result in days:
+            if day_result.failed:
+                logger.warning(
+                    f"Day {day_result.day} had {day_result.failed} failed tenders, "
+                    f"it will be fetched again on the next run"
+                )
+                continue
+            if keyword_version is not None:
+                writer.write(lambda session: SyncStateRepository(session).mark_completed(
+                    day_result.day, status, keyword_version,
+                    listed_count=day_result.listed,
+                    matched_count=day_result.matched,
+                    fetched_count=day_result.fetched,
+                    commit=False,
+                ))
+
+    def flush() -> None:
+        saved_all = _save_tenders(buffer, writer, counts)
+        if saved_all:
+            complete_days(pending_days)
+        buffer.clear()
+        pending_days.clear()
+
+    for event in events:
+        if isinstance(event, DayResult):
+            pending_days.append(event)
+            if not buffer:
+                flush()
+            continue
+
+        buffer.append(event)
+        if len(buffer) >= chunk_size:
+            flush()
+
+    flush()
+    return counts
+
+
+def track_progress(events: Iterator[Union[Tender, DayResult]], days_total: int,
+                   on_progress: Callable[[int, int, int], bool]) -> Iterator[Union[Tender, DayResult]]:
+    """
+    Report the progress of a search stream and stop it on request
+
+    Args:
+        events: Stream of PublicMarketAPI.iter_search_events
+        days_total: Number of days the search fetches
+        on_progress: Called with (days done, days total, tenders matched)
+            before the first event and after each one; returning False
+            stops the stream
+
+    Yields:
+        Union[Tender, DayResult]: Events of the stream, until stopped
+    """
+    days_done = tenders_matched = 0
+    try:
+        if not on_progress(days_done, days_total, tenders_matched):
+            return
+        for event in events:
+            yield event
+            if isinstance(event, DayResult):
+                days_done += 1
+            else:
+                tenders_matched += 1
+            if not on_progress(days_done, days_total, tenders_matched):
+                logger.info(f"Search stopped after {days_done} of {days_total} days")
+                return
+    finally:
+        # Stops the fetch thread when the stream is left early
+        events.close()
+
+
+def get_skip_dates(sync_repo: SyncStateRepository, days_back: int, status: str,
+                   keyword_version: str, hot_days: int = SYNC_HOT_DAYS) -> List[date]:
+    """
+    Get the days of a search window that do not need to be fetched again
+
+    Args:
+        sync_repo: Repository recording completed days
+        days_back: Number of days to look back
+        status: Status filter of the sync
+        keyword_version: Version of the keyword set of the sync
+        hot_days: Number of most recent days that are always refreshed
+
+    Returns:
+        List[date]: Completed days outside the hot window
+    """
+    end_date = date.today()
+    start_date = end_date - timedelta(days=days_back)
+    first_hot_date = end_date - timedelta(days=max(0, hot_days - 1))
+    completed = sync_repo.get_completed_dates(start_date, end_date, status, keyword_version)
+    return [day for day in completed if day < first_hot_date]
+
+
+def run_sync(api: PublicMarketAPI, tender_repo: TenderRepository,
+             include_keywords: List[str], exclude_keywords: List[str],
+             days_back: int = 30, status: str = "publicada",
+             chunk_size: int = SYNC_CHUNK_SIZE, resume: bool = True,
+             on_progress: Optional[Callable[[int, int, int], bool]] = None) -> Dict[str, int]:
+    """
+    Search tenders and stream them into the database
+
+    Days already synchronized with the same status filter and keyword set
+    are skipped, except for the most recent SYNC_HOT_DAYS, which are always
+    refreshed. Interrupted days were never marked as completed, so a rerun
+    picks them up again. That includes the days left when on_progress stops
+    the search: what was fetched before is still saved.
+
+    Args:
+        api: API client used for the search
+        tender_repo: Repository whose session reads the sync state; writes
+            go through the process-wide database writer
+        include_keywords: List of keywords to search for
+        exclude_keywords: List of keywords to exclude
+        days_back: Number of days to look back
+        status: Status of tenders to search
+        chunk_size: Number of tenders written per chunk
+        resume: Skip days completed by previous runs
+        on_progress: Called with (days done, days total, tenders matched)
+            as the search advances; returning False stops it
+
+    Returns:
+        Dict[str, int]: Number of new, updated, unchanged and failed tenders.
+            Unchanged includes the tenders whose details were not fetched.
+
+    Raises:
+        ValueError: If the status is not one of SEARCH_STATUSES
+    """
+    status = normalize_status(status)
+    sync_repo = SyncStateRepository(tender_repo.db)
+    version = keyword_set_version(include_keywords, exclude_keywords)
+
+    skip_dates = set()
+    if resume:
+        skip_dates = set(get_skip_dates(sync_repo, days_back, status, version))
+        logger.info(f"Skipping {len(skip_dates)} days already synchronized")
+
+    end_date = date.today()
+    pending_dates = [end_date - timedelta(days=offset) for offset in range(days_back + 1)]
+    started_dates = [day for day in pending_dates if day not in skip_dates]
+    writer = get_database_writer()
+    writer.write(lambda session: SyncStateRepository(session).mark_started(
+        started_dates, status, version, commit=False
+    ))
+
+    # The fetch thread looks up known tenders while this thread writes,
+    # so it gets a session of its own
+    lookup_db = SessionLocal()
+    try:
+        events = api.iter_search_events(
+            include_keywords=include_keywords,
+            exclude_keywords=exclude_keywords,
+            days_back=days_back,
+            status=status,
+            tender_repo=TenderRepository(lookup_db),
+            skip_dates=skip_dates,
+        )
+        if on_progress is not None:
+            events = track_progress(events, len(started_dates), on_progress)
+        counts = persist_tenders(
+            events, writer, chunk_size, status=status, keyword_version=version,
+        )
+    finally:
+        lookup_db.close()
+
+    counts["unchanged"] += api.skipped_unchanged
+    return counts
@@ -0,0 +1,44 @@
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict
+
+# Bookkeeping attributes that are not part of the tender content
+EXCLUDED_FIELDS = {"content_hash", "created_at", "updated_at"}
+
+
+def _normalize(value: Any) -> Any:
+    """Convert a value into the form it takes once stored and read back"""
+    if isinstance(value, datetime):
+        # Dates are stored naive
+        return value.replace(tzinfo=None).isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, float) and value.is_integer():
+        # Amounts decoded as floats are stored in integer columns
+        return int(value)
+    return value
+
+
+def compute_content_hash(fields: Dict[str, Any]) -> str:
+    """
+    Compute the content hash of a tender
+
+    Unset (None) attributes are left out, so a tender decoded from a payload
+    and the same tender read back from the database hash identically.
+
+    Args:
+        fields (Dict[str, Any]): Tender attributes by name
+
+    Returns:
+        str: Hex SHA-256 digest of the normalized attributes
+    """
+    content = {
+        name: _normalize(value) for name, value in fields.items()
+        if value is not None and name not in EXCLUDED_FIELDS
+    }
+    payload = json.dumps(content, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -0,0 +1,40 @@
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(created_at: datetime, code: str) -> str:
+    """
+    Encode a keyset position into an opaque cursor
+
+    Args:
+        created_at (datetime): created_at of the last tender of a page
+        code (str): Code of the last tender of a page
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = json.dumps([created_at.isoformat(), code], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor (str): Opaque cursor
+
+    Returns:
+        Tuple[datetime, str]: (created_at, code) keyset position
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, code = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(code)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
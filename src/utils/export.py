@@ -0,0 +1,182 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Iterable, Iterator, List, Sequence
+
+from sqlalchemy import Boolean, Column, DateTime, Float, Integer
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None
+
+# Media type of each export format
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+
+def _to_plain(value):
+    """Convert a column value into a JSON-compatible value"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return float(value)
+    return value
+
+
+def _to_text(value):
+    """Convert a column value into a CSV or Parquet string cell"""
+    value = _to_plain(value)
+    if value is None:
+        return None
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return str(value)
+
+
+def iter_csv(columns: Sequence[Column], batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    Encode row batches as CSV, one chunk per batch
+
+    Args:
+        columns (Sequence[Column]): Columns of the rows, for the header
+        batches (Iterable[List[Sequence]]): Rows in column order, in batches
+
+    Yields:
+        bytes: Header, then the rows of each batch
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.key for column in columns])
+    yield buffer.getvalue().encode("utf-8")
+
+    for batch in batches:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_to_text(value) for value in row] for row in batch)
+        yield buffer.getvalue().encode("utf-8")
+
+
+def iter_ndjson(columns: Sequence[Column], batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    Encode row batches as newline-delimited JSON objects, one chunk per batch
+
+    Args:
+        columns (Sequence[Column]): Columns of the rows, for the keys
+        batches (Iterable[List[Sequence]]): Rows in column order, in batches
+
+    Yields:
+        bytes: JSON lines of each batch
+    """
+    keys = [column.key for column in columns]
+    for batch in batches:
+        lines = (
+            json.dumps(
+                {key: _to_plain(value) for key, value in zip(keys, row)}, ensure_ascii=False
+            )
+            for row in batch
+        )
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file handing out what was written since the last take"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # Parquet records absolute offsets, so this counts every byte written
+        return self._position
+
+    def take(self) -> bytes:
+        chunk = b"".join(self._chunks)
+        self._chunks = []
+        return chunk
+
+
+def _arrow_type(column: Column):
+    """Parquet type of a column; enums and JSON become strings"""
+    if isinstance(column.type, Boolean):
+        return pyarrow.bool_()
+    if isinstance(column.type, Integer):
+        return pyarrow.int64()
+    if isinstance(column.type, Float):
+        return pyarrow.float64()
+    if isinstance(column.type, DateTime):
+        return pyarrow.timestamp("us")
+    return pyarrow.string()
+
+
+def iter_parquet(columns: Sequence[Column], batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    Encode row batches as a Parquet file, one row group per batch
+
+    Args:
+        columns (Sequence[Column]): Columns of the rows, for the schema
+        batches (Iterable[List[Sequence]]): Rows in column order, in batches
+
+    Yields:
+        bytes: File content, as each row group is written
+    """
+    schema = pyarrow.schema([(column.key, _arrow_type(column)) for column in columns])
+    text_columns = {
+        index for index, field in enumerate(schema) if pyarrow.types.is_string(field.type)
+    }
+    sink = _ChunkSink()
+    with pyarrow.parquet.ParquetWriter(sink, schema) as writer:
+        for batch in batches:
+            arrays = [
+                pyarrow.array(
+                    [_to_text(row[index]) if index in text_columns else row[index] for row in batch],
+                    type=field.type,
+                )
+                for index, field in enumerate(schema)
+            ]
+            writer.write_table(pyarrow.Table.from_arrays(arrays, schema=schema))
+            yield sink.take()
+    yield sink.take()
+
+
+def iter_export(export_format: str, columns: Sequence[Column],
+                batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    Encode row batches in an export format
+
+    Args:
+        export_format (str): One of EXPORT_FORMATS
+        columns (Sequence[Column]): Columns of the rows
+        batches (Iterable[List[Sequence]]): Rows in column order, in batches
+
+    Returns:
+        Iterator[bytes]: Encoded chunks
+
+    Raises:
+        ValueError: If the format is unknown, or is parquet and pyarrow is
+            not installed
+    """
+    encoders = {"csv": iter_csv, "ndjson": iter_ndjson, "parquet": iter_parquet}
+    if export_format not in encoders:
+        raise ValueError(f"Unknown export format: {export_format}")
+    if export_format == "parquet" and pyarrow is None:
+        raise ValueError("Parquet export requires pyarrow")
+    return encoders[export_format](columns, batches)
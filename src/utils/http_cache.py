@@ -0,0 +1,54 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Mapping, Optional
+
+
+def build_validators(name: str, version: int, updated_at: Optional[datetime]) -> Dict[str, str]:
+    """
+    Build the caching headers of a response derived from a versioned data set
+
+    Args:
+        name (str): Data set
+        version (int): Version of the data set
+        updated_at (datetime, optional): Naive UTC date of its last change
+
+    Returns:
+        Dict[str, str]: ETag, Last-Modified when known, and a Cache-Control
+            letting clients keep the response but revalidate before reuse
+    """
+    headers = {"ETag": f'"{name}-{version}"', "Cache-Control": "no-cache"}
+    if updated_at is not None:
+        headers["Last-Modified"] = format_datetime(
+            updated_at.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(request_headers: Mapping[str, str], validators: Mapping[str, str]) -> bool:
+    """
+    Decide whether a conditional request can be answered with 304
+
+    If-None-Match takes precedence over If-Modified-Since, as in RFC 9110.
+
+    Args:
+        request_headers (Mapping[str, str]): Headers of the request
+        validators (Mapping[str, str]): Headers from build_validators
+
+    Returns:
+        bool: True if the client copy is current
+    """
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match is not None:
+        tags = [tag.strip() for tag in if_none_match.split(",")]
+        # Weak comparison: W/"x" matches "x"
+        tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+        return "*" in tags or validators["ETag"] in tags
+
+    if_modified_since = request_headers.get("if-modified-since")
+    last_modified = validators.get("Last-Modified")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        return parsedate_to_datetime(last_modified) <= parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
@@ -0,0 +1,150 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
+
+from src.utils.safe_load import remove_accents
+
+# Output flags of the automaton states
+INCLUDE_MATCH = 1
+EXCLUDE_MATCH = 2
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text the same way for keywords and tender texts
+
+    Args:
+        text (str): Text to normalize
+
+    Returns:
+        str: Lower-cased text without accents
+    """
+    return remove_accents(text).lower()
+
+
+class KeywordMatcher:
+    """
+    Multi-pattern matcher for include and exclude keywords (Aho-Corasick)
+
+    All keywords are compiled once into a single automaton, so checking a text
+    is one pass over its characters regardless of how many keywords there are.
+    Matching is accent-insensitive and case-insensitive, and a keyword matches
+    anywhere inside a word, like a plain substring test.
+    """
+
+    def __init__(self, include_keywords: Iterable[str], exclude_keywords: Iterable[str]):
+        """
+        Compile the automaton
+
+        Args:
+            include_keywords: Keywords that should be included
+            exclude_keywords: Keywords that should be excluded
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[int] = [0]
+
+        include_keywords = list(include_keywords)
+        self.has_include = bool(include_keywords)
+
+        for keyword in include_keywords:
+            self._add(normalize_text(keyword), INCLUDE_MATCH)
+        for keyword in exclude_keywords:
+            self._add(normalize_text(keyword), EXCLUDE_MATCH)
+
+        self._build_failure_links()
+
+    def _add(self, keyword: str, flag: int) -> None:
+        """Add a normalized keyword to the trie"""
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(0)
+            state = next_state
+        self._output[state] |= flag
+
+    def _build_failure_links(self) -> None:
+        """Compute failure links breadth-first and merge outputs along them"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+                self._output[next_state] |= self._output[self._fail[next_state]]
+
+    def scan(self, text: str) -> int:
+        """
+        Find which kinds of keywords occur in a normalized text
+
+        Scanning stops at the first exclude hit, since nothing can change the
+        outcome after that.
+
+        Args:
+            text (str): Text already passed through normalize_text
+
+        Returns:
+            int: Combination of INCLUDE_MATCH and EXCLUDE_MATCH flags
+        """
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        state = 0
+        flags = output[0]
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            flags |= output[state]
+            if flags & EXCLUDE_MATCH:
+                break
+        return flags
+
+    def matches(self, text: str) -> bool:
+        """
+        Check if a raw text meets the keyword criteria
+
+        Args:
+            text (str): Text to check
+
+        Returns:
+            bool: True if no exclude keyword occurs and, when include keywords
+                were given, at least one of them does
+        """
+        flags = self.scan(normalize_text(text))
+        if flags & EXCLUDE_MATCH:
+            return False
+        if not self.has_include:
+            return True
+        return bool(flags & INCLUDE_MATCH)
+
+
+@lru_cache(maxsize=32)
+def _get_keyword_matcher(include_keywords: Tuple[str, ...],
+                         exclude_keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(include_keywords, exclude_keywords)
+
+
+def get_keyword_matcher(include_keywords: Iterable[str],
+                        exclude_keywords: Iterable[str]) -> KeywordMatcher:
+    """
+    Get a compiled matcher, reusing it for identical keyword sets
+
+    Args:
+        include_keywords: Keywords that should be included
+        exclude_keywords: Keywords that should be excluded
+
+    Returns:
+        KeywordMatcher: Compiled matcher
+    """
+    return _get_keyword_matcher(tuple(include_keywords), tuple(exclude_keywords or ()))
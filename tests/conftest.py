@@ -0,0 +1,9 @@
+import os
+import tempfile
+
+# src.database.base builds its engine on import. Run against DATABASE_URL
+# when given (e.g. PostgreSQL), otherwise against a throwaway SQLite file.
+if not os.getenv("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = (
+        f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'test.db')}"
+    )
@@ -0,0 +1,371 @@
+import copy
+
+import pytest
+from sqlalchemy import inspect
+
+from src.api.decoder import TenderDecoder, decode_awarded_suppliers, decode_items
+from src.models.enum import (
+    AdministrativeActType,
+    Currency,
+    EstimationType,
+    PaymentModality,
+    PaymentType,
+    TenderType,
+    TimeUnit,
+)
+from src.models.tender import Tender
+from src.utils.safe_load import parse_date, safe_bool, safe_float, safe_int
+
+
+def legacy_items(items_data):
+    # Transcription of the item parsing that decode_items replaced
+    items = []
+    if not items_data:
+        return items
+    for item in items_data.get("Listado", []) or []:
+        if not isinstance(item, dict):
+            continue
+        parsed_item = {
+            "correlative": item.get("Correlativo"),
+            "category_code": item.get("CodigoCategoria"),
+            "category_name": item.get("Categoria"),
+            "product_code": item.get("CodigoProducto"),
+            "product_name": item.get("NombreProducto"),
+            "description": item.get("Descripcion"),
+            "quantity": safe_float(item.get("Cantidad")),
+            "unit": item.get("UnidadMedida"),
+            "tender_status_code": safe_int(item.get("CodigoEstadoLicitacion")),
+        }
+        adjudicacion = item.get("Adjudicacion")
+        if isinstance(adjudicacion, dict):
+            parsed_item["award"] = {
+                "supplier_tax_id": adjudicacion.get("RutProveedor"),
+                "supplier_name": adjudicacion.get("NombreProveedor"),
+                "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
+                "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
+            }
+        items.append(parsed_item)
+    return items
+
+
+def legacy_awarded_suppliers(tender_data):
+    # Transcription of the supplier parsing that decode_awarded_suppliers replaced
+    awarded_suppliers = []
+    items_data = tender_data.get("Items", {})
+    if not items_data:
+        return awarded_suppliers
+    for item in items_data.get("Listado", []) or []:
+        if not isinstance(item, dict):
+            continue
+        adjudicacion = item.get("Adjudicacion")
+        if not isinstance(adjudicacion, dict):
+            continue
+        supplier = {
+            "tax_id": adjudicacion.get("RutProveedor"),
+            "name": adjudicacion.get("NombreProveedor"),
+            "item_correlative": item.get("Correlativo"),
+            "awarded_quantity": safe_float(adjudicacion.get("CantidadAdjudicada")),
+            "unit_price": safe_float(adjudicacion.get("MontoUnitario")),
+        }
+        if supplier["tax_id"] or supplier["name"]:
+            if supplier not in awarded_suppliers:
+                awarded_suppliers.append(supplier)
+    return awarded_suppliers
+
+
+def legacy_fields(tender_data):
+    # Transcription of the field-by-field parsing that TenderDecoder replaced
+    comprador = tender_data.get("Comprador") or {}
+    fechas = tender_data.get("Fechas") or {}
+    adjudicacion = tender_data.get("Adjudicacion") or {}
+    return dict(
+        code=tender_data.get("CodigoExterno"),
+        name=tender_data.get("Nombre"),
+        description=tender_data.get("Descripcion"),
+        status=tender_data.get("Estado"),
+        status_code=safe_int(tender_data.get("CodigoEstado")),
+        api_version=tender_data.get("Version"),
+        tender_type=TenderType.from_value(tender_data.get("Tipo")),
+        currency=Currency.from_value(tender_data.get("Moneda")),
+        bidding_stages=safe_int(tender_data.get("Etapas")),
+        bidding_stages_status=safe_int(tender_data.get("EstadoEtapas")),
+        estimated_amount=safe_float(tender_data.get("MontoEstimado")),
+        estimation_type=EstimationType.from_value(tender_data.get("Estimacion")),
+        amount_visibility=safe_bool(tender_data.get("VisibilidadMonto")),
+        payment_modality=PaymentModality.from_value(tender_data.get("Modalidad")),
+        payment_type=PaymentType.from_value(tender_data.get("TipoPago")),
+        financing_source=(
+            str(tender_data.get("FuenteFinanciamiento"))
+            if tender_data.get("FuenteFinanciamiento") else None
+        ),
+        organization=comprador.get("NombreOrganismo"),
+        organization_code=comprador.get("CodigoOrganismo"),
+        organization_tax_id=comprador.get("RutUnidad"),
+        buying_unit=comprador.get("NombreUnidad"),
+        buying_unit_code=comprador.get("CodigoUnidad"),
+        buying_unit_address=comprador.get("DireccionUnidad"),
+        buying_unit_region=comprador.get("RegionUnidad"),
+        buying_unit_commune=comprador.get("ComunaUnidad"),
+        user_tax_id=comprador.get("RutUsuario"),
+        user_code=comprador.get("CodigoUsuario"),
+        user_name=comprador.get("NombreUsuario"),
+        user_position=comprador.get("CargoUsuario"),
+        creation_date=parse_date(fechas.get("FechaCreacion")),
+        publication_date=parse_date(fechas.get("FechaPublicacion")),
+        closing_date=parse_date(fechas.get("FechaCierre")),
+        questions_deadline=parse_date(fechas.get("FechaFinal")),
+        answers_publication_date=parse_date(fechas.get("FechaPubRespuestas")),
+        technical_opening_date=parse_date(fechas.get("FechaActoAperturaTecnica")),
+        economic_opening_date=parse_date(fechas.get("FechaActoAperturaEconomica")),
+        award_date=parse_date(fechas.get("FechaAdjudicacion")),
+        estimated_award_date=parse_date(fechas.get("FechaEstimadaAdjudicacion")),
+        site_visit_date=parse_date(fechas.get("FechaVisitaTerreno")),
+        background_delivery_date=parse_date(fechas.get("FechaEntregaAntecedentes")),
+        physical_support_date=parse_date(fechas.get("FechaSoporteFisico")),
+        evaluation_date=parse_date(fechas.get("FechaTiempoEvaluacion")),
+        estimated_signing_date=parse_date(fechas.get("FechaEstimadaFirma")),
+        user_defined_date=parse_date(fechas.get("FechasUsuario")),
+        evaluation_time_unit=TimeUnit.from_value(tender_data.get("UnidadTiempo")),
+        contract_time_unit=TimeUnit.from_value(tender_data.get("UnidadTiempoContratoLicitacion")),
+        payment_responsible_name=tender_data.get("NombreResponsablePago"),
+        payment_responsible_email=tender_data.get("EmailResponsablePago"),
+        contract_responsible_name=tender_data.get("NombreResponsableContrato"),
+        contract_responsible_email=tender_data.get("EmailResponsableContrato"),
+        contract_responsible_phone=tender_data.get("FonoResponsableContrato"),
+        allows_subcontracting=safe_bool(tender_data.get("SubContratacion")),
+        contract_duration=safe_int(tender_data.get("TiempoDuracionContrato")),
+        contract_duration_type=tender_data.get("TipoDuracionContrato"),
+        is_renewable=safe_bool(tender_data.get("EsRenovable")),
+        renewal_time_value=safe_int(tender_data.get("ValorTiempoRenovacion")),
+        renewal_time_period=tender_data.get("PeriodoTiempoRenovacion"),
+        requires_comptroller=safe_bool(tender_data.get("TomaRazon")),
+        technical_offer_publicity=safe_int(tender_data.get("EstadoPublicidadOfertas")),
+        publicity_justification=tender_data.get("JustificacionPublicidad"),
+        hiring_prohibition=tender_data.get("ProhibicionContratacion"),
+        amount_justification=tender_data.get("JustificacionMontoEstimado"),
+        deadline_extension=safe_int(tender_data.get("ExtensionPlazo")),
+        is_public_bid=safe_bool(tender_data.get("TipoConvocatoria")),
+        is_informed=safe_bool(tender_data.get("Informada")),
+        is_base_type=safe_bool(tender_data.get("EsBaseTipo")),
+        award_type=AdministrativeActType.from_value(adjudicacion.get("Tipo")),
+        award_document_number=adjudicacion.get("Numero"),
+        award_document_date=parse_date(adjudicacion.get("Fecha")),
+        number_of_bidders=safe_int(adjudicacion.get("NumeroOferentes")),
+        award_act_url=adjudicacion.get("UrlActa"),
+        complaint_count=safe_int(tender_data.get("CantidadReclamos")),
+        items=legacy_items(tender_data.get("Items") or {}),
+        awarded_suppliers=legacy_awarded_suppliers(tender_data),
+    )
+
+
+FULL_PAYLOAD = {
+    "CodigoExterno": "1234-56-LE24",
+    "Nombre": "Adquisición de computadores",
+    "Descripcion": "Compra de equipos para oficinas",
+    "Estado": "Publicada",
+    "CodigoEstado": 5,
+    "Version": "v1",
+    "Tipo": "LE",
+    "Moneda": "CLP",
+    "Etapas": "2",
+    "EstadoEtapas": 1,
+    "MontoEstimado": "15000000.5",
+    "Estimacion": 2,
+    "VisibilidadMonto": 1,
+    "Modalidad": 1,
+    "TipoPago": 3,
+    "FuenteFinanciamiento": 12345,
+    "Comprador": {
+        "NombreOrganismo": "Municipalidad de Ñuñoa",
+        "CodigoOrganismo": "7248",
+        "RutUnidad": "69.070.300-9",
+        "NombreUnidad": "Adquisiciones",
+        "CodigoUnidad": "2345",
+        "DireccionUnidad": "Av. Irarrázaval 3550",
+        "RegionUnidad": "Región Metropolitana de Santiago",
+        "ComunaUnidad": "Ñuñoa",
+        "RutUsuario": "12.345.678-9",
+        "CodigoUsuario": "999",
+        "NombreUsuario": "Juana Pérez",
+        "CargoUsuario": "Jefa de compras",
+    },
+    "Fechas": {
+        "FechaCreacion": "2024-03-01T09:30:00",
+        "FechaPublicacion": "2024-03-02T10:00:00Z",
+        "FechaCierre": "2024-03-20T15:00:00",
+        "FechaFinal": "2024-03-10T15:00:00",
+        "FechaPubRespuestas": "2024-03-12T15:00:00",
+        "FechaActoAperturaTecnica": "2024-03-20T15:05:00",
+        "FechaActoAperturaEconomica": "2024-03-20T15:10:00",
+        "FechaAdjudicacion": "2024-04-01T12:00:00",
+        "FechaEstimadaAdjudicacion": "2024-04-01T00:00:00",
+        "FechaVisitaTerreno": None,
+        "FechaEntregaAntecedentes": "",
+        "FechaSoporteFisico": "not a date",
+        "FechaTiempoEvaluacion": "2024-03-25T00:00:00",
+        "FechaEstimadaFirma": "2024-04-10T00:00:00",
+        "FechasUsuario": "2024-03-05T00:00:00",
+    },
+    "UnidadTiempo": 2,
+    "UnidadTiempoContratoLicitacion": "4",
+    "NombreResponsablePago": "Pedro Soto",
+    "EmailResponsablePago": "pagos@example.cl",
+    "NombreResponsableContrato": "Ana Rojas",
+    "EmailResponsableContrato": "contratos@example.cl",
+    "FonoResponsableContrato": "+56 2 2222 2222",
+    "SubContratacion": "true",
+    "TiempoDuracionContrato": "12",
+    "TipoDuracionContrato": "Meses",
+    "EsRenovable": "no",
+    "ValorTiempoRenovacion": "x",
+    "PeriodoTiempoRenovacion": "Años",
+    "TomaRazon": 0,
+    "EstadoPublicidadOfertas": 1,
+    "JustificacionPublicidad": "",
+    "ProhibicionContratacion": "Ninguna",
+    "JustificacionMontoEstimado": None,
+    "ExtensionPlazo": 0,
+    "TipoConvocatoria": "1",
+    "Informada": 0,
+    "EsBaseTipo": "si",
+    "CantidadReclamos": 3,
+    "Adjudicacion": {
+        "Tipo": 2,
+        "Numero": "456",
+        "Fecha": "2024-04-01T00:00:00",
+        "NumeroOferentes": "4",
+        "UrlActa": "https://example.cl/acta",
+    },
+    "Items": {
+        "Cantidad": 3,
+        "Listado": [
+            {
+                "Correlativo": 1,
+                "CodigoCategoria": "43211500",
+                "Categoria": "Computadores",
+                "CodigoProducto": 43211503,
+                "NombreProducto": "Notebook",
+                "Descripcion": "Notebook 14 pulgadas",
+                "Cantidad": "10",
+                "UnidadMedida": "Unidad",
+                "CodigoEstadoLicitacion": 8,
+                "Adjudicacion": {
+                    "RutProveedor": "76.000.000-1",
+                    "NombreProveedor": "Proveedor Uno",
+                    "CantidadAdjudicada": 10,
+                    "MontoUnitario": "450000",
+                },
+            },
+            {
+                "Correlativo": 1,
+                "CodigoCategoria": "43211500",
+                "Categoria": "Computadores",
+                "CodigoProducto": 43211503,
+                "NombreProducto": "Notebook",
+                "Descripcion": "Duplicado del primero",
+                "Cantidad": 10,
+                "UnidadMedida": "Unidad",
+                "CodigoEstadoLicitacion": 8,
+                "Adjudicacion": {
+                    "RutProveedor": "76.000.000-1",
+                    "NombreProveedor": "Proveedor Uno",
+                    "CantidadAdjudicada": 10,
+                    "MontoUnitario": 450000,
+                },
+            },
+            {
+                "Correlativo": 2,
+                "NombreProducto": "Mouse",
+                "Cantidad": None,
+                "Adjudicacion": None,
+            },
+            {
+                "Correlativo": 3,
+                "NombreProducto": "Teclado",
+                "Adjudicacion": {"RutProveedor": None, "NombreProveedor": ""},
+            },
+            "not an item",
+        ],
+    },
+}
+
+
+def with_changes(**changes):
+    payload = copy.deepcopy(FULL_PAYLOAD)
+    payload.update(changes)
+    return payload
+
+
+PAYLOADS = {
+    "full": FULL_PAYLOAD,
+    "minimal": {"CodigoExterno": "1-1-L1"},
+    "null sections": with_changes(Comprador=None, Fechas=None, Adjudicacion=None, Items=None),
+    "unknown enums": with_changes(
+        Tipo="ZZ", Moneda=1, Estimacion="2", Modalidad=99, TipoPago=[1],
+        UnidadTiempo={"a": 1},
+    ),
+    "float enums": with_changes(Estimacion=2.0, Modalidad=True),
+    "bad numbers": with_changes(
+        CodigoEstado="abc", MontoEstimado="n/a", Etapas=1.9, ExtensionPlazo=[],
+    ),
+    "falsy values": with_changes(
+        Nombre="", FuenteFinanciamiento=0, VisibilidadMonto=False, CantidadReclamos=0,
+    ),
+    "items without listado": with_changes(Items={"Cantidad": 0, "Listado": None}),
+    "unhashable supplier": with_changes(Items={"Listado": [
+        {"Correlativo": 1, "Adjudicacion": {"RutProveedor": ["76-1"], "NombreProveedor": "A"}},
+        {"Correlativo": 1, "Adjudicacion": {"RutProveedor": ["76-1"], "NombreProveedor": "A"}},
+        {"Correlativo": 2, "Adjudicacion": {"RutProveedor": "76-2", "NombreProveedor": "B"}},
+    ]}),
+}
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+def test_decode_fields_matches_legacy_parsing(name):
+    payload = PAYLOADS[name]
+    assert TenderDecoder().decode_fields(payload) == legacy_fields(payload)
+
+
+@pytest.mark.parametrize("name", PAYLOADS)
+def test_decode_builds_the_same_tender(name):
+    payload = PAYLOADS[name]
+    tender = TenderDecoder().decode(payload)
+    expected = Tender(**legacy_fields(payload))
+
+    for column in inspect(Tender).columns:
+        if column.key in ("content_hash", "created_at", "updated_at", "id"):
+            continue
+        assert getattr(tender, column.key) == getattr(expected, column.key), column.key
+
+
+def test_full_payload_decodes_every_field():
+    fields = TenderDecoder().decode_fields(FULL_PAYLOAD)
+
+    assert fields["tender_type"] is TenderType.LE
+    assert fields["estimated_amount"] == 15000000.5
+    assert fields["publication_date"].tzinfo is not None
+    assert fields["physical_support_date"] is None
+    assert fields["financing_source"] == "12345"
+    assert fields["award_type"] is AdministrativeActType.RESOLUTION
+    assert len(fields["items"]) == 4
+    # The duplicated award is kept once; the award without tax id or name is dropped
+    assert [supplier["tax_id"] for supplier in fields["awarded_suppliers"]] == ["76.000.000-1"]
+
+
+@pytest.mark.parametrize("payload", [None, {}, [], "x", {"Nombre": "Sin código"}])
+def test_invalid_payloads_are_skipped(payload):
+    decoder = TenderDecoder()
+    assert decoder.decode_fields(payload) is None
+    assert decoder.decode(payload) is None
+
+
+def test_decode_many_keeps_order_and_skips_invalid_payloads():
+    payloads = [{"CodigoExterno": "A"}, {"Nombre": "Sin código"}, {"CodigoExterno": "B"}]
+    assert [tender.code for tender in TenderDecoder().decode_many(payloads)] == ["A", "B"]
+
+
+def test_item_helpers_accept_missing_data():
+    assert decode_items(None) == []
+    assert decode_items({}) == []
+    assert decode_awarded_suppliers(None) == []
+    assert decode_awarded_suppliers({"Items": None}) == []
@@ -0,0 +1,172 @@
+import csv
+import io
+import json
+import uuid
+from datetime import datetime
+
+import pyarrow.parquet
+import pytest
+from fastapi.testclient import TestClient
+
+import src.database.repository  # noqa: F401 - registers every model
+from app.main import app
+from src.database.base import WriteSessionLocal, init_db
+from src.database.repository import EXPORT_COLUMNS, TenderRepository
+from src.models.enum import Currency, TenderType
+from src.models.tender import Tender
+from src.utils.export import EXPORT_FORMATS, iter_export
+
+client = TestClient(app)
+
+KEYS = [column.key for column in EXPORT_COLUMNS]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_db()
+
+
+@pytest.fixture
+def exported_tenders():
+    """Two tenders of their own status, one with every kind of value"""
+    status = f"Export {uuid.uuid4().hex[:8]}"
+    full = Tender(
+        code=f"{status}-full",
+        name='Compra de "equipos", sillas\ny mesas',
+        description="Ñandú y pingüino",
+        status=status,
+        status_code=5,
+        tender_type=TenderType.LE,
+        currency=Currency.CLP,
+        estimated_amount=15000000,
+        amount_visibility=True,
+        is_renewable=False,
+        creation_date=datetime(2024, 3, 1, 9, 30),
+        closing_date=datetime(2024, 3, 20, 15, 0, 0, 500000),
+        items=[{"correlative": 1, "product_name": "Silla ergonómica", "quantity": 2.5}],
+    )
+    empty = Tender(code=f"{status}-empty", status=status)
+    with WriteSessionLocal() as session:
+        TenderRepository(session).upsert_many([full, empty])
+    return status
+
+
+def export(export_format, status):
+    response = client.get("/api/tenders/export", params={"format": export_format, "status": status})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == EXPORT_FORMATS[export_format]
+    assert f'filename="tenders.{export_format}"' in response.headers["content-disposition"]
+    return response.content
+
+
+def by_code(rows, status):
+    return {row["code"]: row for row in rows if row["code"].startswith(status)}
+
+
+def test_csv_export(exported_tenders):
+    content = export("csv", exported_tenders).decode("utf-8")
+    reader = csv.DictReader(io.StringIO(content))
+    assert reader.fieldnames == KEYS
+
+    rows = by_code(reader, exported_tenders)
+    full, empty = rows[f"{exported_tenders}-full"], rows[f"{exported_tenders}-empty"]
+    assert full["name"] == 'Compra de "equipos", sillas\ny mesas'
+    assert full["description"] == "Ñandú y pingüino"
+    assert full["tender_type"] == "LE"
+    assert full["estimated_amount"] == "15000000"
+    assert full["amount_visibility"] == "True"
+    assert full["closing_date"] == "2024-03-20T15:00:00.500000"
+    assert json.loads(full["items"]) == [
+        {"correlative": 1, "product_name": "Silla ergonómica", "quantity": 2.5}
+    ]
+    # Missing values are empty cells
+    assert empty["name"] == "" and empty["items"] == ""
+
+
+def test_ndjson_export(exported_tenders):
+    lines = export("ndjson", exported_tenders).decode("utf-8").splitlines()
+    records = [json.loads(line) for line in lines]
+    assert all(list(record) == KEYS for record in records)
+
+    rows = by_code(records, exported_tenders)
+    full, empty = rows[f"{exported_tenders}-full"], rows[f"{exported_tenders}-empty"]
+    assert full["tender_type"] == "LE"
+    assert full["currency"] == "CLP"
+    assert full["estimated_amount"] == 15000000
+    assert full["amount_visibility"] is True
+    assert full["is_renewable"] is False
+    assert full["creation_date"] == "2024-03-01T09:30:00"
+    assert full["items"][0]["product_name"] == "Silla ergonómica"
+    assert empty["name"] is None and empty["items"] is None
+
+
+def test_parquet_export(exported_tenders):
+    table = pyarrow.parquet.read_table(io.BytesIO(export("parquet", exported_tenders)))
+    assert table.column_names == KEYS
+    assert str(table.schema.field("estimated_amount").type) == "int64"
+    assert str(table.schema.field("closing_date").type) == "timestamp[us]"
+    assert str(table.schema.field("amount_visibility").type) == "bool"
+
+    rows = by_code(table.to_pylist(), exported_tenders)
+    full, empty = rows[f"{exported_tenders}-full"], rows[f"{exported_tenders}-empty"]
+    assert full["tender_type"] == "LE"
+    assert full["estimated_amount"] == 15000000
+    assert full["amount_visibility"] is True
+    assert full["closing_date"] == datetime(2024, 3, 20, 15, 0, 0, 500000)
+    assert json.loads(full["items"])[0]["quantity"] == 2.5
+    assert empty["estimated_amount"] is None and empty["items"] is None
+
+
+def test_formats_export_the_same_rows_newest_first(exported_tenders):
+    csv_codes = [row["code"] for row in csv.DictReader(
+        io.StringIO(export("csv", exported_tenders).decode("utf-8"))
+    )]
+    ndjson_codes = [
+        json.loads(line)["code"]
+        for line in export("ndjson", exported_tenders).decode("utf-8").splitlines()
+    ]
+    parquet_codes = pyarrow.parquet.read_table(
+        io.BytesIO(export("parquet", exported_tenders))
+    ).column("code").to_pylist()
+
+    assert csv_codes == ndjson_codes == parquet_codes
+    assert sorted(csv_codes) == [f"{exported_tenders}-empty", f"{exported_tenders}-full"]
+
+
+def test_unknown_format_is_rejected():
+    response = client.get("/api/tenders/export", params={"format": "xlsx"})
+    assert response.status_code == 400
+    assert "Unknown export format" in response.json()["detail"]
+
+
+def batch_rows(code_prefix, count):
+    row = {key: None for key in KEYS}
+    rows = []
+    for index in range(count):
+        row = dict(row, code=f"{code_prefix}-{index}", estimated_amount=index)
+        rows.append(tuple(row[key] for key in KEYS))
+    return rows
+
+
+def test_parquet_writes_one_row_group_per_batch():
+    batches = [batch_rows("a", 3), batch_rows("b", 2), batch_rows("c", 4)]
+    chunks = list(iter_export("parquet", EXPORT_COLUMNS, iter(batches)))
+    # Data is streamed as each batch is encoded, not only at the end
+    assert sum(1 for chunk in chunks[:-1] if chunk) >= len(batches)
+
+    parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(b"".join(chunks)))
+    assert parquet_file.metadata.num_row_groups == 3
+    assert parquet_file.read().column("estimated_amount").to_pylist() == [0, 1, 2, 0, 1, 0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("export_format", EXPORT_FORMATS)
+def test_empty_export(export_format):
+    content = b"".join(iter_export(export_format, EXPORT_COLUMNS, iter([])))
+
+    if export_format == "csv":
+        assert content.decode("utf-8").strip() == ",".join(KEYS)
+    elif export_format == "ndjson":
+        assert content == b""
+    else:
+        table = pyarrow.parquet.read_table(io.BytesIO(content))
+        assert table.num_rows == 0 and table.column_names == KEYS
@@ -0,0 +1,264 @@
+import threading
+from concurrent.futures import Future
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+import src.database.repository  # noqa: F401 - registers every model
+from app.main import app
+from src.database.base import SessionLocal, WriteSessionLocal, init_db
+from src.database.repository import JobRepository
+from src.models.job import Job, JobStatus
+from src.pipeline import jobs
+from src.pipeline.jobs import JobRunner, run_search_job
+
+client = TestClient(app)
+
+PARAMS = {"days": 3, "status": "publicada", "include_keywords": [], "exclude_keywords": []}
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_db()
+
+
+@pytest.fixture(autouse=True)
+def idle_queue():
+    """Start every test without queued or running jobs"""
+    with WriteSessionLocal() as session:
+        session.execute(
+            update(Job).where(Job.status.in_([JobStatus.QUEUED, JobStatus.RUNNING])).values(
+                status=JobStatus.CANCELLED
+            )
+        )
+        session.commit()
+
+
+def create_jobs(count):
+    with WriteSessionLocal() as session:
+        return [JobRepository(session).create_job(dict(PARAMS)).id for _ in range(count)]
+
+
+def claim():
+    with WriteSessionLocal() as session:
+        return JobRepository(session).claim_next_job()
+
+
+def get_job(job_id):
+    with SessionLocal() as session:
+        return JobRepository(session).get_job(job_id)
+
+
+def test_jobs_are_claimed_oldest_first():
+    first, second, third = create_jobs(3)
+    with WriteSessionLocal() as session:
+        JobRepository(session).cancel_job(second)
+
+    assert claim() == first
+    assert claim() == third
+    assert claim() is None
+
+    job = get_job(first)
+    assert job.status == JobStatus.RUNNING
+    assert job.started_at is not None
+
+
+def test_concurrent_claims_never_share_a_job():
+    job_ids = create_jobs(6)
+    claimed, errors = [], []
+
+    def worker():
+        try:
+            while (job_id := claim()) is not None:
+                claimed.append(job_id)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(claimed) == job_ids
+
+
+def test_restart_requeues_running_jobs():
+    interrupted, cancelled, finished = create_jobs(3)
+    for _ in range(3):
+        claim()
+    with WriteSessionLocal() as session:
+        repo = JobRepository(session)
+        repo.report_progress(interrupted, days_done=2, days_total=3, tenders_matched=7)
+        repo.cancel_job(cancelled)
+        repo.finish_job(finished, JobStatus.COMPLETED, counts={"new": 1})
+
+    JobRunner(workers=1).recover()
+
+    job = get_job(interrupted)
+    assert job.status == JobStatus.QUEUED
+    assert (job.started_at, job.days_total, job.days_done, job.tenders_matched) == (None, None, 0, 0)
+    assert get_job(cancelled).status == JobStatus.CANCELLED
+    assert get_job(finished).status == JobStatus.COMPLETED
+    # The next runner starts it again
+    assert claim() == interrupted
+
+
+def test_cancel_queued_job_stops_it_at_once():
+    job_id = create_jobs(1)[0]
+
+    response = client.post(f"/api/jobs/{job_id}/cancel")
+    assert response.status_code == 200
+    assert response.json()["status"] == "cancelled"
+    assert response.json()["finished_at"] is not None
+    assert claim() is None
+
+
+def test_cancel_running_job_stops_it_at_next_report():
+    job_id = create_jobs(1)[0]
+    claim()
+
+    response = client.post(f"/api/jobs/{job_id}/cancel")
+    assert response.json()["status"] == "running"
+    assert response.json()["cancel_requested"] is True
+
+    with WriteSessionLocal() as session:
+        repo = JobRepository(session)
+        assert repo.report_progress(job_id, 1, 3, 0) is False
+        assert repo.finish_job(job_id, JobStatus.CANCELLED, counts={"new": 0})
+        # A finished job keeps its final state
+        assert not repo.finish_job(job_id, JobStatus.FAILED, error="late")
+        repo.cancel_job(job_id)
+    job = get_job(job_id)
+    assert job.status == JobStatus.CANCELLED
+    assert job.error is None
+
+
+def test_cancel_unknown_job():
+    assert client.post("/api/jobs/999999999/cancel").status_code == 404
+
+
+def test_execute_queues_a_job_with_normalized_params():
+    response = client.post("/api/execute", json={"days": 5, "status": " Cerrada "})
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == "queued"
+    assert job["params"]["status"] == "cerrada"
+    assert job["params"]["days"] == 5
+    assert claim() == job["id"]
+
+
+@pytest.fixture
+def fake_sync(monkeypatch):
+    """Replace the search of run_search_job; returns the list of its calls"""
+    calls = []
+    monkeypatch.setattr(jobs, "PublicMarketAPI", lambda: None)
+
+    def install(run):
+        def run_sync(api, repo, **kwargs):
+            calls.append(kwargs)
+            return run(kwargs["on_progress"])
+        monkeypatch.setattr(jobs, "run_sync", run_sync)
+    return install, calls
+
+
+def test_run_search_job_completes_with_counts(fake_sync):
+    install, calls = fake_sync
+    counts = {"new": 2, "updated": 1, "unchanged": 0, "failed": 0}
+
+    def run(on_progress):
+        assert on_progress(1, 3, 2)
+        assert on_progress(3, 3, 3)
+        return counts
+    install(run)
+
+    job_id = create_jobs(1)[0]
+    claim()
+    run_search_job(job_id)
+
+    job = get_job(job_id)
+    assert calls[0]["days_back"] == 3 and calls[0]["status"] == "publicada"
+    assert job.status == JobStatus.COMPLETED
+    assert job.counts == counts
+    assert (job.days_done, job.days_total, job.tenders_matched) == (3, 3, 3)
+
+
+def test_run_search_job_records_cancellation(fake_sync):
+    install, _ = fake_sync
+    job_id = create_jobs(1)[0]
+    claim()
+
+    def run(on_progress):
+        with WriteSessionLocal() as session:
+            JobRepository(session).cancel_job(job_id)
+        assert on_progress(1, 3, 0) is False
+        return {"new": 0}
+    install(run)
+
+    run_search_job(job_id)
+    assert get_job(job_id).status == JobStatus.CANCELLED
+
+
+def test_run_search_job_records_errors(fake_sync):
+    install, _ = fake_sync
+
+    def run(on_progress):
+        raise ValueError("Invalid status 'x'")
+    install(run)
+
+    job_id = create_jobs(1)[0]
+    claim()
+    run_search_job(job_id)
+
+    job = get_job(job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "Invalid status 'x'"
+
+
+def test_run_search_job_skips_jobs_no_longer_running(fake_sync):
+    install, calls = fake_sync
+    install(lambda on_progress: {})
+    job_id = create_jobs(1)[0]
+
+    run_search_job(job_id)
+    assert calls == []
+    assert get_job(job_id).status == JobStatus.QUEUED
+
+
+def test_dispatch_fills_free_workers_only(monkeypatch):
+    runner = JobRunner(workers=2)
+    futures = {}
+
+    def submit(job_id):
+        futures[job_id] = Future()
+        return futures[job_id]
+    monkeypatch.setattr(runner, "submit", submit)
+
+    job_ids = create_jobs(3)
+    try:
+        assert runner.dispatch() == 2
+        assert runner.dispatch() == 0
+        futures[job_ids[0]].set_result(None)
+        assert runner.dispatch() == 1
+        assert sorted(futures) == job_ids
+    finally:
+        runner._pool.shutdown()
+
+
+def test_crashed_worker_fails_its_job():
+    job_id = create_jobs(1)[0]
+    claim()
+    future = Future()
+    future.set_exception(RuntimeError("killed"))
+
+    runner = JobRunner(workers=1)
+    try:
+        runner._record_crash(job_id, future)
+    finally:
+        runner._pool.shutdown()
+
+    job = get_job(job_id)
+    assert job.status == JobStatus.FAILED
+    assert job.error == "Worker failed: killed"
@@ -0,0 +1,84 @@
+import random
+
+import pytest
+
+from src.utils.keyword_matcher import KeywordMatcher, get_keyword_matcher
+from src.utils.safe_load import remove_accents
+
+
+def substring_criteria(text, include_keywords, exclude_keywords):
+    # The matching that KeywordMatcher replaced: one substring test per keyword
+    search_text = remove_accents(text).lower()
+    if any(remove_accents(keyword).lower() in search_text for keyword in exclude_keywords):
+        return False
+    if not include_keywords:
+        return True
+    return any(remove_accents(keyword).lower() in search_text for keyword in include_keywords)
+
+
+def random_word(rng, alphabet, max_length):
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, max_length)))
+
+
+def test_matches_like_substring_tests_on_random_inputs():
+    # A small alphabet makes prefixes, suffixes and overlaps between keywords common
+    alphabet = "abAáéñ "
+    rng = random.Random(20240101)
+    for _ in range(2000):
+        include = [random_word(rng, alphabet, 4) for _ in range(rng.randint(0, 4))]
+        exclude = [random_word(rng, alphabet, 4) for _ in range(rng.randint(0, 3))]
+        text = random_word(rng, alphabet, 30)
+
+        expected = substring_criteria(text, include, exclude)
+        assert KeywordMatcher(include, exclude).matches(text) == expected, (text, include, exclude)
+
+
+@pytest.mark.parametrize("text, include, exclude, expected", [
+    ("Adquisición de computadores", ["adquisicion"], [], True),
+    ("ADQUISICION DE COMPUTADORES", ["Adquisición"], [], True),
+    ("Servicio de camión aljibe", ["CAMION"], [], True),
+    ("Compra de árboles ornamentales", ["arbol"], [], True),
+    ("Señalética vial", ["senaletica"], [], True),
+    ("Adquisición de computadores", ["computador"], ["adquisición"], False),
+    ("Mantención de ascensores", ["impresora"], [], False),
+])
+def test_matching_ignores_accents_and_case(text, include, exclude, expected):
+    assert KeywordMatcher(include, exclude).matches(text) is expected
+
+
+@pytest.mark.parametrize("include, text, expected", [
+    # One keyword is a suffix of another
+    (["she", "he"], "the", True),
+    (["she", "he"], "ashes", True),
+    # One keyword is a prefix of another
+    (["compu", "computadores"], "un computador", True),
+    # The failure link must fall back into a shorter keyword
+    (["abcd", "bc"], "abce", True),
+    (["abcd", "bcf"], "abcf", True),
+    (["abcd", "bcf"], "abce", False),
+])
+def test_overlapping_keywords(include, text, expected):
+    assert KeywordMatcher(include, []).matches(text) is expected
+
+
+def test_exclude_keyword_inside_include_keyword_excludes():
+    matcher = KeywordMatcher(["mantencion"], ["mant"])
+    assert not matcher.matches("Mantención de áreas verdes")
+    assert not matcher.matches("Plan de mantención")
+
+
+def test_without_keywords_everything_matches():
+    assert KeywordMatcher([], []).matches("Cualquier licitación")
+    assert KeywordMatcher([], []).matches("")
+
+
+def test_without_include_keywords_only_excludes_filter():
+    matcher = KeywordMatcher([], ["aseo"])
+    assert matcher.matches("Servicio de guardias")
+    assert not matcher.matches("Servicio de ASEO")
+
+
+def test_get_keyword_matcher_reuses_identical_keyword_sets():
+    first = get_keyword_matcher(["uno", "dos"], ["tres"])
+    assert get_keyword_matcher(["uno", "dos"], ["tres"]) is first
+    assert get_keyword_matcher(["uno"], ["tres"]) is not first
@@ -0,0 +1,172 @@
+import json
+from datetime import datetime
+
+import pytest
+from sqlalchemy import MetaData, Table, create_engine, inspect, text
+from sqlalchemy.orm import Session
+
+import src.database.repository  # noqa: F401 - registers every model
+from src.database.base import Base
+from src.database.migrations import MIGRATIONS, run_migrations
+from src.models.tender import Tender
+
+# Tables of the first release and the columns added to them since; the
+# migrations must bring such a database up to the current schema
+BASELINE_TABLES = ("tenders", "tender_items", "keywords")
+ADDED_COLUMNS = {
+    "tenders": {"content_hash"},
+    "tender_items": {"supplier_tax_id", "supplier_name", "awarded_quantity", "unit_price"},
+}
+ALL_VERSIONS = [version for version, _, _ in MIGRATIONS]
+
+
+def create_baseline_schema(engine):
+    # Current tables without the added columns and without any index
+    metadata = MetaData()
+    for name in BASELINE_TABLES:
+        table = Base.metadata.tables[name]
+        removed = ADDED_COLUMNS.get(name, set())
+        Table(name, metadata, *[
+            column._copy() for column in table.columns if column.name not in removed
+        ])
+    metadata.create_all(engine)
+
+
+def insert_baseline_tenders(engine):
+    items = [
+        {
+            "correlative": 1, "category_code": "43211500", "category_name": "Computadores",
+            "product_code": 43211503, "product_name": "Notebook", "description": "Notebook",
+            "quantity": 10.0, "unit": "Unidad",
+            "award": {
+                "supplier_tax_id": "76.000.000-1", "supplier_name": "Proveedor Uno",
+                "awarded_quantity": 10.0, "unit_price": 450000.0,
+            },
+        },
+        {"correlative": 2, "product_name": "Mouse", "quantity": 5.0},
+    ]
+    rows = [
+        ("BASE-1", "Adquisición de computadores", "Publicada", "Org A", 1000, json.dumps(items)),
+        ("BASE-2", "Servicio de aseo", "Cerrada", "Org A", 500, json.dumps([])),
+        ("BASE-3", "Mantención de ascensores", None, "Org B", None, None),
+    ]
+    now = datetime(2024, 3, 1)
+    with engine.begin() as connection:
+        for code, name, status, organization, amount, items_json in rows:
+            connection.execute(text(
+                "INSERT INTO tenders (code, name, status, organization, estimated_amount, "
+                "creation_date, items, created_at, updated_at) "
+                "VALUES (:code, :name, :status, :organization, :amount, :now, :items, :now, :now)"
+            ), {
+                "code": code, "name": name, "status": status, "organization": organization,
+                "amount": amount, "now": now, "items": items_json,
+            })
+
+
+@pytest.fixture
+def baseline_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'baseline.db'}")
+    create_baseline_schema(engine)
+    insert_baseline_tenders(engine)
+    # init_db creates the tables added since before migrating
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def table_counts(engine):
+    with engine.connect() as connection:
+        return {
+            name: connection.execute(text(f"SELECT COUNT(*) FROM {name}")).scalar()
+            for name in ("tenders", "tender_items", "tender_stats", "data_versions", "tenders_fts")
+        }
+
+
+def test_migrations_upgrade_a_baseline_database(baseline_engine):
+    assert run_migrations(baseline_engine) == ALL_VERSIONS
+
+    inspector = inspect(baseline_engine)
+    assert "content_hash" in {column["name"] for column in inspector.get_columns("tenders")}
+    assert ADDED_COLUMNS["tender_items"] <= {
+        column["name"] for column in inspector.get_columns("tender_items")
+    }
+    for name in ("tenders", "tender_items"):
+        expected = {index.name for index in Base.metadata.tables[name].indexes}
+        assert expected <= {index["name"] for index in inspector.get_indexes(name)}
+
+    with baseline_engine.connect() as connection:
+        items = connection.execute(text(
+            "SELECT tender_code, correlative, product_name, supplier_tax_id, unit_price "
+            "FROM tender_items ORDER BY tender_code, correlative"
+        )).all()
+        assert [tuple(row) for row in items] == [
+            ("BASE-1", "1", "Notebook", "76.000.000-1", 450000.0),
+            ("BASE-1", "2", "Mouse", None, None),
+        ]
+
+        stats = dict(connection.execute(text(
+            "SELECT dimension || ':' || key, tender_count FROM tender_stats"
+        )).all())
+        assert stats["total:all"] == 3
+        assert stats["status:Publicada"] == 1
+        assert stats["organization:Org A"] == 2
+        assert stats["month:2024-03"] == 3
+
+        versions = dict(connection.execute(text("SELECT name, version FROM data_versions")).all())
+        assert versions == {"tenders": 0, "keywords": 0}
+
+        # Accent-insensitive full-text search over the rows stored before
+        matches = connection.execute(text(
+            "SELECT code FROM tenders_fts WHERE tenders_fts MATCH 'adquisicion'"
+        )).scalars().all()
+        assert matches == ["BASE-1"]
+
+    # The ORM maps the upgraded table
+    with Session(baseline_engine) as session:
+        tender = session.get(Tender, "BASE-3")
+        assert tender.name == "Mantención de ascensores"
+        assert tender.content_hash is None
+
+
+def test_migrations_run_again_change_nothing(baseline_engine):
+    run_migrations(baseline_engine)
+    counts = table_counts(baseline_engine)
+
+    assert run_migrations(baseline_engine) == []
+    assert table_counts(baseline_engine) == counts
+    with baseline_engine.connect() as connection:
+        applied = connection.execute(
+            text("SELECT version FROM schema_migrations ORDER BY version")
+        ).scalars().all()
+    assert applied == ALL_VERSIONS
+
+
+def test_failed_migration_is_retried_as_a_whole(baseline_engine, monkeypatch):
+    def fail(connection):
+        connection.execute(text("CREATE INDEX ix_partial ON tenders (name)"))
+        raise RuntimeError("interrupted")
+
+    version, name, _ = MIGRATIONS[-1]
+    monkeypatch.setattr(
+        "src.database.migrations.MIGRATIONS", [*MIGRATIONS[:-1], (version, name, fail)]
+    )
+    with pytest.raises(RuntimeError):
+        run_migrations(baseline_engine)
+    assert "ix_partial" not in {
+        index["name"] for index in inspect(baseline_engine).get_indexes("tenders")
+    }
+
+    monkeypatch.undo()
+    assert run_migrations(baseline_engine) == [version]
+
+
+def test_migrations_apply_to_a_new_database(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'new.db'}")
+    try:
+        Base.metadata.create_all(engine)
+        assert run_migrations(engine) == ALL_VERSIONS
+        assert run_migrations(engine) == []
+        with engine.connect() as connection:
+            assert connection.execute(text("SELECT COUNT(*) FROM tender_stats")).scalar() == 0
+    finally:
+        engine.dispose()
@@ -0,0 +1,122 @@
+import base64
+import uuid
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+
+import src.database.repository  # noqa: F401 - registers every model
+from app.main import app
+from src.database.base import SessionLocal, WriteSessionLocal, init_db
+from src.database.repository import TenderRepository
+from src.models.tender import Tender
+from src.utils.cursor import decode_cursor, encode_cursor
+
+client = TestClient(app)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_db()
+
+
+@pytest.fixture
+def tied_tenders():
+    """Tenders of their own status, five of them created at the same instant"""
+    prefix = uuid.uuid4().hex[:8]
+    status = f"Cursor {prefix}"
+    codes = [f"{prefix}-{index}" for index in range(7)]
+    created_at = {code: datetime(2024, 5, 1, 12, 0, 0) for code in codes[:5]}
+    created_at.update({code: datetime(2024, 5, 2, 8, 30, 0, 250000) for code in codes[5:]})
+
+    with WriteSessionLocal() as session:
+        TenderRepository(session).upsert_many(
+            [Tender(code=code, name=f"Licitación {code}", status=status) for code in codes]
+        )
+        for code, value in created_at.items():
+            session.execute(update(Tender).where(Tender.code == code).values(created_at=value))
+        session.commit()
+
+    expected = sorted(codes, key=lambda code: (created_at[code], code), reverse=True)
+    return status, expected
+
+
+def list_all(status, limit):
+    codes, cursors = [], []
+    cursor = None
+    while True:
+        params = {"status": status, "limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get("/api/tenders", params=params)
+        assert response.status_code == 200, response.text
+        page = response.json()
+        codes.extend(item["code"] for item in page["items"])
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return codes, cursors
+        cursors.append(cursor)
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 5, 7, 100])
+def test_pages_cover_ties_exactly_once(tied_tenders, limit):
+    status, expected = tied_tenders
+    codes, cursors = list_all(status, limit)
+
+    assert codes == expected
+    # The last page ends without a cursor, even when it is full
+    assert len(cursors) == (len(expected) - 1) // limit
+
+
+def test_sync_and_async_pages_agree(tied_tenders):
+    status, expected = tied_tenders
+    codes, cursor = [], None
+    with SessionLocal() as session:
+        repo = TenderRepository(session)
+        while True:
+            tenders, cursor = repo.get_tenders_page(limit=2, cursor=cursor, status=status)
+            codes.extend(tender.code for tender in tenders)
+            if cursor is None:
+                break
+    assert codes == expected
+
+
+def test_cursor_inside_a_tie_resumes_after_its_code(tied_tenders):
+    status, expected = tied_tenders
+    with SessionLocal() as session:
+        last = session.get(Tender, expected[3])
+        cursor = encode_cursor(last.created_at, last.code)
+
+    response = client.get("/api/tenders", params={"status": status, "cursor": cursor})
+    assert [item["code"] for item in response.json()["items"]] == expected[4:]
+
+
+def test_cursor_round_trip():
+    position = (datetime(2024, 5, 2, 8, 30, 0, 250000), "1234-56-LE24")
+    cursor = encode_cursor(*position)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == position
+
+
+def b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+@pytest.mark.parametrize("cursor", [
+    "not a cursor",
+    "%%%",
+    b64(b"not json"),
+    b64(b'{"created_at": "2024-05-01"}'),
+    b64(b'["2024-05-01T12:00:00"]'),
+    b64(b'["yesterday", "1234"]'),
+    b64(b"\xff\xfe"),
+])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+    response = client.get("/api/tenders", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert "Invalid cursor" in response.json()["detail"]
@@ -0,0 +1,93 @@
+import threading
+import time
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+import src.database.repository  # noqa: F401 - registers every model
+from src.database.base import SessionLocal, WriteSessionLocal, init_db
+from src.database.repository import TenderRepository
+from src.database.stats import rebuild_tender_stats
+from src.models.enum import TenderType
+from src.models.tender import Tender
+from src.models.tender_stat import TenderStat
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_db()
+
+
+def make_tender(code: str, organization: str, amount: int, month: int) -> Tender:
+    return Tender(
+        code=code,
+        name=f"Licitación {code}",
+        status="Publicada",
+        organization=organization,
+        buying_unit_region="Región Metropolitana",
+        tender_type=TenderType.LE,
+        estimated_amount=amount,
+        creation_date=datetime(2024, month, 1),
+    )
+
+
+def stored_stats(session: Session):
+    rows = session.execute(select(TenderStat)).scalars()
+    return {
+        (row.dimension, row.key): (row.tender_count, row.estimated_amount) for row in rows
+    }
+
+
+def test_overlapping_upserts_keep_stats_equal_to_rebuild():
+    prefix = uuid.uuid4().hex[:8]
+    codes = [f"{prefix}-{index}" for index in range(20)]
+
+    with SessionLocal() as session:
+        TenderRepository(session).upsert_many(
+            [make_tender(code, f"Org A {prefix}", 100, 1) for code in codes[:10]]
+        )
+
+    first, second = WriteSessionLocal(), WriteSessionLocal()
+    errors, counts = [], {}
+    try:
+        # The first writer reads and writes the batch but does not commit yet
+        counts["first"] = TenderRepository(first).upsert_many(
+            [make_tender(code, f"Org B {prefix}", 200, 2) for code in codes], commit=False
+        )
+
+        def write_second():
+            try:
+                counts["second"] = TenderRepository(second).upsert_many(
+                    [make_tender(code, f"Org C {prefix}", 300, 3) for code in codes]
+                )
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=write_second)
+        thread.start()
+        # Let the second writer reach its reads of the same codes
+        time.sleep(0.5)
+        first.commit()
+        thread.join(timeout=60)
+        assert not thread.is_alive()
+        assert not errors
+    finally:
+        first.close()
+        second.close()
+
+    assert counts["first"] == {"new": 10, "updated": 10, "unchanged": 0}
+    # Every code exists once the first writer committed
+    assert counts["second"] == {"new": 0, "updated": 20, "unchanged": 0}
+
+    with SessionLocal() as session:
+        incremental = stored_stats(session)
+        rebuild_tender_stats(session)
+        rebuilt = stored_stats(session)
+        session.rollback()
+
+    assert incremental == rebuilt
+    assert incremental[("organization", f"Org C {prefix}")] == (20, 6000)
+    assert ("organization", f"Org A {prefix}") not in incremental
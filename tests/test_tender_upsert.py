@@ -0,0 +1,163 @@
+import uuid
+
+import pytest
+from sqlalchemy import select
+
+import src.database.repository  # noqa: F401 - registers every model
+from src.database.base import SessionLocal, WriteSessionLocal, init_db
+from src.database.repository import TenderRepository
+from src.database.versions import TENDERS
+from src.models.data_version import DataVersion
+from src.models.tender import Tender, TenderItem
+
+
+@pytest.fixture(scope="module", autouse=True)
+def database():
+    init_db()
+
+
+@pytest.fixture
+def prefix():
+    return uuid.uuid4().hex[:8]
+
+
+def make_item(correlative, category_code, product_code, supplier=None):
+    item = {
+        "correlative": correlative,
+        "category_code": category_code,
+        "category_name": f"Categoría {category_code}",
+        "product_code": product_code,
+        "product_name": f"Producto {product_code}",
+        "description": "Descripción",
+        "quantity": 2.0,
+        "unit": "Unidad",
+        "tender_status_code": 5,
+    }
+    if supplier:
+        item["award"] = {
+            "supplier_tax_id": supplier,
+            "supplier_name": f"Proveedor {supplier}",
+            "awarded_quantity": 2.0,
+            "unit_price": 1500.0,
+        }
+    return item
+
+
+def make_tender(code, name="Licitación", items=None):
+    return Tender(code=code, name=name, status="Publicada", estimated_amount=1000, items=items)
+
+
+def upsert(tenders):
+    with WriteSessionLocal() as session:
+        return TenderRepository(session).upsert_many(tenders)
+
+
+def stored_items(codes):
+    with SessionLocal() as session:
+        rows = session.execute(
+            select(
+                TenderItem.tender_code, TenderItem.correlative, TenderItem.category_code,
+                TenderItem.product_code, TenderItem.supplier_tax_id, TenderItem.unit_price,
+            ).where(TenderItem.tender_code.in_(codes)).order_by(
+                TenderItem.tender_code, TenderItem.correlative
+            )
+        ).all()
+    return [tuple(row) for row in rows]
+
+
+def tenders_version():
+    with SessionLocal() as session:
+        return session.scalar(select(DataVersion.version).where(DataVersion.name == TENDERS))
+
+
+def test_upsert_counts_new_updated_and_unchanged(prefix):
+    codes = [f"{prefix}-{index}" for index in range(4)]
+
+    assert upsert([make_tender(code) for code in codes]) == {
+        "new": 4, "updated": 0, "unchanged": 0
+    }
+
+    version = tenders_version()
+    assert upsert([make_tender(code) for code in codes]) == {
+        "new": 0, "updated": 0, "unchanged": 4
+    }
+    # Nothing was written, so readers keep their cached copies
+    assert tenders_version() == version
+
+    changed = [make_tender(codes[0], name="Nombre nuevo")]
+    changed += [make_tender(code) for code in codes[1:]]
+    changed.append(make_tender(f"{prefix}-new"))
+    assert upsert(changed) == {"new": 1, "updated": 1, "unchanged": 3}
+    assert tenders_version() == version + 1
+
+    with SessionLocal() as session:
+        assert session.get(Tender, codes[0]).name == "Nombre nuevo"
+
+
+def test_repeated_codes_in_a_batch_count_once_and_last_wins(prefix):
+    code = f"{prefix}-0"
+    counts = upsert([make_tender(code, name="Primero"), make_tender(code, name="Último")])
+
+    assert counts == {"new": 1, "updated": 0, "unchanged": 0}
+    with SessionLocal() as session:
+        assert session.get(Tender, code).name == "Último"
+
+
+def test_tenders_saved_one_by_one_count_as_unchanged(prefix):
+    created, updated = f"{prefix}-created", f"{prefix}-updated"
+    with WriteSessionLocal() as session:
+        repo = TenderRepository(session)
+        repo.create_tender(make_tender(created))
+        repo.create_tender(make_tender(updated))
+        repo.update_tender(make_tender(updated, name="Cambiado"))
+
+    assert upsert([make_tender(created), make_tender(updated, name="Cambiado")]) == {
+        "new": 0, "updated": 0, "unchanged": 2
+    }
+
+
+def test_item_rows_follow_the_items_json(prefix):
+    first, second = f"{prefix}-0", f"{prefix}-1"
+    upsert([
+        make_tender(first, items=[
+            make_item(1, f"C{prefix}", f"P{prefix}", supplier="76.000.000-1"),
+            make_item(2, f"C{prefix}", "43211507"),
+        ]),
+        make_tender(second, items=[make_item(1, "50000000", f"P{prefix}")]),
+    ])
+
+    assert stored_items([first, second]) == [
+        (first, "1", f"C{prefix}", f"P{prefix}", "76.000.000-1", 1500.0),
+        (first, "2", f"C{prefix}", "43211507", None, None),
+        (second, "1", "50000000", f"P{prefix}", None, None),
+    ]
+    with SessionLocal() as session:
+        repo = TenderRepository(session)
+        assert [t.code for t in repo.get_tenders_by_category(f"C{prefix}")] == [first]
+        assert sorted(t.code for t in repo.get_tenders_by_product(f"P{prefix}")) == [first, second]
+
+    # A changed tender gets its rows rewritten, not appended
+    upsert([
+        make_tender(first, items=[make_item(3, "60000000", "60000001")]),
+        make_tender(second, items=[]),
+    ])
+    assert stored_items([first, second]) == [(first, "3", "60000000", "60000001", None, None)]
+
+
+def test_unchanged_tenders_keep_their_item_rows(prefix):
+    code = f"{prefix}-0"
+    items = [make_item(1, "43211500", "43211503", supplier="76.000.000-1")]
+    upsert([make_tender(code, items=items)])
+    before = stored_items([code])
+
+    assert upsert([make_tender(code, items=items)])["unchanged"] == 1
+    assert stored_items([code]) == before
+
+
+def test_rows_from_items_skips_invalid_entries():
+    rows = TenderItem.rows_from_items("X", [make_item(1, 43211500, 43211503), "x", None])
+
+    assert len(rows) == 1
+    assert rows[0]["category_code"] == "43211500"
+    assert rows[0]["product_code"] == "43211503"
+    assert TenderItem.rows_from_items("X", None) == []